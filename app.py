@@ -1,16 +1,37 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
+import functools
+import os
 import warnings
-import base64
-from PIL import Image
-import requests
-from io import BytesIO
-from scipy import stats
+import f1_engine
+import figure_cache
+from f1_engine import (bootstrap_intervals, build_driver_index, build_season_database, consistency,
+                       dataset_fingerprint, dnf_counts, dnf_rates, driver_detail_table, driver_season_stats,
+                       driver_standings, error_bars, fastest_lap_deficit, fastest_lap_trend, finish_given_grid,
+                       finish_rates, finish_run, gap_to_winner, load_seasons, names_in_seasons, podium_finishes,
+                       profiled, race_wins, retirement_breakdown, round_offsets, season_championships,
+                       season_grid_finish, season_list, season_offsets, season_summary, season_track_points,
+                       select_season, simulate_championship, span, start_run, stats_for_season, team_season_stats,
+                       team_standings, track_competitiveness, track_points)
+from figure_cache import FigureCache
+from result_cache import ResultCache, source_fingerprint
+from video_serving import video_source
 warnings.filterwarnings('ignore')
 
+# Copy-on-write keeps pages from changing the shared dataset (always on from pandas 3)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# Pages that never touch the race data - no loading or plotting imports for these
+STATIC_PAGES = ("📚 F1 Basics Guide", "🎥 Video Gallery")
+
+# F1_SQL_BACKEND=1 computes the season tables and points per track in the SQLite season database instead of pandas
+SQL_BACKEND = os.environ.get("F1_SQL_BACKEND") == "1"
+
+# Spans recorded while the sidebar Performance toggle is on are appended here
+PROFILE_LOG = os.environ.get("F1_PROFILE_LOG", "profile_log.jsonl")
+
 # Page configuration
 st.set_page_config(
     page_title="🏎️ Formula 1 Data Analysis Dashboard",
@@ -19,36 +40,152 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-@st.cache_data
-def load_and_clean_data():
-    """Load and clean F1 data with caching for better performance"""
+@st.cache_resource
+def load_shared_data():
+    """Load and clean F1 data once per server process, shared by every session without copying"""
     try:
-        # Load datasets
-        season_2024 = pd.read_csv('Formula1_2024season_raceResults.csv')
-        season_2025 = pd.read_csv('Formula1_2025Season_RaceResults.csv')
-        
-        # Add season columns
-        season_2024['Season'] = 2024
-        season_2025['Season'] = 2025
-        
-        # Clean data function
-        def clean_race_data(df):
-            df_clean = df.copy()
-            df_clean['Position_Original'] = df_clean['Position']
-            df_clean['Position'] = pd.to_numeric(df_clean['Position'], errors='coerce')
-            df_clean['Points'] = pd.to_numeric(df_clean['Points'], errors='coerce').fillna(0)
-            if 'Starting Grid' in df_clean.columns:
-                df_clean['Starting Grid'] = pd.to_numeric(df_clean['Starting Grid'], errors='coerce')
-            return df_clean
-        
-        season_2024 = clean_race_data(season_2024)
-        season_2025 = clean_race_data(season_2025)
-        
-        return season_2024, season_2025
+        # Every season file in the working directory, combined into one frame keyed by Season
+        return load_seasons()
         
     except FileNotFoundError:
         st.error("CSV files not found. Please upload your Formula 1 data files.")
+        return None
+
+@profiled
+def load_and_clean_data():
+    """This rerun's view of the shared data
+    
+    A shallow copy: it shares the loaded column buffers, and copy-on-write
+    means anything a page assigns or changes in it copies just that column,
+    never touching the frame other sessions see.
+    """
+    data = load_shared_data()
+    return data.copy(deep=False) if data is not None else None
+
+@profiled
+@st.cache_data
+def load_fingerprint():
+    """Content hash of the loaded seasons, part of every figure and result cache key"""
+    data = load_and_clean_data()
+    return dataset_fingerprint(data) if data is not None else None
+
+@st.cache_resource
+def get_result_cache():
+    """Results on disk shared by every dashboard process on this machine"""
+    return ResultCache()
+
+@st.cache_resource
+def code_version():
+    """Hash of the dashboard and engine source, part of every disk cache key"""
+    return source_fingerprint([os.path.abspath(__file__), figure_cache.__file__,
+                               os.path.dirname(f1_engine.__file__)])
+
+def persisted(func):
+    """Serve func's results from the shared disk cache, keyed by code, dataset, function and arguments
+    
+    Goes under @st.cache_data: the in-process cache answers first, and a
+    freshly started worker picks up what other workers already computed.
+    Anything that changes a result must be an argument or part of the code.
+    """
+    @functools.wraps(func)
+    def wrapper(*args):
+        key = ('result', code_version(), load_fingerprint(), func.__qualname__, args)
+        return get_result_cache().get_or_compute(key, lambda: func(*args))
+    return wrapper
+
+@profiled
+@st.cache_resource
+def load_season_database():
+    """SQLite copy of the seasons for F1_SQL_BACKEND=1, ingested once per process"""
+    return build_season_database()
+
+@profiled
+@st.cache_data
+@persisted
+def load_season_stats(sql_backend):
+    """Per-season driver and team results tables, built once from the loaded data
+    
+    The backend is an argument so the pandas and SQLite tables, whose dtypes
+    differ, are cached apart.
+    """
+    data = load_and_clean_data()
+    if data is None:
         return None, None
+    if sql_backend:
+        database = load_season_database()
+        return database.season_stats('Driver'), database.season_stats('Team')
+    return driver_season_stats(data), team_season_stats(data)
+
+@profiled
+@st.cache_resource
+def load_driver_index():
+    """Each driver's row numbers in every season, built once per process and shared like the data"""
+    data = load_shared_data()
+    return build_driver_index(data) if data is not None else {}
+
+@profiled
+@st.cache_resource
+def load_round_offsets():
+    """(Season, Round) -> row range of every race, built once per process and shared like the data"""
+    data = load_shared_data()
+    return round_offsets(data) if data is not None else None
+
+def season_rounds(season):
+    """Round row ranges of one season, indexing its select_season rows"""
+    return season_offsets(load_round_offsets(), season)
+
+@profiled
+@st.cache_data
+@persisted
+def load_championships():
+    """Round-by-round driver championship for every season"""
+    data = load_and_clean_data()
+    return season_championships(data) if data is not None else {}
+
+@profiled
+@st.cache_data
+@persisted
+def load_track_points():
+    """Sparse driver x track points matrix for every season"""
+    data = load_and_clean_data()
+    return season_track_points(data) if data is not None else {}
+
+@profiled
+@st.cache_data
+@persisted
+def load_grid_finish():
+    """Starting grid x finishing position counts for every season"""
+    data = load_and_clean_data()
+    return season_grid_finish(data) if data is not None else {}
+
+@profiled
+@st.cache_data
+@persisted
+def run_bootstrap(season):
+    """Bootstrap intervals for every driver's average position and spread in a season"""
+    data = load_and_clean_data()
+    return bootstrap_intervals(select_season(data, season))
+
+@profiled
+@st.cache_data(show_spinner="Simulating seasons...")
+@persisted
+def run_title_simulation(season, remaining_rounds, n_seasons, seed):
+    """Title odds for a season, simulated once per parameter set"""
+    data = load_and_clean_data()
+    return simulate_championship(select_season(data, season), remaining_rounds, n_seasons, seed,
+                                 driver_index=load_driver_index(), offsets=season_rounds(season))
+
+@st.cache_resource
+def get_figure_cache():
+    """Rendered charts shared by every session and rerun, backed by the shared disk cache"""
+    return FigureCache(store=get_result_cache())
+
+def show_figure(chart_id, params, draw):
+    """Display a chart from the figure cache, drawing it only on a cache miss"""
+    with span(f"figure {chart_id}"):
+        image = get_figure_cache().get_or_render((chart_id, code_version(), load_fingerprint(), params), draw)
+        with span("st.image"):
+            st.image(image)
 
 def add_bg_video():
     """Add background styling and effects"""
@@ -230,12 +367,20 @@ def get_enhanced_driver_images():
     }
     return driver_images
 
+@st.cache_resource
+def get_image_cache():
+    """Driver photos cached on disk, downloaded in the background on first use"""
+    from image_cache import ImageCache
+    
+    image_cache = ImageCache()
+    image_cache.prefetch(info['image'] for info in get_enhanced_driver_images().values())
+    return image_cache
+
 def add_local_video(video_path, title, caption):
     """Add local video with custom styling"""
     try:
-        # Read video file
-        with open(video_path, 'rb') as video_file:
-            video_bytes = video_file.read()
+        # Stream from static/ when possible, otherwise one shared in-memory copy
+        video_url, video_bytes, mimetype = video_source(video_path, st.get_option('server.enableStaticServing'))
         
         # Create styled container
         st.markdown(f"""
@@ -245,8 +390,14 @@ def add_local_video(video_path, title, caption):
         </div>
         """, unsafe_allow_html=True)
         
-        # Display video using Streamlit's native function
-        st.video(video_bytes)
+        if video_url:
+            # Browser fetches the file itself with range requests
+            st.markdown(f"""
+            <video controls preload="metadata" src="{video_url}" style="width: 100%; border-radius: 10px;"></video>
+            """, unsafe_allow_html=True)
+        else:
+            # Display video using Streamlit's native function
+            st.video(video_bytes, format=mimetype)
         
         # Add caption
         st.markdown(f"""
@@ -608,12 +759,13 @@ def show_f1_videos():
 
 # DRIVER PROFILE FUNCTIONS
 
-def show_enhanced_driver_profiles(season_data, season_year):
+@profiled
+def show_enhanced_driver_profiles(driver_stats, season_year):
     """Enhanced driver profiles with detailed information"""
     st.subheader(f"🏆 Driver Profiles - {season_year} Season")
     
     # Get top 10 drivers
-    top_drivers = season_data.groupby('Driver')['Points'].sum().sort_values(ascending=False).head(10)
+    top_drivers = driver_standings(driver_stats)['Points'].head(10)
     enhanced_driver_images = get_enhanced_driver_images()
     
     # Display in rows of 5
@@ -634,20 +786,13 @@ def show_enhanced_driver_profiles(season_data, season_year):
                 </div>
                 """, unsafe_allow_html=True)
                 
-                # Driver image
-                if driver_info.get('image'):
-                    try:
-                        st.image(driver_info['image'], width=120, use_column_width=False)
-                    except:
-                        st.image("https://via.placeholder.com/120x120?text=F1", width=120)
-                else:
-                    st.image("https://via.placeholder.com/120x120?text=F1", width=120)
+                # Driver image - local downscaled copy, or the bundled placeholder
+                st.image(get_image_cache().get(driver_info.get('image')), width=120)
                 
                 # Driver stats and info
-                driver_data = season_data[season_data['Driver'] == driver]
-                wins = len(driver_data[driver_data['Position'] == 1])
-                podiums = len(driver_data[driver_data['Position'] <= 3])
-                avg_pos = driver_data['Position'].mean()
+                wins = driver_stats.at[driver, 'Wins']
+                podiums = driver_stats.at[driver, 'Podiums']
+                avg_pos = driver_stats.at[driver, 'Average Position']
                 
                 st.markdown(f"""
                     <div style="background: rgba(255,255,255,0.15); border-radius: 15px; 
@@ -676,7 +821,19 @@ def show_enhanced_driver_profiles(season_data, season_year):
 
 # MAIN DASHBOARD FUNCTIONS
 
-def show_enhanced_overview(season_2024, season_2025):
+def season_columns(seasons, per_row=2):
+    """Yield (index, season, column) with one column per season, wrapping every per_row seasons"""
+    for start in range(0, len(seasons), per_row):
+        cols = st.columns(per_row)
+        for offset, (col, season) in enumerate(zip(cols, seasons[start:start + per_row])):
+            yield start + offset, season, col
+
+def pick(palette, index):
+    """Cycle through a chart's per-season colours"""
+    return palette[index % len(palette)]
+
+@profiled
+def show_enhanced_overview(data, driver_stats, team_stats, seasons):
     """Enhanced overview with videos and driver images"""
     add_bg_video()
     
@@ -698,56 +855,31 @@ def show_enhanced_overview(season_2024, season_2025):
     </div>
     """, unsafe_allow_html=True)
     
-    # Key metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="metric-container">
-            <h2 style="margin: 0; font-size: 2rem;">{len(season_2024['Track'].unique())}</h2>
-            <p style="margin: 5px 0;">2024 Races</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class="metric-container">
-            <h2 style="margin: 0; font-size: 2rem;">{len(season_2025['Track'].unique())}</h2>
-            <p style="margin: 5px 0;">2025 Races</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # Key metrics - races per season, then totals across the selected seasons
+    metrics = [(season_rounds(season)['Track'].nunique(), f"{season} Races") for season in seasons]
+    metrics.append((len(names_in_seasons(driver_stats, seasons)), "Total Drivers"))
+    metrics.append((len(names_in_seasons(team_stats, seasons)), "Total Teams"))
     
-    with col3:
-        st.markdown(f"""
-        <div class="metric-container">
-            <h2 style="margin: 0; font-size: 2rem;">{len(pd.concat([season_2024, season_2025])['Driver'].unique())}</h2>
-            <p style="margin: 5px 0;">Total Drivers</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
-        <div class="metric-container">
-            <h2 style="margin: 0; font-size: 2rem;">{len(pd.concat([season_2024, season_2025])['Team'].unique())}</h2>
-            <p style="margin: 5px 0;">Total Teams</p>
-        </div>
-        """, unsafe_allow_html=True)
+    for col, (value, label) in zip(st.columns(len(metrics)), metrics):
+        with col:
+            st.markdown(f"""
+            <div class="metric-container">
+                <h2 style="margin: 0; font-size: 2rem;">{value}</h2>
+                <p style="margin: 5px 0;">{label}</p>
+            </div>
+            """, unsafe_allow_html=True)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Championship leaders section
     st.header("🏆 Championship Leaders")
-    col1, col2 = st.columns(2)
+    latest_season = season_list(data)[-1]
     
-    with col1:
-        leader_2024 = season_2024.groupby('Driver')['Points'].sum().idxmax()
-        points_2024 = season_2024.groupby('Driver')['Points'].sum().max()
-        st.success(f"**2024 Champion:** {leader_2024} ({points_2024:.0f} points)")
-    
-    with col2:
-        leader_2025 = season_2025.groupby('Driver')['Points'].sum().idxmax()
-        points_2025 = season_2025.groupby('Driver')['Points'].sum().max()
-        st.success(f"**2025 Leader:** {leader_2025} ({points_2025:.0f} points)")
+    for i, season, col in season_columns(seasons):
+        with col:
+            season_points = stats_for_season(driver_stats, season)['Points']
+            title = "Leader" if season == latest_season else "Champion"
+            st.success(f"**{season} {title}:** {season_points.idxmax()} ({season_points.max():.0f} points)")
     
     # Featured video section with local video
     st.header("🎥 Featured Video Highlight")
@@ -755,20 +887,21 @@ def show_enhanced_overview(season_2024, season_2025):
                     "Your personal F1 highlights - witness the excitement of the 2025 season!")
     
     # Enhanced driver profiles
-    col1, col2 = st.columns(2)
-    with col1:
-        show_enhanced_driver_profiles(season_2024, 2024)
-    with col2:
-        show_enhanced_driver_profiles(season_2025, 2025)
+    for i, season, col in season_columns(seasons):
+        with col:
+            show_enhanced_driver_profiles(stats_for_season(driver_stats, season), season)
 
-def show_driver_analysis(season_2024, season_2025):
+@profiled
+def show_driver_analysis(data, driver_stats, seasons):
     """Driver performance analysis page"""
+    import matplotlib.pyplot as plt
+    
     add_bg_video()
     st.header("🏁 Driver Performance Analysis")
     
     # Driver selector
-    all_drivers = pd.concat([season_2024, season_2025])['Driver'].unique()
-    selected_drivers = st.multiselect("Select drivers to analyze:", all_drivers, default=list(all_drivers[:5]))
+    all_drivers = names_in_seasons(driver_stats, seasons)
+    selected_drivers = st.multiselect("Select drivers to analyze:", all_drivers, default=all_drivers[:5])
     
     if not selected_drivers:
         st.warning("Please select at least one driver")
@@ -776,417 +909,517 @@ def show_driver_analysis(season_2024, season_2025):
     
     # Points comparison
     st.subheader("📊 Points Comparison")
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.write("**2024 Season**")
-        driver_points_2024 = season_2024[season_2024['Driver'].isin(selected_drivers)].groupby('Driver')['Points'].sum().sort_values(ascending=False)
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
-        bars = ax.barh(range(len(driver_points_2024)), driver_points_2024.values, 
-                       color=plt.cm.Set3(np.linspace(0, 1, len(driver_points_2024))))
-        ax.set_yticks(range(len(driver_points_2024)))
-        ax.set_yticklabels(driver_points_2024.index)
-        ax.set_title('Driver Points - 2024 Season', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Total Points')
-        
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            ax.text(width + 5, bar.get_y() + bar.get_height()/2, 
-                   f'{int(width)}', ha='left', va='center', fontweight='bold')
-        
-        plt.tight_layout()
-        st.pyplot(fig)
-        plt.close()
     
-    with col2:
-        st.write("**2025 Season**")
-        driver_points_2025 = season_2025[season_2025['Driver'].isin(selected_drivers)].groupby('Driver')['Points'].sum().sort_values(ascending=False)
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
-        bars = ax.barh(range(len(driver_points_2025)), driver_points_2025.values, 
-                       color=plt.cm.Set1(np.linspace(0, 1, len(driver_points_2025))))
-        ax.set_yticks(range(len(driver_points_2025)))
-        ax.set_yticklabels(driver_points_2025.index)
-        ax.set_title('Driver Points - 2025 Season', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Total Points')
-        
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            ax.text(width + 5, bar.get_y() + bar.get_height()/2, 
-                   f'{int(width)}', ha='left', va='center', fontweight='bold')
-        
-        plt.tight_layout()
-        st.pyplot(fig)
-        plt.close()
+    for i, season, col in season_columns(seasons):
+        with col:
+            st.write(f"**{season} Season**")
+            
+            def draw():
+                standings = driver_standings(stats_for_season(driver_stats, season))
+                driver_points = standings.loc[standings.index.isin(selected_drivers), 'Points']
+                
+                fig, ax = plt.subplots(figsize=(10, 6))
+                cmap = pick([plt.cm.Set3, plt.cm.Set1], i)
+                bars = ax.barh(range(len(driver_points)), driver_points.values,
+                               color=cmap(np.linspace(0, 1, len(driver_points))))
+                ax.set_yticks(range(len(driver_points)))
+                ax.set_yticklabels(driver_points.index)
+                ax.set_title(f'Driver Points - {season} Season', fontsize=14, fontweight='bold')
+                ax.set_xlabel('Total Points')
+                
+                for bar in bars:
+                    width = bar.get_width()
+                    ax.text(width + 5, bar.get_y() + bar.get_height()/2,
+                           f'{int(width)}', ha='left', va='center', fontweight='bold')
+                
+                plt.tight_layout()
+                return fig
+            
+            show_figure('driver_points', (season, i, tuple(selected_drivers)), draw)
     
     # Race wins comparison
     st.subheader("🏆 Race Wins Comparison")
-    col1, col2 = st.columns(2)
     
-    with col1:
-        wins_2024 = season_2024[season_2024['Position'] == 1]['Driver'].value_counts()
-        selected_wins_2024 = wins_2024[wins_2024.index.isin(selected_drivers)]
-        
-        if not selected_wins_2024.empty:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.bar(range(len(selected_wins_2024)), selected_wins_2024.values, color='gold', alpha=0.8)
-            ax.set_xticks(range(len(selected_wins_2024)))
-            ax.set_xticklabels(selected_wins_2024.index, rotation=45)
-            ax.set_title('Race Wins - 2024 Season')
-            ax.set_ylabel('Number of Wins')
-            st.pyplot(fig)
-            plt.close()
-    
-    with col2:
-        wins_2025 = season_2025[season_2025['Position'] == 1]['Driver'].value_counts()
-        selected_wins_2025 = wins_2025[wins_2025.index.isin(selected_drivers)]
-        
-        if not selected_wins_2025.empty:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.bar(range(len(selected_wins_2025)), selected_wins_2025.values, color='orange', alpha=0.8)
-            ax.set_xticks(range(len(selected_wins_2025)))
-            ax.set_xticklabels(selected_wins_2025.index, rotation=45)
-            ax.set_title('Race Wins - 2025 Season')
-            ax.set_ylabel('Number of Wins')
-            st.pyplot(fig)
-            plt.close()
+    for i, season, col in season_columns(seasons):
+        with col:
+            wins = race_wins(stats_for_season(driver_stats, season))
+            selected_wins = wins[wins.index.isin(selected_drivers)]
+            
+            if not selected_wins.empty:
+                def draw():
+                    fig, ax = plt.subplots(figsize=(10, 6))
+                    ax.bar(range(len(selected_wins)), selected_wins.values, color=pick(['gold', 'orange'], i), alpha=0.8)
+                    ax.set_xticks(range(len(selected_wins)))
+                    ax.set_xticklabels(selected_wins.index, rotation=45)
+                    ax.set_title(f'Race Wins - {season} Season')
+                    ax.set_ylabel('Number of Wins')
+                    return fig
+                
+                show_figure('driver_wins', (season, i, tuple(selected_drivers)), draw)
     
     # Detailed statistics table
     st.subheader("📊 Detailed Driver Statistics")
-    stats_data = []
-    for driver in selected_drivers:
-        for season, data in [("2024", season_2024), ("2025", season_2025)]:
-            driver_data = data[data['Driver'] == driver]
-            if not driver_data.empty:
-                stats_data.append({
-                    'Driver': driver,
-                    'Season': season,
-                    'Total Points': driver_data['Points'].sum(),
-                    'Average Position': round(driver_data['Position'].mean(), 2),
-                    'Wins': len(driver_data[driver_data['Position'] == 1]),
-                    'Podiums': len(driver_data[driver_data['Position'] <= 3]),
-                    'DNFs': len(driver_data[driver_data['Time/Retired'] == 'DNF']),
-                    'Races': len(driver_data)
-                })
-    
-    if stats_data:
-        stats_df = pd.DataFrame(stats_data)
+    stats_df = driver_detail_table(driver_stats, selected_drivers, seasons)
+    
+    if not stats_df.empty:
         st.dataframe(stats_df, use_container_width=True)
 
-def show_team_analysis(season_2024, season_2025):
+@profiled
+def show_team_analysis(team_stats, seasons):
     """Team performance analysis"""
+    import matplotlib.pyplot as plt
+    
     add_bg_video()
     st.header("🏭 Team Performance Analysis")
     
     # Team points distribution
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("Team Points Distribution - 2024")
-        team_points_2024 = season_2024.groupby('Team')['Points'].sum().sort_values(ascending=False)
-        
-        fig, ax = plt.subplots(figsize=(12, 8))
-        colors = plt.cm.Set3(np.linspace(0, 1, len(team_points_2024)))
-        wedges, texts, autotexts = ax.pie(team_points_2024.values, labels=team_points_2024.index, 
-                                         autopct='%1.1f%%', startangle=90, colors=colors)
-        ax.set_title('Team Points Distribution - 2024', fontsize=16, fontweight='bold')
-        st.pyplot(fig)
-        plt.close()
-    
-    with col2:
-        st.subheader("Team Points Distribution - 2025")
-        team_points_2025 = season_2025.groupby('Team')['Points'].sum().sort_values(ascending=False)
-        
-        fig, ax = plt.subplots(figsize=(12, 8))
-        colors = plt.cm.Set1(np.linspace(0, 1, len(team_points_2025)))
-        wedges, texts, autotexts = ax.pie(team_points_2025.values, labels=team_points_2025.index, 
-                                         autopct='%1.1f%%', startangle=90, colors=colors)
-        ax.set_title('Team Points Distribution - 2025', fontsize=16, fontweight='bold')
-        st.pyplot(fig)
-        plt.close()
+    for i, season, col in season_columns(seasons):
+        with col:
+            st.subheader(f"Team Points Distribution - {season}")
+            
+            def draw():
+                team_points = team_standings(stats_for_season(team_stats, season))['Points']
+                
+                fig, ax = plt.subplots(figsize=(12, 8))
+                colors = pick([plt.cm.Set3, plt.cm.Set1], i)(np.linspace(0, 1, len(team_points)))
+                wedges, texts, autotexts = ax.pie(team_points.values, labels=team_points.index,
+                                                 autopct='%1.1f%%', startangle=90, colors=colors)
+                ax.set_title(f'Team Points Distribution - {season}', fontsize=16, fontweight='bold')
+                return fig
+            
+            show_figure('team_points', (season, i), draw)
     
     # Podium comparison
     st.subheader("🏆 Podium Finishes by Team")
-    col1, col2 = st.columns(2)
     
-    with col1:
-        podiums_2024 = season_2024[season_2024['Position'] <= 3]['Team'].value_counts()
-        if not podiums_2024.empty:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.bar(podiums_2024.index, podiums_2024.values, color='mediumseagreen', alpha=0.8)
-            ax.set_title('Podium Finishes by Team - 2024')
-            ax.set_ylabel('Number of Podiums')
-            plt.xticks(rotation=45)
-            st.pyplot(fig)
-            plt.close()
-    
-    with col2:
-        podiums_2025 = season_2025[season_2025['Position'] <= 3]['Team'].value_counts()
-        if not podiums_2025.empty:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.bar(podiums_2025.index, podiums_2025.values, color='darkorange', alpha=0.8)
-            ax.set_title('Podium Finishes by Team - 2025')
-            ax.set_ylabel('Number of Podiums')
-            plt.xticks(rotation=45)
-            st.pyplot(fig)
-            plt.close()
+    for i, season, col in season_columns(seasons):
+        with col:
+            podiums = podium_finishes(stats_for_season(team_stats, season))
+            if not podiums.empty:
+                def draw():
+                    fig, ax = plt.subplots(figsize=(10, 6))
+                    ax.bar(podiums.index, podiums.values, color=pick(['mediumseagreen', 'darkorange'], i), alpha=0.8)
+                    ax.set_title(f'Podium Finishes by Team - {season}')
+                    ax.set_ylabel('Number of Podiums')
+                    plt.xticks(rotation=45)
+                    return fig
+                
+                show_figure('team_podiums', (season, i), draw)
 
-def show_race_analysis(season_2024, season_2025):
+@profiled
+def show_race_analysis(data, driver_stats, seasons):
     """Race analysis with track performance"""
+    import matplotlib.pyplot as plt
+    
     add_bg_video()
     st.header("🏁 Race Analysis")
     
     # Track performance analysis
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("Points Distribution by Track - 2024")
-        track_points_2024 = season_2024.groupby('Track')['Points'].sum()
-        
-        fig, ax = plt.subplots(figsize=(12, 8))
-        ax.plot(range(len(track_points_2024)), track_points_2024.values, 'o-', 
-                color='blue', linewidth=3, markersize=8)
-        ax.set_title('Points Distribution by Track - 2024')
-        ax.set_xlabel('Race Number')
-        ax.set_ylabel('Total Points Awarded')
-        ax.grid(True, alpha=0.3)
-        st.pyplot(fig)
-        plt.close()
-    
-    with col2:
-        st.subheader("Points Distribution by Track - 2025")
-        track_points_2025 = season_2025.groupby('Track')['Points'].sum()
-        
-        fig, ax = plt.subplots(figsize=(12, 8))
-        ax.plot(range(len(track_points_2025)), track_points_2025.values, 'o-', 
-                color='red', linewidth=3, markersize=8)
-        ax.set_title('Points Distribution by Track - 2025')
-        ax.set_xlabel('Race Number')
-        ax.set_ylabel('Total Points Awarded')
-        ax.grid(True, alpha=0.3)
-        st.pyplot(fig)
-        plt.close()
+    for i, season, col in season_columns(seasons):
+        with col:
+            st.subheader(f"Points Distribution by Track - {season}")
+            
+            def draw():
+                if SQL_BACKEND:
+                    points_by_track = load_season_database().track_points(season)
+                else:
+                    points_by_track = track_points(select_season(data, season), season_rounds(season))
+                
+                fig, ax = plt.subplots(figsize=(12, 8))
+                ax.plot(range(1, len(points_by_track) + 1), points_by_track.values, 'o-',
+                        color=pick(['blue', 'red'], i), linewidth=3, markersize=8)
+                ax.set_title(f'Points Distribution by Track - {season}')
+                ax.set_xlabel('Race Number')
+                ax.set_ylabel('Total Points Awarded')
+                ax.grid(True, alpha=0.3)
+                return fig
+            
+            show_figure('track_points', (season, i), draw)
+    
+    # Championship progression
+    st.subheader("🏆 Championship Battle - Points After Each Round")
+    championships = load_championships()
+    
+    for i, season, col in season_columns(seasons):
+        with col:
+            championship = championships[season]
+            round_number = championship.rounds
+            if championship.rounds > 1:
+                round_number = st.slider(f"Standings after round ({season}):", 1, championship.rounds,
+                                         championship.rounds, key=f"standings_round_{season}")
+            standings = championship.standings(round_number)
+            leaders = standings.index[:5]
+            
+            def draw():
+                progression = championship.history(championship.cumulative_points, leaders)
+                
+                fig, ax = plt.subplots(figsize=(12, 8))
+                for driver in leaders:
+                    ax.plot(range(1, championship.rounds + 1), progression[driver].values, 'o-',
+                            linewidth=2, markersize=5, label=driver)
+                ax.axvline(round_number, color='grey', linestyle='--', alpha=0.6)
+                ax.set_title(f'Championship Progression - {season}')
+                ax.set_xlabel('Round')
+                ax.set_ylabel('Cumulative Points')
+                ax.legend()
+                ax.grid(True, alpha=0.3)
+                return fig
+            
+            show_figure('championship_progression', (season, round_number), draw)
+            
+            table = standings.head(10).to_frame()
+            table['Gap to Leader'] = standings.iloc[0] - table['Points']
+            st.dataframe(table, use_container_width=True)
     
     # DNF Analysis
     st.subheader("🔧 Reliability Analysis - DNF Count")
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        dnf_2024 = season_2024[season_2024['Time/Retired'] == 'DNF']['Driver'].value_counts()
-        if not dnf_2024.empty:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.bar(dnf_2024.index[:10], dnf_2024.values[:10], color='crimson', alpha=0.7)
-            ax.set_title('DNF Count by Driver - 2024')
-            ax.set_ylabel('Number of DNFs')
-            plt.xticks(rotation=45)
-            st.pyplot(fig)
-            plt.close()
     
-    with col2:
-        dnf_2025 = season_2025[season_2025['Time/Retired'] == 'DNF']['Driver'].value_counts()
-        if not dnf_2025.empty:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.bar(dnf_2025.index[:10], dnf_2025.values[:10], color='darkred', alpha=0.7)
-            ax.set_title('DNF Count by Driver - 2025')
-            ax.set_ylabel('Number of DNFs')
-            plt.xticks(rotation=45)
-            st.pyplot(fig)
-            plt.close()
+    for i, season, col in season_columns(seasons):
+        with col:
+            dnf = dnf_counts(stats_for_season(driver_stats, season))
+            if not dnf.empty:
+                def draw():
+                    fig, ax = plt.subplots(figsize=(10, 6))
+                    ax.bar(dnf.index[:10], dnf.values[:10], color=pick(['crimson', 'darkred'], i), alpha=0.7)
+                    ax.set_title(f'DNF Count by Driver - {season}')
+                    ax.set_ylabel('Number of DNFs')
+                    plt.xticks(rotation=45)
+                    return fig
+                
+                show_figure('driver_dnfs', (season, i), draw)
+    
+    st.subheader("🛠️ Non-Finishes by Team and Cause")
+    
+    for i, season, col in season_columns(seasons):
+        with col:
+            season_data = select_season(data, season)
+            breakdown = retirement_breakdown(season_data, 'Team')
+            if not breakdown.empty:
+                def draw():
+                    fig, ax = plt.subplots(figsize=(10, 6))
+                    left = np.zeros(len(breakdown))
+                    for status, color in zip(breakdown.columns, ['crimson', 'grey', 'black', 'orange']):
+                        ax.barh(breakdown.index, breakdown[status].values, left=left, color=color, label=status)
+                        left += breakdown[status].values
+                    ax.invert_yaxis()
+                    ax.set_title(f'Non-Finishes by Team - {season}')
+                    ax.set_xlabel('Entries')
+                    ax.legend()
+                    return fig
+                
+                show_figure('team_non_finishes', (season, i), draw)
+            
+            rates = finish_rates(season_data, 'Team').round(1).rename('Finish Rate (%)')
+            st.dataframe(rates, use_container_width=True)
 
-def show_track_analysis(season_2024, season_2025):
+@profiled
+def show_track_analysis(data, seasons):
     """Track performance analysis"""
+    import matplotlib.pyplot as plt
+    
     add_bg_video()
     st.header("🏁 Track Performance Analysis")
     
     # Track characteristics
     st.subheader("🏎️ Track Characteristics Analysis")
+    season = st.selectbox("Season:", seasons)
+    season_data = select_season(data, season)
     
     col1, col2 = st.columns(2)
     
     with col1:
-        st.write("**Track Competitiveness - 2024**")
-        track_spread_2024 = season_2024.groupby('Track')['Position'].std().sort_values(ascending=False)
+        st.write(f"**Track Competitiveness - {season}**")
+        
+        def draw():
+            track_spread = track_competitiveness(season_data)
+            
+            fig, ax = plt.subplots(figsize=(12, 8))
+            ax.bar(range(len(track_spread)), track_spread.values, color='skyblue', alpha=0.8)
+            ax.set_xticks(range(len(track_spread)))
+            ax.set_xticklabels(track_spread.index, rotation=45)
+            ax.set_title('Track Competitiveness (Higher = More Unpredictable)')
+            ax.set_ylabel('Position Standard Deviation')
+            return fig
         
-        fig, ax = plt.subplots(figsize=(12, 8))
-        ax.bar(range(len(track_spread_2024)), track_spread_2024.values, color='skyblue', alpha=0.8)
-        ax.set_xticks(range(len(track_spread_2024)))
-        ax.set_xticklabels(track_spread_2024.index, rotation=45)
-        ax.set_title('Track Competitiveness (Higher = More Unpredictable)')
-        ax.set_ylabel('Position Standard Deviation')
-        st.pyplot(fig)
-        plt.close()
+        show_figure('track_competitiveness', (season,), draw)
     
     with col2:
-        st.write("**DNF Rates by Track - 2024**")
-        dnf_by_track = season_2024[season_2024['Time/Retired'] == 'DNF'].groupby('Track').size()
-        total_by_track = season_2024.groupby('Track').size()
-        dnf_rates = (dnf_by_track / total_by_track * 100).fillna(0)
+        st.write(f"**DNF Rates by Track - {season}**")
         
-        fig, ax = plt.subplots(figsize=(12, 8))
-        ax.bar(range(len(dnf_rates)), dnf_rates.values, color='red', alpha=0.7)
-        ax.set_xticks(range(len(dnf_rates)))
-        ax.set_xticklabels(dnf_rates.index, rotation=45)
-        ax.set_title('DNF Rate by Track (%)')
-        ax.set_ylabel('DNF Percentage')
-        st.pyplot(fig)
-        plt.close()
-
-def show_advanced_analytics(season_2024, season_2025):
-    """Advanced analytics with heatmaps and statistical analysis"""
-    add_bg_video()
-    st.header("📊 Advanced Analytics")
+        def draw():
+            rates = dnf_rates(season_data, season_rounds(season))
+            
+            fig, ax = plt.subplots(figsize=(12, 8))
+            ax.bar(range(len(rates)), rates.values, color='red', alpha=0.7)
+            ax.set_xticks(range(len(rates)))
+            ax.set_xticklabels(rates.index, rotation=45)
+            ax.set_title('DNF Rate by Track (%)')
+            ax.set_ylabel('DNF Percentage')
+            return fig
+        
+        show_figure('track_dnf_rates', (season,), draw)
+    
+    # Race pace from the parsed race and lap times
+    st.subheader("⏱️ Race Pace Analysis")
     
-    # Driver consistency analysis
-    st.subheader("📈 Driver Consistency Analysis")
     col1, col2 = st.columns(2)
     
     with col1:
-        st.write("**Most Consistent Drivers 2024 (Lower = More Consistent)**")
-        consistency_2024 = season_2024.groupby('Driver')['Position'].std().sort_values().head(10)
+        st.write(f"**Fastest Lap by Race - {season}**")
         
-        fig, ax = plt.subplots(figsize=(10, 8))
-        ax.barh(range(len(consistency_2024)), consistency_2024.values, color='lightblue', alpha=0.8)
-        ax.set_yticks(range(len(consistency_2024)))
-        ax.set_yticklabels(consistency_2024.index)
-        ax.set_title('Driver Consistency - 2024')
-        ax.set_xlabel('Position Standard Deviation')
-        st.pyplot(fig)
-        plt.close()
+        def draw():
+            laps = fastest_lap_trend(season_data, season_rounds(season))
+            
+            fig, ax = plt.subplots(figsize=(12, 8))
+            ax.plot(range(1, len(laps) + 1), laps.values, 'o-', color='purple', linewidth=2, markersize=6)
+            ax.set_xticks(range(1, len(laps) + 1))
+            ax.set_xticklabels(laps.index, rotation=45)
+            ax.set_title('Fastest Lap of Each Race')
+            ax.set_ylabel('Lap Time (seconds)')
+            ax.grid(True, alpha=0.3)
+            return fig
+        
+        show_figure('track_fastest_laps', (season,), draw)
     
     with col2:
-        st.write("**Most Consistent Drivers 2025 (Lower = More Consistent)**")
-        consistency_2025 = season_2025.groupby('Driver')['Position'].std().sort_values().head(10)
+        st.write(f"**Median Gap to Winner - {season}**")
+        
+        def draw():
+            gaps = gap_to_winner(season_data).head(10)
+            
+            fig, ax = plt.subplots(figsize=(12, 8))
+            ax.barh(range(len(gaps)), gaps.values, color='teal', alpha=0.8)
+            ax.set_yticks(range(len(gaps)))
+            ax.set_yticklabels(gaps.index)
+            ax.invert_yaxis()
+            ax.set_title('Median Gap to Winner on Lead-Lap Finishes')
+            ax.set_xlabel('Gap (seconds)')
+            return fig
         
-        fig, ax = plt.subplots(figsize=(10, 8))
-        ax.barh(range(len(consistency_2025)), consistency_2025.values, color='lightcoral', alpha=0.8)
-        ax.set_yticks(range(len(consistency_2025)))
-        ax.set_yticklabels(consistency_2025.index)
-        ax.set_title('Driver Consistency - 2025')
-        ax.set_xlabel('Position Standard Deviation')
-        st.pyplot(fig)
-        plt.close()
+        show_figure('driver_gap_to_winner', (season,), draw)
     
-    # Performance heatmaps
-    st.subheader("🔥 Performance Heatmaps")
+    st.write(f"**Fastest Lap Deficit Trend - {season}** (closest five drivers to the winner)")
     
-    # Get top drivers for heatmap
-    top_drivers_2024 = season_2024.groupby('Driver')['Points'].sum().sort_values(ascending=False).head(8)
-    top_drivers_2025 = season_2025.groupby('Driver')['Points'].sum().sort_values(ascending=False).head(8)
+    def draw():
+        deficit = fastest_lap_deficit(season_data, gap_to_winner(season_data).index[:5], load_driver_index(),
+                                      season_rounds(season))
+        
+        fig, ax = plt.subplots(figsize=(14, 6))
+        for driver in deficit.columns:
+            ax.plot(deficit.index, deficit[driver].values, 'o-', linewidth=2, markersize=5, label=driver)
+        ax.set_title('Best Lap vs Race Fastest Lap')
+        ax.set_xlabel('Round')
+        ax.set_ylabel('Off Fastest Lap (%)')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        return fig
     
-    col1, col2 = st.columns(2)
+    show_figure('driver_lap_deficit', (season,), draw)
+
+@profiled
+def show_advanced_analytics(data, driver_stats, team_stats, seasons):
+    """Advanced analytics with heatmaps and statistical analysis"""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
     
-    with col1:
-        st.write("**Driver-Track Performance Matrix 2024**")
-        driver_track_2024 = season_2024.pivot_table(values='Points', index='Driver', columns='Track', aggfunc='sum', fill_value=0)
-        driver_track_2024_filtered = driver_track_2024.loc[driver_track_2024.index.isin(top_drivers_2024.index)]
-        
-        fig, ax = plt.subplots(figsize=(14, 8))
-        sns.heatmap(driver_track_2024_filtered, annot=True, fmt='.0f', cmap='YlOrRd', ax=ax, cbar_kws={'shrink': 0.8})
-        ax.set_title('Driver Performance by Track - 2024 (Top 8 Drivers)')
-        ax.set_ylabel('Driver')
-        ax.set_xlabel('Track')
-        plt.xticks(rotation=45)
-        plt.yticks(rotation=0)
-        st.pyplot(fig)
-        plt.close()
+    add_bg_video()
+    st.header("📊 Advanced Analytics")
     
-    with col2:
-        st.write("**Driver-Track Performance Matrix 2025**")
-        driver_track_2025 = season_2025.pivot_table(values='Points', index='Driver', columns='Track', aggfunc='sum', fill_value=0)
-        driver_track_2025_filtered = driver_track_2025.loc[driver_track_2025.index.isin(top_drivers_2025.index)]
-        
-        fig, ax = plt.subplots(figsize=(14, 8))
-        sns.heatmap(driver_track_2025_filtered, annot=True, fmt='.0f', cmap='YlGnBu', ax=ax, cbar_kws={'shrink': 0.8})
-        ax.set_title('Driver Performance by Track - 2025 (Top 8 Drivers)')
-        ax.set_ylabel('Driver')
-        ax.set_xlabel('Track')
-        plt.xticks(rotation=45)
-        plt.yticks(rotation=0)
-        st.pyplot(fig)
-        plt.close()
+    # Driver consistency analysis
+    st.subheader("📈 Driver Consistency Analysis")
+    
+    for i, season, col in season_columns(seasons):
+        with col:
+            st.write(f"**Most Consistent Drivers {season} (Lower = More Consistent)**")
+            
+            def draw():
+                most_consistent = consistency(stats_for_season(driver_stats, season)).head(10)
+                # 95% bootstrap interval - wide for drivers with only a few classified finishes
+                errors = error_bars(run_bootstrap(season), most_consistent.index, 'Position Std')
+                
+                fig, ax = plt.subplots(figsize=(10, 8))
+                ax.barh(range(len(most_consistent)), most_consistent.values, xerr=errors, capsize=4,
+                        color=pick(['lightblue', 'lightcoral'], i), alpha=0.8)
+                ax.set_yticks(range(len(most_consistent)))
+                ax.set_yticklabels(most_consistent.index)
+                ax.set_title(f'Driver Consistency - {season}')
+                ax.set_xlabel('Position Standard Deviation (95% bootstrap interval)')
+                return fig
+            
+            show_figure('driver_consistency', (season, i), draw)
+    
+    # Performance heatmaps
+    st.subheader("🔥 Performance Heatmaps")
+    
+    for i, season, col in season_columns(seasons):
+        with col:
+            st.write(f"**Driver-Track Performance Matrix {season}**")
+            
+            def draw():
+                # Get top drivers for heatmap
+                top_drivers = driver_standings(stats_for_season(driver_stats, season)).head(8)
+                driver_track_filtered = load_track_points()[season].matrix(top_drivers.index)
+                
+                fig, ax = plt.subplots(figsize=(14, 8))
+                sns.heatmap(driver_track_filtered, annot=True, fmt='.0f', cmap=pick(['YlOrRd', 'YlGnBu'], i), ax=ax, cbar_kws={'shrink': 0.8})
+                ax.set_title(f'Driver Performance by Track - {season} (Top 8 Drivers)')
+                ax.set_ylabel('Driver')
+                ax.set_xlabel('Track')
+                plt.xticks(rotation=45)
+                plt.yticks(rotation=0)
+                return fig
+            
+            show_figure('driver_track_heatmap', (season, i), draw)
     
     # Position distribution analysis
     st.subheader("📊 Position Distribution Analysis")
     
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-    
     # Position histograms
-    axes[0,0].hist(season_2024['Position'], bins=20, alpha=0.7, color='skyblue', edgecolor='black')
-    axes[0,0].set_title('Position Distribution - 2024')
-    axes[0,0].set_xlabel('Finishing Position')
-    axes[0,0].set_ylabel('Frequency')
-    
-    axes[0,1].hist(season_2025['Position'], bins=20, alpha=0.7, color='lightgreen', edgecolor='black')
-    axes[0,1].set_title('Position Distribution - 2025')
-    axes[0,1].set_xlabel('Finishing Position')
-    axes[0,1].set_ylabel('Frequency')
-    
-    # Combined data for analysis
-    combined_data = pd.concat([season_2024[['Position', 'Points', 'Season']], 
-                              season_2025[['Position', 'Points', 'Season']]])
-    top_10_positions = combined_data[combined_data['Position'] <= 10]
-    
-    # Boxplot
-    sns.boxplot(data=top_10_positions, x='Position', y='Points', hue='Season', ax=axes[1,0])
-    axes[1,0].set_title('Points Distribution by Position (Top 10)')
-    axes[1,0].set_xlabel('Finishing Position')
-    axes[1,0].set_ylabel('Points Scored')
-    
-    # Scatter plot - Starting Grid vs Position
-    axes[1,1].scatter(season_2024['Starting Grid'], season_2024['Position'], 
-                      alpha=0.6, color='blue', label='2024', s=30)
-    axes[1,1].scatter(season_2025['Starting Grid'], season_2025['Position'], 
-                      alpha=0.6, color='red', label='2025', s=30)
-    axes[1,1].set_title('Starting Grid vs Finishing Position')
-    axes[1,1].set_xlabel('Starting Grid Position')
-    axes[1,1].set_ylabel('Finishing Position')
-    axes[1,1].legend()
-    axes[1,1].plot([1, 20], [1, 20], 'k--', alpha=0.5)
-    
-    plt.tight_layout()
-    st.pyplot(fig)
-    plt.close()
+    for i, season, col in season_columns(seasons):
+        with col:
+            def draw():
+                fig, ax = plt.subplots(figsize=(8, 6))
+                ax.hist(select_season(data, season)['Position'], bins=20, alpha=0.7,
+                        color=pick(['skyblue', 'lightgreen'], i), edgecolor='black')
+                ax.set_title(f'Position Distribution - {season}')
+                ax.set_xlabel('Finishing Position')
+                ax.set_ylabel('Frequency')
+                return fig
+            
+            show_figure('position_histogram', (season, i), draw)
+    
+    def draw():
+        fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+        
+        # Combined data for analysis
+        combined_data = data.loc[data['Season'].isin(seasons), ['Position', 'Points', 'Season']]
+        top_10_positions = combined_data[combined_data['Position'] <= 10].astype({'Season': int})
+        
+        # Boxplot
+        sns.boxplot(data=top_10_positions, x='Position', y='Points', hue='Season', ax=axes[0])
+        axes[0].set_title('Points Distribution by Position (Top 10)')
+        axes[0].set_xlabel('Finishing Position')
+        axes[0].set_ylabel('Points Scored')
+        
+        # Starting Grid vs Position from the per-season count matrices, so the cost is the grid size, not the rows
+        grid_finish = load_grid_finish()
+        size = max(len(grid_finish[season]) for season in seasons)
+        slots = range(1, size + 1)
+        if len(seasons) <= 3:
+            # One bubble per (grid, finish) cell, area by how often it happened
+            largest = max(grid_finish[season].to_numpy().max(initial=1) for season in seasons)
+            for i, season in enumerate(seasons):
+                cells = grid_finish[season].stack()
+                cells = cells[cells > 0]
+                axes[1].scatter(cells.index.get_level_values('Starting Grid'),
+                                cells.index.get_level_values('Position'), s=cells.to_numpy() / largest * 400,
+                                alpha=0.5, color=pick(['blue', 'red', 'green'], i), label=str(season))
+            legend = axes[1].legend()
+            for handle in legend.legend_handles:
+                handle.set_sizes([40])
+        else:
+            # Too many seasons to overlay - pool them into one P(finish | grid) heatmap
+            pooled = sum(grid_finish[season].reindex(index=slots, columns=slots, fill_value=0) for season in seasons)
+            image = axes[1].imshow(finish_given_grid(pooled).to_numpy().T, origin='lower', cmap='viridis',
+                                   extent=(0.5, size + 0.5, 0.5, size + 0.5))
+            fig.colorbar(image, ax=axes[1], label='P(finish | grid)')
+        axes[1].set_title('Starting Grid vs Finishing Position')
+        axes[1].set_xlabel('Starting Grid Position')
+        axes[1].set_ylabel('Finishing Position')
+        axes[1].plot([1, size], [1, size], 'k--', alpha=0.5)
+        
+        plt.tight_layout()
+        return fig
     
+    show_figure('position_points_grid', (tuple(seasons),), draw)
+
     # Summary statistics
     st.subheader("📊 Championship Summary")
     
     season_stats = pd.DataFrame({
-        '2024 Season': [
-            len(season_2024['Track'].unique()),
-            len(season_2024['Driver'].unique()),
-            len(season_2024['Team'].unique()),
-            season_2024[season_2024['Position'] == 1]['Driver'].value_counts().iloc[0] if not season_2024[season_2024['Position'] == 1].empty else 0,
-            season_2024[season_2024['Position'] == 1]['Driver'].value_counts().index[0] if not season_2024[season_2024['Position'] == 1].empty else 'N/A',
-            season_2024.groupby('Driver')['Points'].sum().max(),
-            season_2024.groupby('Driver')['Points'].sum().idxmax()
-        ],
-        '2025 Season': [
-            len(season_2025['Track'].unique()),
-            len(season_2025['Driver'].unique()),
-            len(season_2025['Team'].unique()),
-            season_2025[season_2025['Position'] == 1]['Driver'].value_counts().iloc[0] if not season_2025[season_2025['Position'] == 1].empty else 0,
-            season_2025[season_2025['Position'] == 1]['Driver'].value_counts().index[0] if not season_2025[season_2025['Position'] == 1].empty else 'N/A',
-            season_2025.groupby('Driver')['Points'].sum().max(),
-            season_2025.groupby('Driver')['Points'].sum().idxmax()
-        ]
-    }, index=['Total Races', 'Total Drivers', 'Total Teams', 'Most Wins Count', 
-              'Most Wins Driver', 'Highest Points', 'Points Leader'])
+        f'{season} Season': season_summary(select_season(data, season), stats_for_season(driver_stats, season),
+                                          stats_for_season(team_stats, season), season_rounds(season))
+        for season in seasons
+    })
     
     st.dataframe(season_stats, use_container_width=True)
 
+@profiled
+def show_title_simulator(data, seasons):
+    """Monte Carlo title odds from the results so far"""
+    import matplotlib.pyplot as plt
+    
+    add_bg_video()
+    st.header("🎲 Championship Title Simulator")
+    st.markdown("""
+    Each remaining race is simulated by giving every driver on the current grid a finish drawn from
+    their own results so far this season, then scoring the race with the standard points table.
+    """)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        season = st.selectbox("Season:", seasons, index=len(seasons) - 1)
+    completed_rounds = int(select_season(data, season)['Round'].max())
+    with col2:
+        remaining_rounds = st.number_input("Remaining rounds:", min_value=0, max_value=30,
+                                           value=max(24 - completed_rounds, 0))
+    with col3:
+        n_seasons = st.select_slider("Simulated seasons:", options=[10_000, 100_000, 1_000_000], value=100_000)
+    with col4:
+        seed = st.number_input("Random seed:", min_value=0, value=0)
+    
+    odds = run_title_simulation(season, int(remaining_rounds), n_seasons, int(seed))
+    contenders = odds[odds['Title Probability'] > 0]
+    
+    st.subheader(f"🏆 Title Probability after Round {completed_rounds} - {season}")
+    
+    def draw():
+        fig, ax = plt.subplots(figsize=(12, 6))
+        ax.barh(contenders.index[::-1], contenders['Title Probability'].values[::-1] * 100, color='gold', alpha=0.8)
+        ax.set_title(f'Title Probability - {season} ({remaining_rounds} rounds to go)')
+        ax.set_xlabel('Probability (%)')
+        return fig
+    
+    show_figure('title_odds', (season, int(remaining_rounds), n_seasons, int(seed)), draw)
+    
+    st.dataframe(odds.style.format({'Current Points': '{:.0f}', 'Expected Points': '{:.1f}',
+                                    'Title Probability': '{:.2%}'}), use_container_width=True)
+
 # MAIN APPLICATION FUNCTION
 
+def show_profile(records, memory_skipped=False):
+    """Sidebar table of the spans recorded for this run"""
+    with st.sidebar.expander("⏱️ Performance", expanded=bool(records)):
+        st.checkbox("Profile each rerun", key="profile",
+                    help=f"Time data loading, aggregations and charts; spans are also appended to {PROFILE_LOG}")
+        st.checkbox("Trace memory", key="profile_memory",
+                    help="Record each span's peak allocation with tracemalloc; makes the page several times slower")
+        if not records:
+            return
+        if memory_skipped:
+            st.caption("Another session was tracing memory, so this rerun recorded times only.")
+        table = pd.DataFrame(records)
+        total = table.loc[table['depth'] == 0, ['wall_s', 'cpu_s']].sum()
+        st.write(f"**Total:** {total['wall_s']:.3f}s wall • {total['cpu_s']:.3f}s CPU")
+        # Nested spans indented under the span that called them
+        table.index = ['\u2003' * depth + name for depth, name in zip(table['depth'], table['name'])]
+        table = table[['wall_s', 'cpu_s', 'peak_mib']].astype(float).rename(
+            columns={'wall_s': 'Wall (s)', 'cpu_s': 'CPU (s)', 'peak_mib': 'Peak (MiB)'})
+        st.dataframe(table.style.format('{:.3f}', na_rep='-'), use_container_width=True)
+
 def main():
-    """Main application function"""
-    # Load data
-    season_2024, season_2025 = load_and_clean_data()
-    
-    if season_2024 is None or season_2025 is None:
-        st.error("⚠️ Please ensure your CSV files are uploaded or in the correct directory")
-        st.info("Expected files: Formula1_2024season_raceResults.csv and Formula1_2025Season_RaceResults.csv")
-        return
-    
+    """Run the selected page, recording its spans when the Performance toggle is on"""
+    profiling = st.session_state.get("profile", False)
+    trace_memory = profiling and st.session_state.get("profile_memory", False)
+    traced = start_run(st.session_state.get("page"), trace_memory=trace_memory) if profiling else False
+    try:
+        show_dashboard()
+    finally:
+        records = finish_run(PROFILE_LOG) if profiling else []
+    show_profile(records, memory_skipped=trace_memory and not traced)
+
+def show_dashboard():
+    """Sidebar navigation and the selected page"""
     # Sidebar navigation
     st.sidebar.markdown("## 📊 Navigation")
     st.sidebar.markdown("---")
@@ -1194,10 +1427,28 @@ def main():
     analysis_option = st.sidebar.selectbox(
         "Choose Analysis Section:",
         ["📈 Enhanced Overview", "📚 F1 Basics Guide", "🏁 Driver Performance", "🏭 Team Analysis", 
-         "🏁 Race Analysis", "🏁 Track Performance", "📊 Advanced Analytics", "🎥 Video Gallery"],
-        help="Select different sections to explore F1 data"
+         "🏁 Race Analysis", "🏁 Track Performance", "📊 Advanced Analytics", "🎲 Title Simulator",
+         "🎥 Video Gallery"],
+        help="Select different sections to explore F1 data",
+        key="page"
     )
     
+    # Load data only for pages that use it
+    data = seasons = None
+    if analysis_option not in STATIC_PAGES:
+        data = load_and_clean_data()
+        
+        if data is None:
+            st.error("⚠️ Please ensure your CSV files are uploaded or in the correct directory")
+            st.info("Expected files named like: Formula1_2025Season_RaceResults.csv (one per season)")
+            return
+        
+        available_seasons = season_list(data)
+        seasons = st.sidebar.multiselect(
+            "Seasons:", available_seasons, default=available_seasons[-2:],
+            help="Seasons shown side by side on the analysis pages"
+        )
+    
     # Sidebar info
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 🏎️ Dashboard Features")
@@ -1219,27 +1470,49 @@ def main():
     - Championship system
     """)
     
+    with st.sidebar.expander("🖼️ Figure Cache"):
+        cache_stats = get_figure_cache().stats()
+        st.write(f"**Hits:** {cache_stats['hits']} • **Misses:** {cache_stats['misses']} "
+                 f"({cache_stats['hit_rate']:.0%} hit rate)")
+        st.write(f"**Entries:** {cache_stats['entries']} • **Evictions:** {cache_stats['evictions']}")
+        st.write(f"**Size:** {cache_stats['bytes'] / 2**20:.1f} / {cache_stats['max_bytes'] / 2**20:.0f} MB")
+        disk_stats = get_result_cache().stats()
+        st.write(f"**Disk (all workers):** {disk_stats['entries']} entries • "
+                 f"{disk_stats['bytes'] / 2**20:.1f} / {disk_stats['max_bytes'] / 2**20:.0f} MB • "
+                 f"{disk_stats['hit_rate']:.0%} hit rate here")
+    
     st.sidebar.markdown("---")
     st.sidebar.markdown("**🏆 Formula 1 2025 Season Dashboard**")
     st.sidebar.markdown("*Built with Streamlit*")
     
     # Navigation routing
-    if analysis_option == "📈 Enhanced Overview":
-        show_enhanced_overview(season_2024, season_2025)
-    elif analysis_option == "📚 F1 Basics Guide":
+    if analysis_option == "📚 F1 Basics Guide":
         show_f1_basics()
+        return
     elif analysis_option == "🎥 Video Gallery":
         show_f1_videos()
+        return
+    
+    if not seasons:
+        st.warning("Please select at least one season")
+        return
+    
+    driver_stats, team_stats = load_season_stats(SQL_BACKEND)
+    
+    if analysis_option == "📈 Enhanced Overview":
+        show_enhanced_overview(data, driver_stats, team_stats, seasons)
     elif analysis_option == "🏁 Driver Performance":
-        show_driver_analysis(season_2024, season_2025)
+        show_driver_analysis(data, driver_stats, seasons)
     elif analysis_option == "🏭 Team Analysis":
-        show_team_analysis(season_2024, season_2025)
+        show_team_analysis(team_stats, seasons)
     elif analysis_option == "🏁 Race Analysis":
-        show_race_analysis(season_2024, season_2025)
+        show_race_analysis(data, driver_stats, seasons)
     elif analysis_option == "🏁 Track Performance":
-        show_track_analysis(season_2024, season_2025)
+        show_track_analysis(data, seasons)
+    elif analysis_option == "🎲 Title Simulator":
+        show_title_simulator(data, seasons)
     elif analysis_option == "📊 Advanced Analytics":
-        show_advanced_analytics(season_2024, season_2025)
+        show_advanced_analytics(data, driver_stats, team_stats, seasons)
 
 if __name__ == "__main__":
     main()
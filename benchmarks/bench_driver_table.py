@@ -0,0 +1,69 @@
+"""Time the Detailed Driver Statistics table against row count and selected drivers
+
+Run from the repository root:
+
+    python benchmarks/bench_driver_table.py
+
+The per-driver filter loop the page used to run grows with drivers x seasons x rows.
+The aggregate path is one groupby over the rows plus a lookup per selected driver,
+so its cost should only move with the row count.
+"""
+import os
+import sys
+import timeit
+
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from f1_engine import driver_detail_table, driver_season_stats, load_seasons, season_list, select_season  # noqa: E402
+
+
+def filter_loop_table(data, drivers, seasons):
+    """The original per-driver, per-season boolean mask loop"""
+    stats_data = []
+    for driver in drivers:
+        for season in seasons:
+            season_data = select_season(data, season)
+            driver_data = season_data[season_data['Driver'] == driver]
+            if not driver_data.empty:
+                stats_data.append({
+                    'Driver': driver,
+                    'Season': str(season),
+                    'Total Points': driver_data['Points'].sum(),
+                    'Average Position': round(driver_data['Position'].mean(), 2),
+                    'Wins': len(driver_data[driver_data['Position'] == 1]),
+                    'Podiums': len(driver_data[driver_data['Position'] <= 3]),
+                    'DNFs': len(driver_data[driver_data['Time/Retired'] == 'DNF']),
+                    'Races': len(driver_data)
+                })
+    return pd.DataFrame(stats_data)
+
+
+def aggregate_table(data, drivers, seasons):
+    return driver_detail_table(driver_season_stats(data), drivers, seasons)
+
+
+def best_ms(func, *args, number=3):
+    return min(timeit.repeat(lambda: func(*args), number=1, repeat=number)) * 1000
+
+
+def main():
+    base = load_seasons(REPO_ROOT, max_workers=1)
+    seasons = season_list(base)
+    all_drivers = list(base['Driver'].unique())
+
+    print(f"{'rows':>8} {'drivers':>8} {'filter loop ms':>15} {'aggregate ms':>13} {'lookup only ms':>15}")
+    for scale in (1, 10, 100):
+        data = pd.concat([base] * scale, ignore_index=True)
+        driver_stats = driver_season_stats(data)
+        for drivers in (all_drivers[:5], all_drivers):
+            loop_ms = best_ms(filter_loop_table, data, drivers, seasons)
+            aggregate_ms = best_ms(aggregate_table, data, drivers, seasons)
+            lookup_ms = best_ms(driver_detail_table, driver_stats, drivers, seasons)
+            print(f"{len(data):>8} {len(drivers):>8} {loop_ms:>15.1f} {aggregate_ms:>13.1f} {lookup_ms:>15.2f}")
+
+
+if __name__ == '__main__':
+    main()
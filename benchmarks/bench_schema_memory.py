@@ -0,0 +1,43 @@
+"""Memory per row of the loaded seasons with and without the compact schema
+
+Run from the repository root:
+
+    python benchmarks/bench_schema_memory.py
+
+Both frames are cleaned from the same CSVs; the wide one keeps pandas'
+default dtypes (float64 positions, per-season string columns). That the
+aggregates built from the two agree is checked by tests/test_schema.py.
+"""
+import os
+import sys
+
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from f1_engine import clean_race_data, combine_seasons, discover_season_files, load_seasons  # noqa: E402
+
+
+def wide_seasons(data_dir):
+    frames = [clean_race_data(pd.read_csv(path).assign(Season=season), compact=False)
+              for season, path in discover_season_files(data_dir).items()]
+    return combine_seasons(frames)
+
+
+def bytes_per_row(data):
+    return data.memory_usage(deep=True, index=False) / len(data)
+
+
+def main():
+    wide = wide_seasons(REPO_ROOT)
+    compact = load_seasons(REPO_ROOT, use_store=False)
+
+    report = pd.DataFrame({'wide': bytes_per_row(wide), 'compact': bytes_per_row(compact)})
+    report.loc['total'] = report.sum()
+    print(f"{len(compact)} rows, bytes per row by column")
+    print(report.round(1).fillna('-').to_string())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Compare cold load time and peak RSS of the CSV path against the columnar store
+
+Run from the repository root:
+
+    python benchmarks/bench_season_store.py --scale 100
+
+Each measurement runs in a fresh interpreter so nothing is shared between runs.
+Peak RSS is read from /proc, so the script is Linux only.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from f1_engine import build_season_store, discover_season_files  # noqa: E402
+
+CHILD_CODE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+import f1_engine.data as f1_data
+
+def status_kb(field):
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith(field):
+                return int(line.split()[1])
+
+# Reset the high-water mark so the import cost is not counted as load cost
+with open('/proc/self/clear_refs', 'w') as clear_refs:
+    clear_refs.write('5')
+baseline = status_kb('VmRSS')
+start = time.perf_counter()
+df = f1_data.load_season({path!r}, {season}, use_store={use_store})
+elapsed = time.perf_counter() - start
+peak = status_kb('VmHWM')
+print(json.dumps({{'seconds': elapsed, 'rows': len(df), 'peak_kb': peak, 'load_kb': peak - baseline}}))
+"""
+
+
+def scaled_copy(csv_path, scale, folder):
+    """Write the CSV repeated `scale` times so the difference is measurable"""
+    df = pd.read_csv(csv_path)
+    target = os.path.join(folder, os.path.basename(csv_path))
+    pd.concat([df] * scale, ignore_index=True).to_csv(target, index=False)
+    return target
+
+
+def run_child(path, season, use_store):
+    code = CHILD_CODE.format(root=REPO_ROOT, path=path, season=season, use_store=use_store)
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True)
+    return json.loads(output.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=int, default=100, help='times to repeat each season CSV')
+    parser.add_argument('--repeat', type=int, default=3, help='cold runs per measurement')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        for season, csv_path in discover_season_files(REPO_ROOT).items():
+            path = scaled_copy(csv_path, args.scale, folder)
+            build_season_store(path, season)
+
+            for label, use_store in [('csv', False), ('store', True)]:
+                runs = [run_child(path, season, use_store) for _ in range(args.repeat)]
+                best = min(runs, key=lambda run: run['seconds'])
+                print(f"{season} {label:>5}: {best['rows']:>8} rows  "
+                      f"{best['seconds'] * 1000:8.1f} ms  "
+                      f"peak RSS {best['peak_kb'] / 1024:7.1f} MiB  "
+                      f"(+{best['load_kb'] / 1024:.1f} MiB during load)")
+
+
+if __name__ == '__main__':
+    main()
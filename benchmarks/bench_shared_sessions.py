@@ -0,0 +1,105 @@
+"""Process memory with many sessions holding the dataset: per-session copies versus one shared frame
+
+Run from the repository root:
+
+    python benchmarks/bench_shared_sessions.py
+    python benchmarks/bench_shared_sessions.py --seasons 200   # synthetic data, 100x the real size
+
+Each configuration runs in a fresh interpreter that loads the seasons once
+and then gives every session the frame its rerun would see. "copied" is
+the old st.cache_data behaviour: every call returns a pickled and unpickled
+copy. "shared" is the st.cache_resource frame behind load_and_clean_data,
+which hands out copy-on-write shallow copies. RSS is read after all
+sessions hold their frame. Each child also checks that adding and
+overwriting a column on a session's frame leaves the shared frame as it was,
+and the script exits non-zero if not.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_seasons import generate_seasons  # noqa: E402
+
+CHILD_CODE = """
+import json, pickle, sys, time
+sys.path.insert(0, {repo!r})
+from f1_engine import dataset_fingerprint, load_seasons
+
+def rss_mib():
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+
+data = load_seasons({data_dir!r}, max_workers=1)
+fingerprint = dataset_fingerprint(data)
+loaded = rss_mib()
+
+start = time.perf_counter()
+if {mode!r} == 'copied':
+    sessions = [pickle.loads(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)) for _ in range({sessions})]
+else:
+    sessions = [data.copy(deep=False) for _ in range({sessions})]
+per_rerun = (time.perf_counter() - start) / {sessions}
+
+# What a page used to do to its frame
+view = sessions[0]
+view['Positions_Changed'] = view['Starting Grid'] - view['Position']
+view['Points'] = 0
+print(json.dumps({{
+    'loaded_mib': loaded,
+    'rss_mib': rss_mib(),
+    'per_rerun_ms': per_rerun * 1000,
+    'shared_unchanged': dataset_fingerprint(data) == fingerprint and 'Positions_Changed' not in data,
+}}))
+"""
+
+
+def run_child(data_dir, mode, sessions):
+    code = CHILD_CODE.format(repo=REPO_ROOT, data_dir=data_dir, mode=mode, sessions=sessions)
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', default='1,10,50', help='comma separated session counts')
+    parser.add_argument('--seasons', type=int, default=0,
+                        help='number of synthetic seasons to generate (default: the real CSVs)')
+    args = parser.parse_args()
+
+    work_dir = None
+    data_dir = REPO_ROOT
+    if args.seasons:
+        work_dir = tempfile.mkdtemp(prefix='f1_sessions_')
+        data_dir = work_dir
+        generate_seasons(args.seasons, data_dir)
+
+    unchanged = True
+    try:
+        print(f"{'sessions':>8} {'mode':>7} {'loaded MiB':>11} {'RSS MiB':>9} {'+MiB':>7} {'ms/rerun':>9}")
+        for sessions in (int(value) for value in args.sessions.split(',')):
+            for mode in ('copied', 'shared'):
+                result = run_child(data_dir, mode, sessions)
+                unchanged &= result['shared_unchanged']
+                print(f"{sessions:>8} {mode:>7} {result['loaded_mib']:>11.1f} {result['rss_mib']:>9.1f} "
+                      f"{result['rss_mib'] - result['loaded_mib']:>7.1f} {result['per_rerun_ms']:>9.3f}")
+    finally:
+        if work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    if not unchanged:
+        print("A session's changes reached the shared frame")
+        sys.exit(1)
+    print("Session changes never reached the shared frame")
+
+
+if __name__ == '__main__':
+    main()
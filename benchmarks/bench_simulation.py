@@ -0,0 +1,58 @@
+"""Throughput of the Monte Carlo title simulator against worker count
+
+Run from the repository root:
+
+    python benchmarks/bench_simulation.py --seasons 1000000 --remaining 12
+
+The latest loaded season is simulated with 1, 2, 4, ... worker processes up
+to the CPU count. Shards are seeded independently of the worker count, so
+every run must give the same title odds; the script checks that too.
+"""
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from f1_engine import load_seasons, season_list, select_season, simulate_championship  # noqa: E402
+
+
+def worker_counts(limit):
+    count = 1
+    while count < limit:
+        yield count
+        count *= 2
+    yield limit
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seasons', type=int, default=1_000_000, help='seasons to simulate per run')
+    parser.add_argument('--remaining', type=int, default=12, help='rounds left to simulate')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    data = load_seasons(REPO_ROOT)
+    season = season_list(data)[-1]
+    season_data = select_season(data, season)
+
+    print(f"{season}: {args.seasons:,} seasons x {args.remaining} remaining rounds")
+    print(f"{'workers':>7} {'seconds':>9} {'seasons/s':>12}  leader")
+    reference = None
+    for workers in worker_counts(args.max_workers):
+        start = time.perf_counter()
+        odds = simulate_championship(season_data, args.remaining, args.seasons, seed=0, max_workers=workers)
+        elapsed = time.perf_counter() - start
+
+        leader = f"{odds.index[0]} {odds['Title Probability'].iloc[0]:.2%}"
+        if reference is None:
+            reference = odds
+        elif not odds.equals(reference):
+            leader += '  MISMATCH vs 1 worker'
+        print(f"{workers:>7} {elapsed:>9.2f} {args.seasons / elapsed:>12,.0f}  {leader}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""Season tables from the in-memory frame versus the SQLite season database as history grows
+
+Run from the repository root:
+
+    python benchmarks/bench_sql_backend.py --seasons 20,200
+
+For each size, synthetic seasons are generated and both paths compute the
+driver and team tables for the latest two seasons. The pandas path has to
+load every season first; the database path filters and groups in SQL, so
+only the two seasons' rows are read. The time and tracemalloc peak of each
+path are reported, the database build is timed separately, and the script
+exits non-zero if the two paths disagree.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from f1_engine import (build_season_database, driver_season_stats, load_seasons, season_list,  # noqa: E402
+                       team_season_stats)
+from synthetic_seasons import generate_seasons  # noqa: E402
+from tests.comparison import comparable  # noqa: E402
+
+
+def measure(step):
+    """(result, seconds, peak traced MiB) of step()"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = step()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 2**20
+
+
+def pandas_tables(data_dir):
+    data = load_seasons(data_dir, max_workers=1)
+    latest = season_list(data)[-2:]
+    data = data[data['Season'].isin(latest)]
+    return driver_season_stats(data), team_season_stats(data)
+
+
+def sql_tables(data_dir):
+    database = build_season_database(data_dir)
+    latest = database.seasons()[-2:]
+    return database.season_stats('Driver', latest), database.season_stats('Team', latest)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seasons', default='20,200', help='comma separated numbers of synthetic seasons')
+    args = parser.parse_args()
+
+    agree = True
+    work_dir = tempfile.mkdtemp(prefix='f1_sql_')
+    try:
+        for n_seasons in (int(value) for value in args.seasons.split(',')):
+            data_dir = os.path.join(work_dir, str(n_seasons))
+            generate_seasons(n_seasons, data_dir)
+            load_seasons(data_dir, max_workers=1)  # build the columnar store for both paths
+
+            _, build_s, _ = measure(lambda: build_season_database(data_dir))
+            expected, pandas_s, pandas_mib = measure(lambda: pandas_tables(data_dir))
+            result, sql_s, sql_mib = measure(lambda: sql_tables(data_dir))
+
+            print(f"\n{n_seasons} seasons (database built in {build_s:.2f}s)")
+            print(f"  pandas  {pandas_s:7.3f}s  peak {pandas_mib:7.1f} MiB")
+            print(f"  sqlite  {sql_s:7.3f}s  peak {sql_mib:7.1f} MiB")
+            for name, left, right in zip(('drivers', 'teams'), expected, result):
+                try:
+                    pd.testing.assert_frame_equal(comparable(left), comparable(right), rtol=1e-6)
+                except AssertionError as error:
+                    print(f"  {name}: MISMATCH\n{error}")
+                    agree = False
+                else:
+                    print(f"  {name}: identical")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if not agree:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Cold start time of the dashboard: imports plus the first paint of each page
+
+Run from the repository root:
+
+    python benchmarks/bench_startup.py
+
+Every page is rendered in a fresh interpreter through Streamlit's AppTest, so
+the timing includes importing app.py and everything it pulls in, loading data
+if the page needs it and drawing the page once. The heavy modules loaded by
+the end of the run are listed so an import creeping back to the top level
+shows up.
+"""
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGES = ["📈 Enhanced Overview", "📚 F1 Basics Guide", "🏁 Driver Performance", "🏭 Team Analysis",
+         "🏁 Race Analysis", "🏁 Track Performance", "📊 Advanced Analytics", "🎲 Title Simulator",
+         "🎥 Video Gallery"]
+
+HEAVY_MODULES = ['matplotlib.pyplot', 'seaborn', 'scipy', 'PIL', 'requests']
+
+CHILD_CODE = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+streamlit_ready = time.perf_counter()
+app = AppTest.from_file({app!r}, default_timeout=300)
+app.session_state['page'] = {page!r}
+app.run()
+finished = time.perf_counter()
+print(json.dumps({{
+    'streamlit_s': streamlit_ready - start,
+    'page_s': finished - streamlit_ready,
+    'errors': [str(exception.value) for exception in app.exception],
+    'heavy': [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+
+def run_page(page):
+    code = CHILD_CODE.format(app=os.path.join(REPO_ROOT, 'app.py'), page=page, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True,
+                            cwd=REPO_ROOT)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    print(f"{'page':<24} {'streamlit s':>11} {'first paint s':>14}  heavy modules loaded")
+    for page in PAGES:
+        result = run_page(page)
+        status = f"  ERROR: {result['errors'][0]}" if result['errors'] else ''
+        print(f"{page:<24} {result['streamlit_s']:>11.2f} {result['page_s']:>14.2f}  "
+              f"{', '.join(result['heavy']) or '-'}{status}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Time the race/lap time parser on the loaded seasons tiled up to a large row count
+
+Run from the repository root:
+
+    python benchmarks/bench_time_parsing.py --rows 1000000
+
+Most gaps are replaced with random values so the parser sees many distinct
+strings, not just the few hundred in the real files. A row-wise apply over
+the same column is timed on a slice for comparison.
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from f1_engine import load_seasons, parse_race_times  # noqa: E402
+from f1_engine.timing import RESULT_PATTERN  # noqa: E402
+
+
+def row_wise_seconds(value):
+    """Per-row parse of a Time/Retired value, the approach the parser replaces"""
+    match = re.match(RESULT_PATTERN, str(value))
+    if match is None or match.group('seconds') is None:
+        return np.nan
+    hours, minutes = (float(match.group(name) or 0) for name in ('hours', 'minutes'))
+    return hours * 3600 + minutes * 60 + float(match.group('seconds'))
+
+
+def tiled_results(data, rows, seed=0):
+    rng = np.random.default_rng(seed)
+    tiled = data.iloc[np.arange(rows) % len(data)].reset_index(drop=True)
+    tiled['Round'] = (np.arange(rows) // 20).astype(np.int64)
+    gaps = pd.Series(rng.random(rows) * 120).map('+{:.3f}'.format)
+    tiled['Time/Retired'] = tiled['Time/Retired'].where(rng.random(rows) > 0.7, gaps)
+    return tiled
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--apply-rows', type=int, default=100_000, help='rows for the row-wise comparison')
+    args = parser.parse_args()
+
+    tiled = tiled_results(load_seasons(REPO_ROOT), args.rows)
+    distinct = tiled['Time/Retired'].nunique()
+
+    start = time.perf_counter()
+    parse_race_times(tiled)
+    vectorized = time.perf_counter() - start
+
+    sample = tiled['Time/Retired'].iloc[:args.apply_rows]
+    start = time.perf_counter()
+    sample.apply(row_wise_seconds)
+    row_wise = (time.perf_counter() - start) * args.rows / len(sample)
+
+    print(f"{args.rows:,} rows, {distinct:,} distinct Time/Retired values")
+    print(f"  vectorized parser      : {vectorized:6.2f} s")
+    print(f"  row-wise apply (scaled): {row_wise:6.2f} s")
+
+
+if __name__ == '__main__':
+    main()
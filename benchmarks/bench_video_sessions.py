@@ -0,0 +1,100 @@
+"""Peak memory of serving a local video to concurrent sessions
+
+Run from the repository root:
+
+    python benchmarks/bench_video_sessions.py --size-mb 200 --sessions 10
+
+Each mode runs in a fresh interpreter. The sessions render at the same time,
+like several browser tabs opening the overview together:
+
+  read-per-render  the old add_local_video, one file read per render
+  shared-copy      video_source without static serving, one copy per process
+  static-url       video_source with static serving, no bytes read at all
+
+Peak RSS is read from /proc, so the script is Linux only.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD_CODE = """
+import hashlib, json, sys, threading
+sys.path.insert(0, {root!r})
+import video_serving
+
+def status_kb(field):
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith(field):
+                return int(line.split()[1])
+
+# Stand-in for Streamlit's media file storage, which keeps one entry per content hash
+media_storage = {{}}
+barrier = threading.Barrier({sessions})
+
+def render(mode):
+    if mode == 'read-per-render':
+        with open({path!r}, 'rb') as video_file:
+            data = video_file.read()
+    else:
+        url, data, mimetype = video_serving.video_source({path!r}, static_serving=(mode == 'static-url'))
+    if data is not None:
+        media_storage.setdefault(hashlib.md5(data).hexdigest(), data)
+    # Hold the render open until every session has reached this point
+    barrier.wait()
+
+with open('/proc/self/clear_refs', 'w') as clear_refs:
+    clear_refs.write('5')
+baseline = status_kb('VmRSS')
+threads = [threading.Thread(target=render, args=({mode!r},)) for _ in range({sessions})]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+print(json.dumps({{'load_kb': status_kb('VmHWM') - baseline}}))
+"""
+
+
+def run_child(path, mode, sessions):
+    code = CHILD_CODE.format(root=REPO_ROOT, path=path, mode=mode, sessions=sessions)
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True)
+    return json.loads(output.stdout)
+
+
+def run_modes(static_dir, args):
+    with tempfile.NamedTemporaryFile(dir=static_dir, suffix='.mp4') as video_file:
+        video_file.write(os.urandom(args.size_mb * 1024 * 1024))
+        video_file.flush()
+
+        print(f"{args.size_mb} MB video, {args.sessions} concurrent sessions")
+        for mode in ('read-per-render', 'shared-copy', 'static-url'):
+            result = run_child(video_file.name, mode, args.sessions)
+            print(f"{mode:>16}: +{result['load_kb'] / 1024:8.1f} MiB peak RSS")
+
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size-mb', type=int, default=100, help='size of the generated test video')
+    parser.add_argument('--sessions', type=int, default=10, help='concurrent sessions to simulate')
+    args = parser.parse_args()
+
+    sys.path.insert(0, REPO_ROOT)
+    import video_serving
+
+    created_static_dir = not os.path.isdir(video_serving.STATIC_DIR)
+    os.makedirs(video_serving.STATIC_DIR, exist_ok=True)
+    try:
+        run_modes(video_serving.STATIC_DIR, args)
+    finally:
+        if created_static_dir:
+            os.rmdir(video_serving.STATIC_DIR)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""Synthetic datasets for the benchmark suite, one per multiple of the real data
+
+    python -m pytest benchmarks --scales 1,10
+
+Scale 1 is two synthetic seasons, the size of the real data (~900 rows);
+scale k is 2k seasons from synthetic_seasons.py. Each scale's seasons are
+generated once per session and shared by every benchmark at that scale.
+"""
+import pytest
+
+from synthetic_seasons import generate_seasons
+
+SCALES = '1,10,100,1000'
+
+
+def pytest_addoption(parser):
+    parser.addoption('--scales', default=SCALES, help=f'comma separated multiples of the real data (default {SCALES})')
+
+
+def pytest_generate_tests(metafunc):
+    if 'scale' in metafunc.fixturenames:
+        scales = [int(value) for value in metafunc.config.getoption('scales').split(',')]
+        metafunc.parametrize('scale', scales, ids=[f'{scale}x' for scale in scales], indirect=True,
+                             scope='session')
+
+
+@pytest.fixture(scope='session')
+def scale(request):
+    return request.param
+
+
+@pytest.fixture(scope='session')
+def season_dir(scale, tmp_path_factory):
+    """Folder of 2 x scale synthetic season CSVs"""
+    folder = tmp_path_factory.mktemp(f'scale_{scale}')
+    generate_seasons(2 * scale, str(folder))
+    return str(folder)
@@ -0,0 +1,172 @@
+"""Synthetic season results with the same columns and value formats as the real CSVs
+
+    python benchmarks/synthetic_seasons.py --seasons 75    # writes to synthetic_data/
+
+Each season has 20 cars from 10 teams racing 20-24 rounds. Team strength
+drifts from season to season, seats change hands and teams occasionally
+rebrand, so drivers and teams churn like the real grid. Results follow a
+noisy pace order: retirements (~8%), non-starts and disqualifications are
+drawn at roughly the real rates, back markers get lapped, and points use
+the current table plus the fastest-lap bonus.
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+# Default output folder, relative to the repository root and ignored by git
+SYNTHETIC_DIR = 'synthetic_data'
+
+COLUMNS = ['Track', 'Position', 'No', 'Driver', 'Team', 'Starting Grid', 'Laps', 'Time/Retired', 'Points',
+           'Set Fastest Lap', 'Fastest Lap Time']
+
+TRACKS = ['Bahrain', 'Saudi Arabia', 'Australia', 'Japan', 'China', 'Miami', 'Emilia Romagna', 'Monaco',
+          'Canada', 'Spain', 'Austria', 'Great Britain', 'Hungary', 'Belgium', 'Netherlands', 'Italy',
+          'Azerbaijan', 'Singapore', 'United States', 'Mexico', 'Brazil', 'Las Vegas', 'Qatar', 'Abu Dhabi']
+ENGINES = ['Mercedes', 'Ferrari', 'Honda RBPT', 'Renault']
+POINTS = np.array([25, 18, 15, 12, 10, 8, 6, 4, 2, 1])
+
+TEAMS = 10
+CARS = 2 * TEAMS
+DNF_RATE = 0.08
+DNS_RATE = 0.005
+DSQ_RATE = 0.005
+SEAT_CHANGE_RATE = 0.2
+REBRAND_RATE = 0.05
+
+
+def _clock(seconds, hours=False):
+    """Format seconds as h:mm:ss.sss or m:ss.sss"""
+    seconds = np.asarray(seconds, dtype=float)
+    minutes, rest = np.divmod(seconds, 60)
+    if hours:
+        hour, minutes = np.divmod(minutes, 60)
+        return [f'{h:.0f}:{m:02.0f}:{s:06.3f}' for h, m, s in zip(hour, minutes, rest)]
+    return [f'{m:.0f}:{s:06.3f}' for m, s in zip(minutes, rest)]
+
+
+class _Grid:
+    """Drivers, car numbers and teams carried from one season to the next"""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.next_driver = 0
+        self.teams = [f'Team {index + 1} {ENGINES[index % len(ENGINES)]}' for index in range(TEAMS)]
+        self.team_pace = rng.normal(0, 1, TEAMS)
+        self.drivers = [self._new_driver() for _ in range(CARS)]
+
+    def _new_driver(self):
+        self.next_driver += 1
+        return {'name': f'Driver {self.next_driver}', 'number': int(self.rng.integers(2, 100)),
+                'skill': self.rng.normal(0, 0.4)}
+
+    def next_season(self):
+        self.team_pace = 0.7 * self.team_pace + self.rng.normal(0, 0.7, TEAMS)
+        for seat in np.flatnonzero(self.rng.random(CARS) < SEAT_CHANGE_RATE):
+            self.drivers[seat] = self._new_driver()
+        for team in np.flatnonzero(self.rng.random(TEAMS) < REBRAND_RATE):
+            engine = ENGINES[self.rng.integers(len(ENGINES))]
+            self.teams[team] = f'Team {self.rng.integers(11, 1000)} {engine}'
+
+
+def season_results(grid, rng):
+    """One season's results as a frame with the real CSV columns"""
+    rounds = int(rng.integers(20, 25))
+    tracks = rng.permutation(TRACKS)[:rounds]
+    pace = np.repeat(grid.team_pace, 2) + np.array([driver['skill'] for driver in grid.drivers])
+
+    # Race order: pace plus per-race noise, quali order the same with less noise
+    race_score = pace + rng.gumbel(0, 0.8, (rounds, CARS))
+    quali_score = pace + rng.gumbel(0, 0.5, (rounds, CARS))
+    grid_position = np.argsort(np.argsort(-quali_score, axis=1), axis=1) + 1
+
+    status = np.select([rng.random((rounds, CARS)) < DNS_RATE, rng.random((rounds, CARS)) < DSQ_RATE,
+                        rng.random((rounds, CARS)) < DNF_RATE], ['DNS', 'DSQ', 'DNF'], default='')
+    # Non-finishers sort behind the finishers, in the order they dropped out
+    race_score = np.where(status == '', race_score, -100 + rng.random((rounds, CARS)))
+    order = np.argsort(-race_score, axis=1)
+
+    race_laps = rng.integers(44, 78, rounds)
+    lap_time = rng.uniform(70, 105, rounds)
+    frames = []
+    for race in range(rounds):
+        cars = order[race]
+        car_status = status[race, cars]
+        finished = car_status == ''
+        finishers = int(finished.sum())
+
+        # Gaps grow down the order; cars far enough back are lapped
+        gaps = np.concatenate(([0.0], np.cumsum(rng.exponential(lap_time[race] * 0.09, finishers - 1))))
+        laps_down = (gaps // lap_time[race]).astype(int)
+        winner_time = race_laps[race] * lap_time[race] * rng.uniform(1.02, 1.08)
+        finish_text = ['+' + f'{gap:.3f}' if down == 0 else f'+{down} lap' + ('s' if down > 1 else '')
+                       for gap, down in zip(gaps, laps_down)]
+        finish_text[0] = _clock([winner_time], hours=True)[0]
+
+        laps = np.full(CARS, race_laps[race])
+        laps[:finishers] -= laps_down
+        laps[~finished] = rng.integers(0, race_laps[race], int((~finished).sum()))
+        laps[car_status == 'DNS'] = 0
+
+        fastest = lap_time[race] * (1 + np.abs(rng.normal(0, 0.012, CARS)))
+        fastest_text = np.array(_clock(fastest), dtype=object)
+        fastest_text[laps == 0] = np.nan
+        fastest_car = int(np.argmin(np.where(laps > 0, fastest, np.inf)))
+
+        points = np.zeros(CARS)
+        points[:min(finishers, len(POINTS))] = POINTS[:finishers]
+        set_fastest = np.where(np.arange(CARS) == fastest_car, 'Yes', 'No')
+        if fastest_car < len(POINTS) and finished[fastest_car]:
+            points[fastest_car] += 1
+
+        position = np.array([str(place + 1) for place in range(CARS)], dtype=object)
+        position[car_status == 'DSQ'] = 'DQ'
+        position[np.isin(car_status, ['DNF', 'DNS'])] = 'NC'
+        retired = np.array(finish_text + list(car_status[finishers:]), dtype=object)
+
+        frames.append(pd.DataFrame({
+            'Track': tracks[race],
+            'Position': position,
+            'No': [grid.drivers[car]['number'] for car in cars],
+            'Driver': [grid.drivers[car]['name'] for car in cars],
+            'Team': [grid.teams[car // 2] for car in cars],
+            'Starting Grid': grid_position[race, cars],
+            'Laps': laps,
+            'Time/Retired': retired,
+            'Points': points.astype(int),
+            'Set Fastest Lap': set_fastest,
+            'Fastest Lap Time': fastest_text,
+        }, columns=COLUMNS))
+    return pd.concat(frames, ignore_index=True)
+
+
+def generate_seasons(n_seasons, output_dir, seed=0, last_year=2025):
+    """Write n_seasons CSVs named like the real files and return their paths"""
+    os.makedirs(output_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    grid = _Grid(rng)
+    first_year = max(last_year - n_seasons + 1, 1000)
+    paths = []
+    for year in range(first_year, first_year + n_seasons):
+        path = os.path.join(output_dir, f'Formula1_{year}Season_RaceResults.csv')
+        season_results(grid, rng).to_csv(path, index=False)
+        paths.append(path)
+        grid.next_season()
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seasons', type=int, default=75)
+    parser.add_argument('--output', default=SYNTHETIC_DIR,
+                        help=f'folder to write the CSVs to (default {SYNTHETIC_DIR})')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    paths = generate_seasons(args.seasons, args.output, args.seed)
+    print(f"Wrote {len(paths)} seasons to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+"""Time and memory of loading and of each dashboard page's computations as the data grows
+
+    pip install -r requirements-dev.txt
+    python -m pytest benchmarks --benchmark-autosave                  # record a baseline
+    python -m pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:25%
+
+load_and_clean_data is timed from the CSVs and from the columnar store,
+every cached loader of app.py on its own, and each show_* page's engine
+calls as the page makes them for the default selection (the latest two
+seasons), given what the loaders return - a rerun in a warm process.
+Matplotlib drawing is left out. Every benchmark also records the
+tracemalloc peak of one extra, traced call in extra_info['peak_mib'], plus
+the row count of its dataset.
+"""
+import tracemalloc
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from f1_engine import (bootstrap_intervals, build_driver_index, consistency, dnf_counts, dnf_rates,
+                       driver_detail_table, driver_season_stats, driver_standings, error_bars, fastest_lap_deficit,
+                       fastest_lap_trend, finish_given_grid, finish_rates, gap_to_winner, load_seasons,
+                       names_in_seasons, podium_finishes, race_wins, retirement_breakdown, round_offsets,
+                       season_championships, season_grid_finish, season_list, season_offsets, season_summary,
+                       season_track_points, select_season, simulate_championship, stats_for_season, team_season_stats,
+                       team_standings, track_competitiveness, track_points)
+
+# Slow steps at 1000x take tens of seconds, so every benchmark runs a fixed few rounds
+ROUNDS = 3
+
+
+def run(benchmark, func, rows):
+    """Benchmark func, then record its traced memory peak; returns func's result"""
+    result = benchmark.pedantic(func, rounds=ROUNDS, iterations=1)
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info['rows'] = rows
+    benchmark.extra_info['peak_mib'] = peak / 2**20
+    return result
+
+
+@pytest.fixture(scope='session')
+def loaded(season_dir):
+    """What app.py's cached loaders hold for a dataset, as the pages receive it"""
+    data = load_seasons(season_dir)
+    driver_stats = driver_season_stats(data)
+    return SimpleNamespace(
+        data=data,
+        seasons=season_list(data)[-2:],
+        driver_stats=driver_stats,
+        team_stats=team_season_stats(data),
+        offsets=round_offsets(data),
+        driver_index=build_driver_index(data),
+        championships=season_championships(data),
+        track_points=season_track_points(data),
+        grid_finish=season_grid_finish(data),
+    )
+
+
+@pytest.mark.parametrize('use_store', [False, True], ids=['csv', 'store'])
+def test_load_and_clean_data(benchmark, loaded, season_dir, use_store):
+    data = run(benchmark, lambda: load_seasons(season_dir, use_store=use_store), len(loaded.data))
+    assert len(data) == len(loaded.data)
+    benchmark.extra_info['frame_mib'] = data.memory_usage(deep=True).sum() / 2**20
+
+
+def test_session_view(benchmark, loaded):
+    """Each rerun's copy-on-write view of the shared frame must not copy any columns"""
+    run(benchmark, lambda: loaded.data.copy(deep=False), len(loaded.data))
+    assert benchmark.extra_info['peak_mib'] < 1
+
+
+LOADERS = {
+    'load_season_stats': lambda data: (driver_season_stats(data), team_season_stats(data)),
+    'load_driver_index': build_driver_index,
+    'load_round_offsets': round_offsets,
+    'load_championships': season_championships,
+    'load_track_points': season_track_points,
+    'load_grid_finish': season_grid_finish,
+}
+
+
+@pytest.mark.parametrize('loader', LOADERS)
+def test_loader(benchmark, loaded, loader):
+    run(benchmark, lambda: LOADERS[loader](loaded.data), len(loaded.data))
+
+
+def overview_page(state):
+    seasons = state.seasons
+    [season_offsets(state.offsets, season)['Track'].nunique() for season in seasons]
+    len(names_in_seasons(state.driver_stats, seasons))
+    len(names_in_seasons(state.team_stats, seasons))
+    for season in seasons:
+        season_points = stats_for_season(state.driver_stats, season)['Points']
+        season_points.idxmax()
+    # show_enhanced_driver_profiles, once per season
+    for season in seasons:
+        season_drivers = stats_for_season(state.driver_stats, season)
+        for driver in driver_standings(season_drivers)['Points'].head(10).index:
+            [season_drivers.at[driver, column] for column in ('Wins', 'Podiums', 'Average Position')]
+
+
+def driver_page(state):
+    seasons = state.seasons
+    selected_drivers = names_in_seasons(state.driver_stats, seasons)[:5]
+    for season in seasons:
+        standings = driver_standings(stats_for_season(state.driver_stats, season))
+        standings.loc[standings.index.isin(selected_drivers), 'Points']
+        wins = race_wins(stats_for_season(state.driver_stats, season))
+        wins[wins.index.isin(selected_drivers)]
+    driver_detail_table(state.driver_stats, selected_drivers, seasons)
+
+
+def team_page(state):
+    for season in state.seasons:
+        team_standings(stats_for_season(state.team_stats, season))['Points']
+        podium_finishes(stats_for_season(state.team_stats, season))
+
+
+def race_page(state):
+    for season in state.seasons:
+        track_points(select_season(state.data, season), season_offsets(state.offsets, season))
+    for season in state.seasons:
+        championship = state.championships[season]
+        standings = championship.standings()
+        championship.history(championship.cumulative_points, standings.index[:5])
+    for season in state.seasons:
+        dnf_counts(stats_for_season(state.driver_stats, season))
+        season_data = select_season(state.data, season)
+        retirement_breakdown(season_data, 'Team')
+        finish_rates(season_data, 'Team')
+
+
+def track_page(state):
+    season = state.seasons[0]
+    offsets = season_offsets(state.offsets, season)
+    season_data = select_season(state.data, season)
+    track_competitiveness(season_data)
+    dnf_rates(season_data, offsets)
+    fastest_lap_trend(season_data, offsets)
+    gap_to_winner(season_data).head(10)
+    fastest_lap_deficit(season_data, gap_to_winner(season_data).index[:5], state.driver_index, offsets)
+
+
+def advanced_page(state):
+    seasons = state.seasons
+    for season in seasons:
+        most_consistent = consistency(stats_for_season(state.driver_stats, season)).head(10)
+        # run_bootstrap, cached per season in the app
+        error_bars(bootstrap_intervals(select_season(state.data, season)), most_consistent.index, 'Position Std')
+    for season in seasons:
+        top_drivers = driver_standings(stats_for_season(state.driver_stats, season)).head(8)
+        state.track_points[season].matrix(top_drivers.index)
+    for season in seasons:
+        select_season(state.data, season)['Position']
+    combined_data = state.data.loc[state.data['Season'].isin(seasons), ['Position', 'Points', 'Season']]
+    combined_data[combined_data['Position'] <= 10].astype({'Season': int})
+    size = max(len(state.grid_finish[season]) for season in seasons)
+    slots = range(1, size + 1)
+    finish_given_grid(sum(state.grid_finish[season].reindex(index=slots, columns=slots, fill_value=0)
+                          for season in seasons))
+    pd.DataFrame({
+        f'{season} Season': season_summary(select_season(state.data, season),
+                                          stats_for_season(state.driver_stats, season),
+                                          stats_for_season(state.team_stats, season),
+                                          season_offsets(state.offsets, season))
+        for season in seasons
+    })
+
+
+def title_simulator_page(state):
+    season = state.seasons[-1]
+    season_data = select_season(state.data, season)
+    int(season_data['Round'].max())
+    # The page's default of 100,000 simulated seasons; run_title_simulation in the app
+    simulate_championship(season_data, 12, 100_000, 0, driver_index=state.driver_index,
+                          offsets=season_offsets(state.offsets, season))
+
+
+PAGES = {
+    'show_enhanced_overview': overview_page,
+    'show_driver_analysis': driver_page,
+    'show_team_analysis': team_page,
+    'show_race_analysis': race_page,
+    'show_track_analysis': track_page,
+    'show_advanced_analytics': advanced_page,
+    'show_title_simulator': title_simulator_page,
+}
+
+
+@pytest.mark.parametrize('page', PAGES)
+def test_page(benchmark, loaded, page):
+    run(benchmark, lambda: PAGES[page](loaded), len(loaded.data))
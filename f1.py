@@ -1,373 +1,435 @@
-#Initial setup
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
-from matplotlib.patches import Patch
+"""Batch Formula 1 report: every chart for every season as PNG/SVG plus an HTML index
+
+Run from the directory holding the season CSVs:
+
+    python f1.py --output report
+
+Charts are rendered in parallel across a process pool with the Agg backend.
+Each chart's input data hash, with a hash of this script and the engine
+that draw it, is kept in the output folder's manifest.json, so charts
+whose season data and code have not changed are skipped on the next run.
+"""
+import argparse
+import html
+import json
+import os
+import time
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt  # noqa: E402
+import pandas as pd  # noqa: E402
+import seaborn as sns  # noqa: E402
+
+import f1_engine  # noqa: E402
+from f1_engine import (average_position, consistency, dataset_fingerprint, dnf_counts, dnf_rates,  # noqa: E402
+                       driver_season_stats, driver_standings, driver_track_matrix, error_bars, finish_given_grid,
+                       grid_finish_counts, load_seasons, podium_finishes, positions_gained, race_wins,
+                       retirement_breakdown, round_offsets, season_bootstrap, season_list, season_offsets,
+                       season_summary, select_season, stats_for_season, team_season_stats, team_standings,
+                       track_competitiveness, track_points)
+from result_cache import source_fingerprint  # noqa: E402
 warnings.filterwarnings('ignore')
 
+MANIFEST = 'manifest.json'
 
-# Use working matplotlib style
-try:
-    plt.style.use('seaborn-darkgrid')
-except:
-    plt.style.use('default')
-
-sns.set_palette("husl")
-
-# Load datasets
-season_2024 = pd.read_csv('Formula1_2024season_raceResults.csv')
-season_2025 = pd.read_csv('Formula1_2025Season_RaceResults.csv')
-
-# Add season columns
-season_2024['Season'] = 2024
-season_2025['Season'] = 2025
-
-# Fix Position column - convert to numeric, handling non-numeric values
-season_2024['Position'] = pd.to_numeric(season_2024['Position'], errors='coerce')
-season_2025['Position'] = pd.to_numeric(season_2025['Position'], errors='coerce')
-
-# Fix Points column
-season_2024['Points'] = pd.to_numeric(season_2024['Points'], errors='coerce').fillna(0)
-season_2025['Points'] = pd.to_numeric(season_2025['Points'], errors='coerce').fillna(0)
+# Loaded once per worker process by _init_worker
+_state = {}
 
-print("Data loaded successfully!")
-print("2024 Season Shape:", season_2024.shape)
-print("2025 Season Shape:", season_2025.shape)
 
-# Set style for better-looking plots
-plt.style.use('seaborn-darkgrid')
-sns.set_palette("husl")
-
-# Load the datasets
-season_2024 = pd.read_csv('Formula1_2024season_raceResults.csv')
-season_2025 = pd.read_csv('Formula1_2025Season_RaceResults.csv')
-
-# Add season columns for easier analysis
-season_2024['Season'] = 2024
-season_2025['Season'] = 2025
-
-# Basic data cleaning
-season_2024['Points'] = pd.to_numeric(season_2024['Points'], errors='coerce')
-season_2025['Points'] = pd.to_numeric(season_2025['Points'], errors='coerce')
-
-# Fill NaN points with 0
-season_2024['Points'] = season_2024['Points'].fillna(0)
-season_2025['Points'] = season_2025['Points'].fillna(0)
+#Initial setup
+def _init_worker(data_dir, intervals):
+    """Load the seasons and set the plot style once per process
+
+    intervals holds the bootstrap intervals of every season with a stale
+    bootstrap chart, computed once in the parent and shared by its charts.
+    """
+    try:
+        plt.style.use('seaborn-v0_8-darkgrid')
+    except OSError:
+        plt.style.use('default')
+    sns.set_palette("husl")
+
+    data = load_seasons(data_dir, max_workers=1)
+    _state['data'] = data
+    _state['driver_stats'] = driver_season_stats(data)
+    _state['team_stats'] = team_season_stats(data)
+    _state['offsets'] = round_offsets(data)
+    _state['intervals'] = intervals
 
-print("2024 Season Shape:", season_2024.shape)
-print("2025 Season Shape:", season_2025.shape)
-print("\nColumns:", season_2024.columns.tolist())
 
 #Driver Performance Analysis
-# Top 10 drivers by points - 2024 vs 2025
-fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-
-# Top drivers 2024
-top_drivers_2024 = season_2024.groupby('Driver')['Points'].sum().sort_values(ascending=False).head(10)
-axes[0,0].barh(range(len(top_drivers_2024)), top_drivers_2024.values, color='skyblue')
-axes[0,0].set_yticks(range(len(top_drivers_2024)))
-axes[0,0].set_yticklabels(top_drivers_2024.index)
-axes[0,0].set_title('Top 10 Drivers - 2024 Season Points')
-axes[0,0].set_xlabel('Total Points')
-
-# Top drivers 2025
-top_drivers_2025 = season_2025.groupby('Driver')['Points'].sum().sort_values(ascending=False).head(10)
-axes[0,1].barh(range(len(top_drivers_2025)), top_drivers_2025.values, color='lightcoral')
-axes[0,1].set_yticks(range(len(top_drivers_2025)))
-axes[0,1].set_yticklabels(top_drivers_2025.index)
-axes[0,1].set_title('Top 10 Drivers - 2025 Season Points')
-axes[0,1].set_xlabel('Total Points')
-
-# Race wins comparison
-wins_2024 = season_2024[season_2024['Position'] == 1]['Driver'].value_counts().head(10)
-axes[1,0].bar(range(len(wins_2024)), wins_2024.values, color='gold')
-axes[1,0].set_xticks(range(len(wins_2024)))
-axes[1,0].set_xticklabels(wins_2024.index, rotation=45)
-axes[1,0].set_title('Race Wins - 2024 Season')
-axes[1,0].set_ylabel('Number of Wins')
-
-wins_2025 = season_2025[season_2025['Position'] == 1]['Driver'].value_counts().head(10)
-axes[1,1].bar(range(len(wins_2025)), wins_2025.values, color='orange')
-axes[1,1].set_xticks(range(len(wins_2025)))
-axes[1,1].set_xticklabels(wins_2025.index, rotation=45)
-axes[1,1].set_title('Race Wins - 2025 Season')
-axes[1,1].set_ylabel('Number of Wins')
-
-plt.tight_layout()
-plt.show()
-
-# Team Performance Analysis
-# Team performance comparison
-fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-
-# Team points 2024
-team_points_2024 = season_2024.groupby('Team')['Points'].sum().sort_values(ascending=False)
-axes[0,0].pie(team_points_2024.values, labels=team_points_2024.index, autopct='%1.1f%%', startangle=90)
-axes[0,0].set_title('Team Points Distribution - 2024')
-
-# Team points 2025
-team_points_2025 = season_2025.groupby('Team')['Points'].sum().sort_values(ascending=False)
-axes[0,1].pie(team_points_2025.values, labels=team_points_2025.index, autopct='%1.1f%%', startangle=90)
-axes[0,1].set_title('Team Points Distribution - 2025')
-
-# Comprehensive data cleaning for both datasets
-def clean_race_data(df):
-    """Clean Formula 1 race data for analysis"""
-    df_clean = df.copy()
-    
-    # Convert Position to numeric, keeping original for reference
-    df_clean['Position_Original'] = df_clean['Position']
-    df_clean['Position'] = pd.to_numeric(df_clean['Position'], errors='coerce')
-    
-    # Convert Points to numeric
-    df_clean['Points'] = pd.to_numeric(df_clean['Points'], errors='coerce').fillna(0)
-    
-    # Convert Starting Grid to numeric if it exists
-    if 'Starting Grid' in df_clean.columns:
-        df_clean['Starting Grid'] = pd.to_numeric(df_clean['Starting Grid'], errors='coerce')
-    
-    return df_clean
-
-# Apply cleaning
-season_2024 = clean_race_data(season_2024)
-season_2025 = clean_race_data(season_2025)
-
-# Now your original code will work
-podiums_2024 = season_2024[season_2024['Position'] <= 3]['Team'].value_counts()
-podiums_2025 = season_2025[season_2025['Position'] <= 3]['Team'].value_counts()
+def chart_top_drivers(season, season_data, drivers, teams):
+    top_drivers = driver_standings(drivers)['Points'].head(10)
+    fig, ax = plt.subplots(figsize=(10, 7))
+    ax.barh(range(len(top_drivers)), top_drivers.values, color='skyblue')
+    ax.set_yticks(range(len(top_drivers)))
+    ax.set_yticklabels(top_drivers.index)
+    ax.invert_yaxis()
+    ax.set_title(f'Top 10 Drivers - {season} Season Points')
+    ax.set_xlabel('Total Points')
+    return fig
+
+
+def chart_race_wins(season, season_data, drivers, teams):
+    wins = race_wins(drivers).head(10)
+    fig, ax = plt.subplots(figsize=(10, 7))
+    ax.bar(range(len(wins)), wins.values, color='gold')
+    ax.set_xticks(range(len(wins)))
+    ax.set_xticklabels(wins.index, rotation=45)
+    ax.set_title(f'Race Wins - {season} Season')
+    ax.set_ylabel('Number of Wins')
+    return fig
+
+
+#Team Performance Analysis
+def chart_team_points(season, season_data, drivers, teams):
+    team_points = team_standings(teams)['Points']
+    fig, ax = plt.subplots(figsize=(10, 10))
+    ax.pie(team_points.values, labels=team_points.index, autopct='%1.1f%%', startangle=90)
+    ax.set_title(f'Team Points Distribution - {season}')
+    return fig
+
+
+def chart_team_podiums(season, season_data, drivers, teams):
+    podiums = podium_finishes(teams)
+    fig, ax = plt.subplots(figsize=(10, 7))
+    ax.bar(range(len(podiums)), podiums.values, color='mediumseagreen')
+    ax.set_xticks(range(len(podiums)))
+    ax.set_xticklabels(podiums.index, rotation=45)
+    ax.set_title(f'Podium Finishes by Team - {season}')
+    ax.set_ylabel('Number of Podiums')
+    return fig
 
 
 #Race-by-Race Analysis
-# Track performance analysis
-fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-
-# Points distribution by track - 2024
-track_points_2024 = season_2024.groupby('Track')['Points'].sum()
-axes[0,0].plot(range(len(track_points_2024)), track_points_2024.values, 'o-', color='blue', linewidth=2, markersize=6)
-axes[0,0].set_title('Points Distribution by Track - 2024')
-axes[0,0].set_xlabel('Race Number')
-axes[0,0].set_ylabel('Total Points Awarded')
-axes[0,0].grid(True, alpha=0.3)
-
-# Points distribution by track - 2025
-track_points_2025 = season_2025.groupby('Track')['Points'].sum()
-axes[0,1].plot(range(len(track_points_2025)), track_points_2025.values, 'o-', color='red', linewidth=2, markersize=6)
-axes[0,1].set_title('Points Distribution by Track - 2025')
-axes[0,1].set_xlabel('Race Number')
-axes[0,1].set_ylabel('Total Points Awarded')
-axes[0,1].grid(True, alpha=0.3)
-
-# DNF analysis
-dnf_2024 = season_2024[season_2024['Time/Retired'] == 'DNF']['Driver'].value_counts()
-if not dnf_2024.empty:
-    axes[1,0].bar(dnf_2024.index[:10], dnf_2024.values[:10], color='crimson')
-    axes[1,0].set_title('DNF (Did Not Finish) Count - 2024')
-    axes[1,0].set_ylabel('Number of DNFs')
-    axes[1,0].tick_params(axis='x', rotation=45)
-
-dnf_2025 = season_2025[season_2025['Time/Retired'] == 'DNF']['Driver'].value_counts()
-if not dnf_2025.empty:
-    axes[1,1].bar(dnf_2025.index[:10], dnf_2025.values[:10], color='darkred')
-    axes[1,1].set_title('DNF (Did Not Finish) Count - 2025')
-    axes[1,1].set_ylabel('Number of DNFs')
-    axes[1,1].tick_params(axis='x', rotation=45)
-
-plt.tight_layout()
-plt.show()
+def chart_track_points(season, season_data, drivers, teams):
+    points_by_track = track_points(season_data, season_offsets(_state['offsets'], season))
+    fig, ax = plt.subplots(figsize=(12, 7))
+    ax.plot(range(1, len(points_by_track) + 1), points_by_track.values, 'o-', color='blue', linewidth=2,
+            markersize=6)
+    ax.set_title(f'Points Distribution by Track - {season}')
+    ax.set_xlabel('Race Number')
+    ax.set_ylabel('Total Points Awarded')
+    ax.grid(True, alpha=0.3)
+    return fig
+
+
+def chart_dnf_counts(season, season_data, drivers, teams):
+    dnf = dnf_counts(drivers).head(10)
+    fig, ax = plt.subplots(figsize=(10, 7))
+    ax.bar(dnf.index, dnf.values, color='crimson')
+    ax.set_title(f'DNF (Did Not Finish) Count - {season}')
+    ax.set_ylabel('Number of DNFs')
+    ax.tick_params(axis='x', rotation=45)
+    return fig
 
-#Statistical Analysis and Heatmaps
-# Performance heatmap
-fig, axes = plt.subplots(1, 2, figsize=(20, 8))
-
-# Create driver-track performance matrix for 2024
-driver_track_2024 = season_2024.pivot_table(values='Points', index='Driver', columns='Track', aggfunc='sum', fill_value=0)
-top_drivers_list_2024 = top_drivers_2024.head(8).index.tolist()
-driver_track_2024_filtered = driver_track_2024.loc[driver_track_2024.index.isin(top_drivers_list_2024)]
-
-sns.heatmap(driver_track_2024_filtered, annot=True, fmt='.0f', cmap='YlOrRd', ax=axes[0])
-axes[0].set_title('Driver Performance by Track - 2024 (Top 8 Drivers)')
-axes[0].set_ylabel('Driver')
-axes[0].set_xlabel('Track')
 
-# Create driver-track performance matrix for 2025
-driver_track_2025 = season_2025.pivot_table(values='Points', index='Driver', columns='Track', aggfunc='sum', fill_value=0)
-top_drivers_list_2025 = top_drivers_2025.head(8).index.tolist()
-driver_track_2025_filtered = driver_track_2025.loc[driver_track_2025.index.isin(top_drivers_list_2025)]
-
-sns.heatmap(driver_track_2025_filtered, annot=True, fmt='.0f', cmap='YlGnBu', ax=axes[1])
-axes[1].set_title('Driver Performance by Track - 2025 (Top 8 Drivers)')
-axes[1].set_ylabel('Driver')
-axes[1].set_xlabel('Track')
+#Statistical Analysis and Heatmaps
+def chart_driver_track_heatmap(season, season_data, drivers, teams):
+    top_drivers = driver_standings(drivers).head(8)
+    fig, ax = plt.subplots(figsize=(20, 8))
+    sns.heatmap(driver_track_matrix(season_data, top_drivers.index), annot=True, fmt='.0f', cmap='YlOrRd', ax=ax)
+    ax.set_title(f'Driver Performance by Track - {season} (Top 8 Drivers)')
+    ax.set_ylabel('Driver')
+    ax.set_xlabel('Track')
+    return fig
 
-plt.tight_layout()
-plt.show()
 
 #Position Distribution Analysis
-# Position distribution analysis
-fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-
-# Position histogram 2024
-position_dist_2024 = season_2024['Position'].value_counts().sort_index()
-axes[0,0].hist(season_2024['Position'], bins=20, alpha=0.7, color='skyblue', edgecolor='black')
-axes[0,0].set_title('Position Distribution - 2024')
-axes[0,0].set_xlabel('Finishing Position')
-axes[0,0].set_ylabel('Frequency')
-
-# Position histogram 2025
-axes[0,1].hist(season_2025['Position'], bins=20, alpha=0.7, color='lightgreen', edgecolor='black')
-axes[0,1].set_title('Position Distribution - 2025')
-axes[0,1].set_xlabel('Finishing Position')
-axes[0,1].set_ylabel('Frequency')
-
-# Boxplot of points by position
-combined_data = pd.concat([season_2024[['Position', 'Points', 'Season']], 
-                          season_2025[['Position', 'Points', 'Season']]])
-
-# Filter to top 10 positions for better visualization
-top_10_positions = combined_data[combined_data['Position'] <= 10]
-
-sns.boxplot(data=top_10_positions, x='Position', y='Points', hue='Season', ax=axes[1,0])
-axes[1,0].set_title('Points Distribution by Position (Top 10)')
-axes[1,0].set_xlabel('Finishing Position')
-axes[1,0].set_ylabel('Points Scored')
-
-# Scatter plot: Starting Grid vs Finishing Position
-axes[1,1].scatter(season_2024['Starting Grid'], season_2024['Position'], 
-                  alpha=0.6, color='blue', label='2024', s=30)
-axes[1,1].scatter(season_2025['Starting Grid'], season_2025['Position'], 
-                  alpha=0.6, color='red', label='2025', s=30)
-axes[1,1].set_title('Starting Grid vs Finishing Position')
-axes[1,1].set_xlabel('Starting Grid Position')
-axes[1,1].set_ylabel('Finishing Position')
-axes[1,1].legend()
-axes[1,1].plot([1, 20], [1, 20], 'k--', alpha=0.5)  # Perfect correlation line
-
-plt.tight_layout()
-plt.show()
+def chart_position_histogram(season, season_data, drivers, teams):
+    fig, ax = plt.subplots(figsize=(10, 7))
+    ax.hist(season_data['Position'].dropna(), bins=20, alpha=0.7, color='skyblue', edgecolor='black')
+    ax.set_title(f'Position Distribution - {season}')
+    ax.set_xlabel('Finishing Position')
+    ax.set_ylabel('Frequency')
+    return fig
+
 
 #Advanced Analytics
-# Advanced analytics
-fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-
-# Consistency analysis - Standard deviation of positions
-consistency_2024 = season_2024.groupby('Driver')['Position'].std().sort_values()
-top_consistent_2024 = consistency_2024.head(10)
-axes[0,0].barh(range(len(top_consistent_2024)), top_consistent_2024.values, color='lightblue')
-axes[0,0].set_yticks(range(len(top_consistent_2024)))
-axes[0,0].set_yticklabels(top_consistent_2024.index)
-axes[0,0].set_title('Most Consistent Drivers 2024 (Lower = More Consistent)')
-axes[0,0].set_xlabel('Position Standard Deviation')
-
-consistency_2025 = season_2025.groupby('Driver')['Position'].std().sort_values()
-top_consistent_2025 = consistency_2025.head(10)
-axes[0,1].barh(range(len(top_consistent_2025)), top_consistent_2025.values, color='lightcoral')
-axes[0,1].set_yticks(range(len(top_consistent_2025)))
-axes[0,1].set_yticklabels(top_consistent_2025.index)
-axes[0,1].set_title('Most Consistent Drivers 2025 (Lower = More Consistent)')
-axes[0,1].set_xlabel('Position Standard Deviation')
-
-# Average finishing position
-avg_position_2024 = season_2024.groupby('Driver')['Position'].mean().sort_values().head(10)
-axes[1,0].bar(range(len(avg_position_2024)), avg_position_2024.values, color='gold')
-axes[1,0].set_xticks(range(len(avg_position_2024)))
-axes[1,0].set_xticklabels(avg_position_2024.index, rotation=45)
-axes[1,0].set_title('Best Average Finishing Position - 2024')
-axes[1,0].set_ylabel('Average Position')
-
-avg_position_2025 = season_2025.groupby('Driver')['Position'].mean().sort_values().head(10)
-axes[1,1].bar(range(len(avg_position_2025)), avg_position_2025.values, color='silver')
-axes[1,1].set_xticks(range(len(avg_position_2025)))
-axes[1,1].set_xticklabels(avg_position_2025.index, rotation=45)
-axes[1,1].set_title('Best Average Finishing Position - 2025')
-axes[1,1].set_ylabel('Average Position')
-
-plt.tight_layout()
-plt.show()
+def chart_consistency(season, season_data, drivers, teams):
+    most_consistent = consistency(drivers).head(10)
+    errors = error_bars(_state['intervals'][season], most_consistent.index, 'Position Std')
+    fig, ax = plt.subplots(figsize=(10, 7))
+    ax.barh(range(len(most_consistent)), most_consistent.values, xerr=errors, capsize=4, color='lightblue')
+    ax.set_yticks(range(len(most_consistent)))
+    ax.set_yticklabels(most_consistent.index)
+    ax.invert_yaxis()
+    ax.set_title(f'Most Consistent Drivers {season} (Lower = More Consistent)')
+    ax.set_xlabel('Position Standard Deviation (95% bootstrap interval)')
+    return fig
+
+
+def chart_average_position(season, season_data, drivers, teams):
+    best_average = average_position(drivers).head(10)
+    errors = error_bars(_state['intervals'][season], best_average.index, 'Average Position')
+    fig, ax = plt.subplots(figsize=(10, 7))
+    ax.bar(range(len(best_average)), best_average.values, yerr=errors, capsize=4, color='gold')
+    ax.set_xticks(range(len(best_average)))
+    ax.set_xticklabels(best_average.index, rotation=45)
+    ax.set_title(f'Best Average Finishing Position - {season}')
+    ax.set_ylabel('Average Position (95% bootstrap interval)')
+    return fig
 
-#Summary Statistics and Tables
-# Create comprehensive summary statistics
-print("=== COMPREHENSIVE FORMULA 1 ANALYSIS SUMMARY ===\n")
-
-# Season comparison table
-season_stats = pd.DataFrame({
-    '2024 Season': [
-        len(season_2024['Track'].unique()),
-        len(season_2024['Driver'].unique()),
-        len(season_2024['Team'].unique()),
-        season_2024[season_2024['Position'] == 1]['Driver'].value_counts().iloc[0],
-        season_2024[season_2024['Position'] == 1]['Driver'].value_counts().index[0],
-        season_2024.groupby('Driver')['Points'].sum().max(),
-        season_2024.groupby('Driver')['Points'].sum().idxmax()
-    ],
-    '2025 Season': [
-        len(season_2025['Track'].unique()),
-        len(season_2025['Driver'].unique()),
-        len(season_2025['Team'].unique()),
-        season_2025[season_2025['Position'] == 1]['Driver'].value_counts().iloc[0],
-        season_2025[season_2025['Position'] == 1]['Driver'].value_counts().index[0],
-        season_2025.groupby('Driver')['Points'].sum().max(),
-        season_2025.groupby('Driver')['Points'].sum().idxmax()
-    ]
-}, index=['Total Races', 'Total Drivers', 'Total Teams', 'Most Wins Count', 
-          'Most Wins Driver', 'Highest Points', 'Points Leader'])
-
-print("Season Comparison:")
-print(season_stats)
-print("\n" + "="*60)
-
-# Top 5 drivers points comparison
-print("\nTop 5 Drivers Points Comparison:")
-comparison_df = pd.DataFrame({
-    '2024_Driver': top_drivers_2024.head().index,
-    '2024_Points': top_drivers_2024.head().values,
-    '2025_Driver': top_drivers_2025.head().index,
-    '2025_Points': top_drivers_2025.head().values
-})
-print(comparison_df)
 
 # Qualifying performance impact on race results
-fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-
-# Starting grid position vs points correlation
-correlation_2024 = season_2024[['Starting Grid', 'Points']].corr().iloc[0,1]
-axes[0,0].scatter(season_2024['Starting Grid'], season_2024['Points'], alpha=0.6)
-axes[0,0].set_title(f'Qualifying vs Points - 2024 (Correlation: {correlation_2024:.3f})')
-axes[0,0].set_xlabel('Starting Grid Position')
-axes[0,0].set_ylabel('Points Scored')
+def chart_grid_vs_points(season, season_data, drivers, teams):
+    grid = season_data['Starting Grid'].astype(float)
+    points = season_data['Points'].astype(float)
+    fig, ax = plt.subplots(figsize=(10, 7))
+    ax.scatter(grid, points, alpha=0.6)
+    ax.set_title(f'Qualifying vs Points - {season} (Correlation: {grid.corr(points):.3f})')
+    ax.set_xlabel('Starting Grid Position')
+    ax.set_ylabel('Points Scored')
+    return fig
+
+
+def chart_positions_gained(season, season_data, drivers, teams):
+    gainers = positions_gained(drivers).head(10)
+    fig, ax = plt.subplots(figsize=(10, 7))
+    ax.barh(range(len(gainers)), gainers.values, color='green')
+    ax.set_yticks(range(len(gainers)))
+    ax.set_yticklabels(gainers.index)
+    ax.invert_yaxis()
+    ax.set_title(f'Average Positions Gained/Lost - {season}')
+    ax.set_xlabel('Average Position Change')
+    return fig
 
-# Position gained/lost analysis
-season_2024['Positions_Changed'] = season_2024['Starting Grid'] - season_2024['Position']
-position_gainers = season_2024.groupby('Driver')['Positions_Changed'].mean().sort_values(ascending=False).head(10)
-
-axes[0,1].barh(range(len(position_gainers)), position_gainers.values, color='green')
-axes[0,1].set_yticks(range(len(position_gainers)))
-axes[0,1].set_yticklabels(position_gainers.index)
-axes[0,1].set_title('Average Positions Gained/Lost - 2024')
-axes[0,1].set_xlabel('Average Position Change')
 
 # Track difficulty and characteristics analysis
-def analyze_track_characteristics():
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-    
-    # Average finishing position spread by track (competitiveness)
-    track_spread_2024 = season_2024.groupby('Track')['Position'].std().sort_values(ascending=False)
-    axes[0,0].bar(range(len(track_spread_2024)), track_spread_2024.values, color='skyblue')
-    axes[0,0].set_xticks(range(len(track_spread_2024)))
-    axes[0,0].set_xticklabels(track_spread_2024.index, rotation=45)
-    axes[0,0].set_title('Track Competitiveness (Higher = More Unpredictable)')
-    axes[0,0].set_ylabel('Position Standard Deviation')
-    
-    # DNF rates by track (reliability challenge)
-    dnf_by_track = season_2024[season_2024['Time/Retired'] == 'DNF'].groupby('Track').size()
-    total_by_track = season_2024.groupby('Track').size()
-    dnf_rates = (dnf_by_track / total_by_track * 100).fillna(0)
-    
-    axes[0,1].bar(range(len(dnf_rates)), dnf_rates.values, color='red', alpha=0.7)
-    axes[0,1].set_xticks(range(len(dnf_rates)))
-    axes[0,1].set_xticklabels(dnf_rates.index, rotation=45)
-    axes[0,1].set_title('DNF Rate by Track (%)')
-    axes[0,1].set_ylabel('DNF Percentage')
+def chart_track_competitiveness(season, season_data, drivers, teams):
+    track_spread = track_competitiveness(season_data)
+    fig, ax = plt.subplots(figsize=(12, 7))
+    ax.bar(range(len(track_spread)), track_spread.values, color='skyblue')
+    ax.set_xticks(range(len(track_spread)))
+    ax.set_xticklabels(track_spread.index, rotation=45)
+    ax.set_title(f'Track Competitiveness - {season} (Higher = More Unpredictable)')
+    ax.set_ylabel('Position Standard Deviation')
+    return fig
+
+
+def chart_track_dnf_rates(season, season_data, drivers, teams):
+    rates = dnf_rates(season_data, season_offsets(_state['offsets'], season))
+    fig, ax = plt.subplots(figsize=(12, 7))
+    ax.bar(range(len(rates)), rates.values, color='red', alpha=0.7)
+    ax.set_xticks(range(len(rates)))
+    ax.set_xticklabels(rates.index, rotation=45)
+    ax.set_title(f'DNF Rate by Track (%) - {season}')
+    ax.set_ylabel('DNF Percentage')
+    return fig
+
+
+# Charts comparing every season at once
+def chart_points_by_position(data, seasons):
+    top_10_positions = data.loc[data['Position'] <= 10, ['Position', 'Points', 'Season']]
+    top_10_positions = top_10_positions.astype({'Position': int, 'Points': float, 'Season': int})
+    fig, ax = plt.subplots(figsize=(12, 7))
+    sns.boxplot(data=top_10_positions, x='Position', y='Points', hue='Season', ax=ax)
+    ax.set_title('Points Distribution by Position (Top 10)')
+    ax.set_xlabel('Finishing Position')
+    ax.set_ylabel('Points Scored')
+    return fig
+
+
+def chart_grid_vs_finish(data, seasons):
+    # P(finish | grid) over every season as one heatmap - its cost is the grid size, not the row count
+    probabilities = finish_given_grid(grid_finish_counts(data))
+    size = len(probabilities)
+    fig, ax = plt.subplots(figsize=(10, 8))
+    image = ax.imshow(probabilities.to_numpy().T, origin='lower', cmap='viridis',
+                      extent=(0.5, size + 0.5, 0.5, size + 0.5))
+    fig.colorbar(image, ax=ax, label='P(finishing position | starting slot)')
+    ax.set_title(f'Starting Grid vs Finishing Position ({seasons[0]}-{seasons[-1]})')
+    ax.set_xlabel('Starting Grid Position')
+    ax.set_ylabel('Finishing Position')
+    ax.plot([1, size], [1, size], 'w--', alpha=0.5)  # Perfect correlation line
+    return fig
+
+
+SEASON_CHARTS = {
+    'top_drivers': chart_top_drivers,
+    'race_wins': chart_race_wins,
+    'team_points': chart_team_points,
+    'team_podiums': chart_team_podiums,
+    'track_points': chart_track_points,
+    'dnf_counts': chart_dnf_counts,
+    'driver_track_heatmap': chart_driver_track_heatmap,
+    'position_histogram': chart_position_histogram,
+    'consistency': chart_consistency,
+    'average_position': chart_average_position,
+    'grid_vs_points': chart_grid_vs_points,
+    'positions_gained': chart_positions_gained,
+    'track_competitiveness': chart_track_competitiveness,
+    'track_dnf_rates': chart_track_dnf_rates,
+}
+
+# Season charts drawn with bootstrap intervals
+BOOTSTRAP_CHARTS = {'consistency', 'average_position'}
+
+OVERVIEW_CHARTS = {
+    'points_by_position': chart_points_by_position,
+    'grid_vs_finish': chart_grid_vs_finish,
+}
+
+
+def render_chart(job):
+    """Draw one chart in a worker and save it in every format; returns the job"""
+    name, season, stem, formats = job
+    data = _state['data']
+    if season is None:
+        fig = OVERVIEW_CHARTS[name](data, season_list(data))
+    else:
+        fig = SEASON_CHARTS[name](season, select_season(data, season),
+                                  stats_for_season(_state['driver_stats'], season),
+                                  stats_for_season(_state['team_stats'], season))
+    try:
+        fig.tight_layout()
+        for file_format in formats:
+            fig.savefig(f'{stem}.{file_format}', format=file_format, dpi=100)
+    finally:
+        plt.close(fig)
+    return job
+
+
+def chart_jobs(data, output_dir, formats):
+    """(name, season, file stem, formats) for every chart, with its input data hash"""
+    jobs = []
+    for season in season_list(data):
+        season_hash = dataset_fingerprint(select_season(data, season))
+        for name in SEASON_CHARTS:
+            jobs.append(((name, season, os.path.join(output_dir, str(season), name), formats), season_hash))
+    all_hash = dataset_fingerprint(data)
+    for name in OVERVIEW_CHARTS:
+        jobs.append(((name, None, os.path.join(output_dir, 'overview', name), formats), all_hash))
+    return jobs
+
+
+def report_version():
+    """Hash of the code that draws the charts, so editing it redraws existing files"""
+    return source_fingerprint([os.path.abspath(__file__), os.path.dirname(os.path.abspath(f1_engine.__file__))])
+
+
+def read_manifest(output_dir):
+    try:
+        with open(os.path.join(output_dir, MANIFEST)) as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_manifest(output_dir, manifest):
+    path = os.path.join(output_dir, MANIFEST)
+    with open(path + '.tmp', 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=1, sort_keys=True)
+    os.replace(path + '.tmp', path)
 
 
+#Summary Statistics and Tables
+def summary_tables(data):
+    """Season comparison and non-finish tables for the index page"""
+    driver_stats = driver_season_stats(data)
+    team_stats = team_season_stats(data)
+    offsets = round_offsets(data)
+    seasons = season_list(data)
+    season_stats = pd.DataFrame({
+        f'{season} Season': season_summary(select_season(data, season), stats_for_season(driver_stats, season),
+                                          stats_for_season(team_stats, season), season_offsets(offsets, season))
+        for season in seasons
+    })
+    breakdowns = {season: retirement_breakdown(select_season(data, season), 'Team') for season in seasons}
+    return season_stats, breakdowns
+
+
+def write_index(output_dir, data, jobs, formats):
+    """One static HTML page linking every chart, grouped by season"""
+    season_stats, breakdowns = summary_tables(data)
+    image_format = 'png' if 'png' in formats else formats[0]
+
+    sections = {}
+    for (name, season, stem, _), _ in jobs:
+        sections.setdefault(season, []).append((name, os.path.relpath(stem, output_dir)))
+
+    parts = ['<!DOCTYPE html><html><head><meta charset="utf-8"><title>Formula 1 Report</title>',
+             '<style>body{font-family:sans-serif;margin:2em}img{max-width:48%;margin:0.5%}'
+             'table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:4px 8px}</style></head><body>',
+             '<h1>Formula 1 Report</h1>', '<h2>Season Comparison</h2>', season_stats.to_html()]
+    for season, charts in sections.items():
+        title = 'All Seasons' if season is None else f'{season} Season'
+        parts.append(f'<h2>{html.escape(title)}</h2>')
+        if season is not None and not breakdowns[season].empty:
+            parts.append('<h3>Non-Finishes by Team and Cause</h3>' + breakdowns[season].to_html())
+        for name, path in charts:
+            links = ' '.join(f'<a href="{html.escape(path)}.{file_format}">{file_format}</a>'
+                             for file_format in formats)
+            parts.append(f'<figure style="display:inline-block;width:48%"><img style="max-width:100%" '
+                         f'src="{html.escape(path)}.{image_format}" alt="{html.escape(name)}">'
+                         f'<figcaption>{html.escape(name)} ({links})</figcaption></figure>')
+    parts.append('</body></html>')
+
+    with open(os.path.join(output_dir, 'index.html'), 'w') as index_file:
+        index_file.write('\n'.join(parts))
+
+
+def build_report(data_dir='.', output_dir='report', formats=('png', 'svg'), max_workers=None, force=False):
+    """Render every stale chart and rewrite the index; returns (rendered, skipped)"""
+    data = load_seasons(data_dir)
+    formats = list(formats)
+    jobs = chart_jobs(data, output_dir, formats)
+
+    manifest = {} if force else read_manifest(output_dir)
+    version = report_version()
+    stale = []
+    for job, data_hash in jobs:
+        stem = job[2]
+        key = os.path.relpath(stem, output_dir)
+        up_to_date = (manifest.get(key) == [version, data_hash, formats]
+                      and all(os.path.exists(f'{stem}.{file_format}') for file_format in formats))
+        if not up_to_date:
+            stale.append((job, key, data_hash))
+
+    for job, _, _ in stale:
+        os.makedirs(os.path.dirname(job[2]), exist_ok=True)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    bootstrap_seasons = {job[1] for job, _, _ in stale if job[0] in BOOTSTRAP_CHARTS}
+    intervals = (season_bootstrap(data[data['Season'].isin(bootstrap_seasons)], max_workers=max_workers)
+                 if bootstrap_seasons else {})
+
+    max_workers = max(1, min(max_workers, len(stale)))
+    if stale and max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(data_dir, intervals)) as pool:
+            list(pool.map(render_chart, [job for job, _, _ in stale]))
+    elif stale:
+        _init_worker(data_dir, intervals)
+        for job, _, _ in stale:
+            render_chart(job)
+
+    os.makedirs(output_dir, exist_ok=True)
+    for _, key, data_hash in stale:
+        manifest[key] = [version, data_hash, formats]
+    write_manifest(output_dir, manifest)
+    write_index(output_dir, data, jobs, formats)
+    return len(stale), len(jobs) - len(stale)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--data-dir', default='.', help='folder holding the season CSVs')
+    parser.add_argument('--output', default='report', help='folder the report is written to')
+    parser.add_argument('--formats', default='png,svg', help='comma separated image formats')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='redraw every chart even if its data is unchanged')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rendered, skipped = build_report(args.data_dir, args.output, args.formats.split(','), args.workers, args.force)
+    print(f"Rendered {rendered} charts, skipped {skipped} unchanged, in {time.perf_counter() - start:.1f} s")
+    print(f"Report: {os.path.join(args.output, 'index.html')}")
+
+
+if __name__ == '__main__':
+    main()
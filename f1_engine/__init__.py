@@ -0,0 +1,19 @@
+"""Formula 1 race data engine shared by the dashboard and the analysis script"""
+from f1_engine.analytics import (TrackPoints, average_position, consistency, dnf_counts, dnf_rates,
+                                 driver_detail_table, driver_season_stats, driver_standings, driver_track_matrix,
+                                 fastest_lap_deficit, fastest_lap_trend, finish_given_grid, finish_rates,
+                                 gap_to_winner, grid_finish_counts, names_in_seasons, podium_finishes, positions_gained, race_wins,
+                                 retirement_breakdown, round_totals, season_grid_finish, season_summary,
+                                 season_track_points, stats_for_season, status_counts, team_season_stats,
+                                 team_standings, track_competitiveness, track_points)
+from f1_engine.bootstrap import bootstrap_intervals, error_bars, season_bootstrap
+from f1_engine.championship import Championship, season_championships
+from f1_engine.database import SeasonDatabase, build_season_database
+from f1_engine.data import (build_driver_index, build_season_store, clean_race_data, combine_seasons,
+                            dataset_fingerprint, discover_season_files, driver_positions, load_season,
+                            load_seasons, read_season_csv, round_offsets, season_list, season_offsets,
+                            select_season)
+from f1_engine.profiling import finish_run, profiled, span, start_run
+from f1_engine.simulation import simulate_championship
+from f1_engine.status import STATUSES, classify_status
+from f1_engine.timing import TIME_COLUMNS, parse_lap_times, parse_race_times
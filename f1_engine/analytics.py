@@ -0,0 +1,373 @@
+"""Headless race analytics - plain DataFrames and Series, no Streamlit or matplotlib
+
+Functions taking `data` work on the combined frame from load_seasons, those
+taking `season_data` on one season's rows (see select_season). The
+`season_drivers` / `season_teams` arguments are one season of the tables from
+driver_season_stats / team_season_stats, as returned by stats_for_season.
+Per-round functions take optional `offsets` for those rows - round_offsets
+of the frame, or season_offsets of a table built once at load time - and
+only scan for round boundaries themselves when none are given.
+"""
+import numpy as np
+import pandas as pd
+
+from f1_engine.data import driver_positions, round_offsets
+from f1_engine.profiling import profiled
+from f1_engine.status import NON_FINISHES, RETIRED, STATUSES, has_flag
+
+
+def _season_stats(data, key):
+    """One groupby pass producing the per-(Season, key) results table"""
+    # Plain float64 (NaN for unclassified) so the table has numpy dtypes
+    position = data['Position'].astype(np.float64)
+    flags = pd.DataFrame({
+        'Season': data['Season'],
+        key: data[key],
+        'Points': data['Points'],
+        'Position': position,
+        'Win': position.eq(1),
+        'Podium': position.le(3),
+        'DNF': has_flag(data, RETIRED),
+        'Positions Gained': data['Starting Grid'].astype(np.float64) - position,
+    })
+    return flags.groupby(['Season', key], observed=True).agg(
+        **{
+            'Points': ('Points', 'sum'),
+            'Wins': ('Win', 'sum'),
+            'Podiums': ('Podium', 'sum'),
+            'DNFs': ('DNF', 'sum'),
+            'Average Position': ('Position', 'mean'),
+            'Position Std': ('Position', 'std'),
+            'Races': ('Points', 'size'),
+            'Positions Gained': ('Positions Gained', 'mean'),
+        }
+    )
+
+
+@profiled
+def driver_season_stats(data):
+    """Points, wins, podiums, DNFs and position stats per (Season, Driver)"""
+    return _season_stats(data, 'Driver')
+
+
+@profiled
+def team_season_stats(data):
+    """Points, wins, podiums, DNFs and position stats per (Season, Team)"""
+    return _season_stats(data, 'Team')
+
+
+@profiled
+def driver_detail_table(driver_stats, drivers, seasons):
+    """Detailed statistics rows for the chosen drivers, ordered by driver then season"""
+    table = driver_stats.reset_index()
+    table = table[table['Driver'].isin(drivers) & table['Season'].isin(seasons)]
+
+    # Keep the order the drivers were selected in
+    driver_order = table['Driver'].astype(object).map({driver: i for i, driver in enumerate(dict.fromkeys(drivers))})
+    table = table.assign(_order=driver_order).sort_values(['_order', 'Season'], kind='stable')
+
+    return pd.DataFrame({
+        'Driver': table['Driver'].astype(str).to_numpy(),
+        'Season': table['Season'].astype(str).to_numpy(),
+        'Total Points': table['Points'].to_numpy(),
+        'Average Position': table['Average Position'].round(2).to_numpy(),
+        'Wins': table['Wins'].to_numpy(),
+        'Podiums': table['Podiums'].to_numpy(),
+        'DNFs': table['DNFs'].to_numpy(),
+        'Races': table['Races'].to_numpy(),
+    })
+
+
+def stats_for_season(stats, season):
+    """One season's rows of a driver or team results table, indexed by name"""
+    return stats.xs(season, level='Season')
+
+
+def names_in_seasons(stats, seasons):
+    """Sorted drivers or teams of a results table with a row in any of the seasons"""
+    index = stats.index[stats.index.get_level_values('Season').isin(seasons)]
+    return sorted(index.get_level_values(1).unique())
+
+
+def driver_standings(season_drivers):
+    """Drivers ordered by championship points"""
+    return season_drivers.sort_values('Points', ascending=False, kind='stable')
+
+
+def team_standings(season_teams):
+    """Teams ordered by constructors' points"""
+    return season_teams.sort_values('Points', ascending=False, kind='stable')
+
+
+def race_wins(season_drivers):
+    """Win count for every driver with at least one win, most first"""
+    wins = season_drivers['Wins'].sort_values(ascending=False, kind='stable')
+    return wins[wins > 0]
+
+
+def podium_finishes(season_teams):
+    """Podium count for every team with at least one podium, most first"""
+    podiums = season_teams['Podiums'].sort_values(ascending=False, kind='stable')
+    return podiums[podiums > 0]
+
+
+def dnf_counts(season_drivers):
+    """DNF count for every driver that retired at least once, most first"""
+    dnfs = season_drivers['DNFs'].sort_values(ascending=False, kind='stable')
+    return dnfs[dnfs > 0]
+
+
+def consistency(season_drivers):
+    """Standard deviation of finishing position, most consistent first"""
+    return season_drivers['Position Std'].sort_values(kind='stable')
+
+
+def average_position(season_drivers):
+    """Mean finishing position, best first"""
+    return season_drivers['Average Position'].sort_values(kind='stable')
+
+
+def positions_gained(season_drivers):
+    """Mean places gained from the starting grid, biggest gainers first"""
+    return season_drivers['Positions Gained'].sort_values(ascending=False, kind='stable')
+
+
+def round_totals(data, column, offsets=None):
+    """Sum of a column for every (Season, Round), in race order"""
+    if offsets is None:
+        offsets = round_offsets(data)
+    if offsets.empty:
+        return pd.Series(dtype=data[column].dtype, index=offsets.index, name=column)
+    totals = np.add.reduceat(data[column].to_numpy(), offsets['Start'].to_numpy())
+    return pd.Series(totals, index=offsets.index, name=column)
+
+
+def _by_track(offsets, values):
+    """Per-round values relabelled by track name, keeping race order"""
+    return pd.Series(np.asarray(values), index=pd.Index(offsets['Track'].to_numpy(), name='Track'))
+
+
+@profiled
+def track_points(season_data, offsets=None):
+    """Total points awarded at each track, in race order"""
+    if offsets is None:
+        offsets = round_offsets(season_data)
+    return _by_track(offsets, round_totals(season_data, 'Points', offsets)).rename('Points')
+
+
+@profiled
+def track_competitiveness(season_data):
+    """Spread of finishing positions per track, most unpredictable first"""
+    return season_data.groupby('Track', observed=True)['Position'].std().sort_values(ascending=False)
+
+
+@profiled
+def dnf_rates(season_data, offsets=None):
+    """Percentage of entries at each track that ended in a DNF, in race order"""
+    if offsets is None:
+        offsets = round_offsets(season_data)
+    if offsets.empty:
+        return pd.Series(dtype=float, index=pd.Index([], name='Track'))
+    starts = offsets['Start'].to_numpy()
+    dnfs = np.add.reduceat(has_flag(season_data, RETIRED).astype(np.int64), starts)
+    entries = offsets['Stop'].to_numpy() - starts
+    return _by_track(offsets, dnfs / entries * 100)
+
+
+@profiled
+def gap_to_winner(season_data):
+    """Median gap to the winner in seconds over lead-lap finishes, closest first"""
+    gaps = season_data.groupby('Driver', observed=True)['GapToWinnerSec'].median().dropna()
+    return gaps.sort_values(kind='stable')
+
+
+@profiled
+def fastest_lap_trend(season_data, offsets=None):
+    """Fastest lap of each race in seconds, in race order"""
+    if offsets is None:
+        offsets = round_offsets(season_data)
+    if offsets.empty:
+        return pd.Series(dtype=float, index=pd.Index([], name='Track'), name='FastestLapSec')
+    laps = np.fmin.reduceat(season_data['FastestLapSec'].to_numpy(), offsets['Start'].to_numpy())
+    return _by_track(offsets, laps).rename('FastestLapSec')
+
+
+@profiled
+def fastest_lap_deficit(season_data, drivers=None, driver_index=None, offsets=None):
+    """Percent each driver's best lap was off the race's fastest lap, rounds (rows) by drivers (columns)
+
+    With a driver_index over season_data (see build_driver_index), only the
+    requested drivers' rows are read.
+    """
+    if offsets is None:
+        offsets = round_offsets(season_data)
+    if drivers is None:
+        rows = np.arange(len(season_data))
+    elif driver_index is not None:
+        season = season_data['Season'].iloc[0]
+        rows = np.concatenate([driver_positions(driver_index, driver, season) for driver in drivers]
+                              + [np.empty(0, dtype=np.intp)])
+    else:
+        rows = np.flatnonzero(season_data['Driver'].isin(drivers).to_numpy())
+
+    # Each row's race fastest lap, by the round range it falls in
+    race_of_row = np.searchsorted(offsets['Start'].to_numpy(), rows, side='right') - 1
+    race_best = fastest_lap_trend(season_data, offsets).to_numpy()[race_of_row]
+    deficit = pd.DataFrame({
+        'Round': season_data['Round'].to_numpy()[rows],
+        'Driver': season_data['Driver'].to_numpy()[rows],
+        'Deficit': (season_data['FastestLapSec'].to_numpy()[rows] / race_best - 1) * 100,
+    })
+    return deficit.pivot_table(values='Deficit', index='Round', columns='Driver', aggfunc='min')
+
+
+@profiled
+def status_counts(season_data, key='Driver'):
+    """Entries per status class (columns, see STATUSES) for each driver, team or track
+
+    Counted with one bincount over the categorical codes, rows in order of
+    first appearance - race order when key is Track.
+    """
+    keys, names = pd.factorize(season_data[key])
+    codes = season_data['Status'].cat.codes.to_numpy()
+    counts = np.bincount(keys * len(STATUSES) + codes, minlength=len(names) * len(STATUSES))
+    return pd.DataFrame(counts.reshape(len(names), len(STATUSES)), index=pd.Index(names, name=key),
+                        columns=STATUSES)
+
+
+@profiled
+def retirement_breakdown(season_data, key='Team'):
+    """Non-finishes split by class for every driver, team or track with at least one, most first"""
+    counts = status_counts(season_data, key)[NON_FINISHES]
+    counts = counts[counts.sum(axis=1) > 0]
+    return counts.loc[counts.sum(axis=1).sort_values(ascending=False, kind='stable').index]
+
+
+@profiled
+def finish_rates(season_data, key='Team'):
+    """Percentage of entries that reached the flag, on the lead lap or lapped, best first"""
+    counts = status_counts(season_data, key)
+    rates = (counts['Finished'] + counts['Lapped']) / counts.sum(axis=1) * 100
+    return rates.sort_values(ascending=False, kind='stable')
+
+
+def _driver_rows(names, drivers):
+    """Positions in names (sorted) of the requested drivers present in it, in name order"""
+    if drivers is None:
+        return np.arange(len(names))
+    rows = names.get_indexer(pd.unique(np.asarray(drivers, dtype=object)))
+    return np.sort(rows[rows >= 0])
+
+
+@profiled
+def driver_track_matrix(season_data, drivers=None):
+    """Points per driver (rows, by name) and track (columns, in race order), optionally limited to some drivers
+
+    Only the requested drivers' rows are summed, with np.add.at into a
+    drivers x tracks array, so the top few drivers of a long season never
+    build the full matrix.
+    """
+    driver_codes, names = pd.factorize(season_data['Driver'], sort=True)
+    track_codes, tracks = pd.factorize(season_data['Track'])
+    rows = _driver_rows(pd.Index(names), drivers)
+
+    # Map season driver codes to output rows, -1 for drivers not requested
+    row_of_code = np.full(len(names), -1)
+    row_of_code[rows] = np.arange(len(rows))
+    row_of_entry = row_of_code[driver_codes]
+    requested = row_of_entry >= 0
+
+    points = season_data['Points'].to_numpy()
+    matrix = np.zeros((len(rows), len(tracks)), dtype=points.dtype)
+    np.add.at(matrix, (row_of_entry[requested], track_codes[requested]), points[requested])
+    return pd.DataFrame(matrix, index=pd.Index(np.asarray(names)[rows], name='Driver'),
+                        columns=pd.Index(np.asarray(tracks), name='Track'))
+
+
+class TrackPoints:
+    """One season's points per driver and track as a sparse matrix, for repeated driver selections
+
+    Most drivers score at only some tracks, so the matrix is kept as a
+    scipy CSR array. Built once per season, the driver_track_matrix for any
+    set of drivers is then a row selection.
+    """
+
+    def __init__(self, season_data):
+        # scipy is only needed once a matrix is built, not to import the engine
+        from scipy import sparse
+
+        driver_codes, names = pd.factorize(season_data['Driver'], sort=True)
+        track_codes, tracks = pd.factorize(season_data['Track'])
+        self.drivers = pd.Index(np.asarray(names), name='Driver')
+        self.tracks = pd.Index(np.asarray(tracks), name='Track')
+        # Duplicate (driver, track) entries are summed when converting to CSR
+        self.points = sparse.coo_array((season_data['Points'].to_numpy(), (driver_codes, track_codes)),
+                                       shape=(len(self.drivers), len(self.tracks))).tocsr()
+
+    def matrix(self, drivers=None):
+        """Dense points frame for some drivers (default all), as driver_track_matrix returns"""
+        rows = _driver_rows(self.drivers, drivers)
+        return pd.DataFrame(self.points[rows].toarray(), index=self.drivers[rows], columns=self.tracks)
+
+
+@profiled
+def season_track_points(data):
+    """{season: TrackPoints} for every season in a combined frame"""
+    return {season: TrackPoints(season_data)
+            for season, season_data in data.groupby('Season', observed=True, sort=True)}
+
+
+@profiled
+def grid_finish_counts(season_data, size=None):
+    """Classified finishes per starting slot (rows) and finishing position (columns), both from 1
+
+    One np.bincount over grid * size + finish, so the cost is a pass over
+    the rows and the result is size x size however many seasons went in.
+    size defaults to the largest grid slot or position seen.
+    """
+    grid = season_data['Starting Grid'].to_numpy(dtype=float, na_value=np.nan)
+    finish = season_data['Position'].to_numpy(dtype=float, na_value=np.nan)
+    # Pit-lane starts (grid 0) and unclassified finishes have no cell
+    classified = (grid >= 1) & (finish >= 1)
+    grid = grid[classified].astype(np.int64) - 1
+    finish = finish[classified].astype(np.int64) - 1
+    if size is None:
+        size = int(max(grid.max(initial=-1), finish.max(initial=-1))) + 1
+
+    keep = (grid < size) & (finish < size)
+    counts = np.bincount(grid[keep] * size + finish[keep], minlength=size * size).reshape(size, size)
+    slots = np.arange(1, size + 1)
+    return pd.DataFrame(counts, index=pd.Index(slots, name='Starting Grid'),
+                        columns=pd.Index(slots, name='Position'))
+
+
+def finish_given_grid(counts):
+    """P(finishing position | starting slot) from grid_finish_counts, NaN rows for slots never classified"""
+    totals = counts.sum(axis=1).to_numpy(dtype=float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        probabilities = counts.to_numpy() / totals[:, None]
+    return pd.DataFrame(probabilities, index=counts.index, columns=counts.columns)
+
+
+@profiled
+def season_grid_finish(data):
+    """{season: grid_finish_counts} for every season in a combined frame"""
+    return {season: grid_finish_counts(season_data)
+            for season, season_data in data.groupby('Season', observed=True, sort=True)}
+
+
+@profiled
+def season_summary(season_data, season_drivers, season_teams, offsets=None):
+    """Headline numbers for one season"""
+    if offsets is None:
+        offsets = round_offsets(season_data)
+    wins = race_wins(season_drivers)
+    return pd.Series({
+        'Total Races': len(offsets),
+        'Total Drivers': len(season_drivers),
+        'Total Teams': len(season_teams),
+        'Most Wins Count': wins.iloc[0] if not wins.empty else 0,
+        'Most Wins Driver': wins.index[0] if not wins.empty else 'N/A',
+        'Highest Points': season_drivers['Points'].max(),
+        'Points Leader': season_drivers['Points'].idxmax(),
+    })
@@ -0,0 +1,98 @@
+"""Bootstrap confidence intervals for each driver's average finishing position and its spread
+
+A driver's classified finishes are resampled with replacement as one
+(resamples x races) index array, in chunks of at most CHUNK_ELEMENTS
+values so memory stays bounded for long careers. The mean and sample
+standard deviation of every resample give percentile intervals around the
+season table's Average Position and Position Std. Seasons can be spread
+over worker processes; each season is resampled from the same seed as a
+single-season bootstrap_intervals call, so the intervals for a given seed
+do not depend on how many workers run or which other seasons are included.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from f1_engine.profiling import profiled
+
+N_RESAMPLES = 2000
+CHUNK_ELEMENTS = 1_000_000
+
+COLUMNS = ['Finishes', 'Average Position', 'Average Low', 'Average High', 'Position Std', 'Std Low', 'Std High']
+# Interval bounds for each estimate
+INTERVALS = {'Average Position': ('Average Low', 'Average High'), 'Position Std': ('Std Low', 'Std High')}
+
+
+def resample_stats(rng, positions, n_resamples):
+    """(means, sample stds) of n_resamples bootstrap resamples of one driver's finishes"""
+    n = len(positions)
+    chunk = max(1, CHUNK_ELEMENTS // n)
+    means = np.empty(n_resamples)
+    stds = np.empty(n_resamples)
+    for start in range(0, n_resamples, chunk):
+        stop = min(start + chunk, n_resamples)
+        samples = positions[rng.integers(0, n, (stop - start, n))]
+        means[start:stop] = samples.mean(axis=1)
+        stds[start:stop] = samples.std(axis=1, ddof=1) if n > 1 else np.nan
+    return means, stds
+
+
+@profiled
+def bootstrap_intervals(season_data, key='Driver', n_resamples=N_RESAMPLES, confidence=0.95, seed=0):
+    """Average position and position spread with percentile intervals, per driver or team of one season
+
+    Only classified finishes count, as in driver_season_stats. The spread
+    interval is NaN for anyone with fewer than two classified finishes.
+    """
+    rng = np.random.default_rng(seed)
+    tail = (1 - confidence) / 2 * 100
+    positions = season_data['Position'].to_numpy(dtype=float, na_value=np.nan)
+    codes, names = pd.factorize(season_data[key], sort=True)
+
+    # Classified finishes grouped by entrant, one slice each
+    classified = ~np.isnan(positions)
+    order = np.argsort(codes[classified], kind='stable')
+    bounds = np.cumsum(np.bincount(codes[classified], minlength=len(names)))
+    by_entrant = np.split(positions[classified][order], bounds[:-1])
+
+    rows = []
+    for finishes in by_entrant:
+        if len(finishes) == 0:
+            rows.append([0] + [np.nan] * 6)
+            continue
+        means, stds = resample_stats(rng, finishes, n_resamples)
+        std = finishes.std(ddof=1) if len(finishes) > 1 else np.nan
+        std_low, std_high = np.percentile(stds, [tail, 100 - tail]) if len(finishes) > 1 else (np.nan, np.nan)
+        rows.append([len(finishes), finishes.mean(), *np.percentile(means, [tail, 100 - tail]),
+                     std, std_low, std_high])
+    return pd.DataFrame(rows, index=pd.Index(np.asarray(names), name=key), columns=COLUMNS)
+
+
+def error_bars(intervals, labels, column):
+    """(2 x n) distances below and above an estimate, in labels' order, for matplotlib's xerr / yerr
+
+    Zero where there is no interval, such as a spread from a single finish.
+    """
+    rows = intervals.reindex(pd.Index(labels).astype(intervals.index.dtype))
+    low, high = INTERVALS[column]
+    errors = np.array([rows[column] - rows[low], rows[high] - rows[column]], dtype=float)
+    return np.nan_to_num(np.clip(errors, 0, None))
+
+
+@profiled
+def season_bootstrap(data, key='Driver', n_resamples=N_RESAMPLES, confidence=0.95, seed=0, max_workers=None):
+    """{season: bootstrap_intervals} for every season, spread over worker processes when there are several"""
+    groups = [(season, season_data) for season, season_data in data.groupby('Season', observed=True, sort=True)]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(groups))
+
+    args = [(season_data[[key, 'Position']], key, n_resamples, confidence, seed) for _, season_data in groups]
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(bootstrap_intervals, *zip(*args)))
+    else:
+        results = [bootstrap_intervals(*season_args) for season_args in args]
+    return {season: result for (season, _), result in zip(groups, results)}
@@ -0,0 +1,137 @@
+"""Championship standings after every round, kept as dense NumPy matrices
+
+A Championship holds one season for one key (Driver or Team) as
+(rounds x entrants) arrays of cumulative points, championship position and
+gap to the leader. Looking up any round is a row view, and appending a race
+adds one row instead of recomputing the season.
+"""
+import numpy as np
+import pandas as pd
+
+from f1_engine.data import round_offsets, season_offsets
+from f1_engine.profiling import profiled
+
+
+def _rank(points):
+    """Championship positions (1 = leader) for a row or matrix of cumulative points
+
+    Ties keep entrant order, which is the order entrants first scored or
+    appeared in the results.
+    """
+    order = np.argsort(-points, axis=-1, kind='stable')
+    positions = np.empty_like(order)
+    np.put_along_axis(positions, order, np.arange(1, points.shape[-1] + 1), axis=-1)
+    return positions
+
+
+class Championship:
+    """Cumulative standings for one season, extendable one race at a time"""
+
+    def __init__(self, entrants=(), capacity=32):
+        self.entrants = list(entrants)
+        self.tracks = []
+        self._columns = {name: column for column, name in enumerate(self.entrants)}
+        self._rounds = 0
+        self._cumulative = np.zeros((capacity, len(self.entrants)))
+        self._positions = np.zeros((capacity, len(self.entrants)), dtype=np.int64)
+        self._gaps = np.zeros((capacity, len(self.entrants)))
+
+    @classmethod
+    def from_season(cls, season_data, key='Driver', offsets=None):
+        """Build the whole season at once from one season's rows and, optionally, their round offsets"""
+        if offsets is None:
+            offsets = round_offsets(season_data)
+        codes, entrants = pd.factorize(season_data[key])
+        round_of_row = np.repeat(np.arange(len(offsets)), offsets['Stop'] - offsets['Start'])
+
+        points = np.zeros((len(offsets), len(entrants)))
+        np.add.at(points, (round_of_row, codes), season_data['Points'].to_numpy(dtype=float))
+
+        championship = cls(entrants, capacity=max(len(offsets), 1))
+        championship._rounds = len(offsets)
+        championship.tracks = offsets['Track'].tolist()
+        cumulative = np.cumsum(points, axis=0)
+        championship._cumulative[:len(offsets)] = cumulative
+        championship._positions[:len(offsets)] = _rank(cumulative)
+        championship._gaps[:len(offsets)] = cumulative.max(axis=1, initial=0)[:, None] - cumulative
+        return championship
+
+    def _add_entrant(self, name):
+        self._columns[name] = len(self.entrants)
+        self.entrants.append(name)
+        self._cumulative = np.pad(self._cumulative, ((0, 0), (0, 1)))
+        self._positions = np.pad(self._positions, ((0, 0), (0, 1)))
+        self._gaps = np.pad(self._gaps, ((0, 0), (0, 1)))
+        # Standings before they joined are unchanged, they just sit at the back
+        if self._rounds:
+            self._positions[:self._rounds, -1] = len(self.entrants)
+            self._gaps[:self._rounds, -1] = self._cumulative[:self._rounds].max(axis=1)
+
+    def append_race(self, race_rows, key='Driver'):
+        """Add one race's result rows as the next round"""
+        for name in pd.unique(race_rows[key]):
+            if name not in self._columns:
+                self._add_entrant(name)
+
+        if self._rounds == len(self._cumulative):
+            grow = ((0, max(self._rounds, 1)), (0, 0))
+            self._cumulative = np.pad(self._cumulative, grow)
+            self._positions = np.pad(self._positions, grow)
+            self._gaps = np.pad(self._gaps, grow)
+
+        row = self._cumulative[self._rounds - 1].copy() if self._rounds else np.zeros(len(self.entrants))
+        columns = np.fromiter((self._columns[name] for name in race_rows[key]), dtype=np.int64,
+                              count=len(race_rows))
+        np.add.at(row, columns, race_rows['Points'].to_numpy(dtype=float))
+
+        self._cumulative[self._rounds] = row
+        self._positions[self._rounds] = _rank(row)
+        self._gaps[self._rounds] = row.max(initial=0) - row
+        self.tracks.append(race_rows['Track'].iloc[0])
+        self._rounds += 1
+
+    @property
+    def rounds(self):
+        return self._rounds
+
+    @property
+    def cumulative_points(self):
+        """(rounds x entrants) points after each round"""
+        return self._cumulative[:self._rounds]
+
+    @property
+    def position_history(self):
+        """(rounds x entrants) championship position after each round"""
+        return self._positions[:self._rounds]
+
+    @property
+    def gap_to_leader(self):
+        """(rounds x entrants) points behind the leader after each round"""
+        return self._gaps[:self._rounds]
+
+    def points_after(self, round_number):
+        """Points of every entrant after a round, numbered from 1"""
+        return self.cumulative_points[round_number - 1]
+
+    def standings(self, round_number=None):
+        """Standings after a round (default the latest) as a Series, leader first"""
+        if round_number is None:
+            round_number = self._rounds
+        points = pd.Series(self.points_after(round_number), index=pd.Index(self.entrants), name='Points')
+        return points.iloc[np.argsort(self.position_history[round_number - 1])]
+
+    def history(self, matrix, entrants=None):
+        """One of the per-round matrices as a DataFrame, rows labelled by round and track"""
+        index = pd.MultiIndex.from_arrays([np.arange(1, self._rounds + 1), self.tracks], names=['Round', 'Track'])
+        frame = pd.DataFrame(matrix, index=index, columns=self.entrants)
+        return frame if entrants is None else frame[list(entrants)]
+
+
+@profiled
+def season_championships(data, key='Driver'):
+    """{season: Championship} for every season in a combined frame"""
+    offsets = round_offsets(data)
+    championships = {}
+    for season, season_data in data.groupby('Season', observed=True, sort=True):
+        championships[season] = Championship.from_season(season_data, key, season_offsets(offsets, season))
+    return championships
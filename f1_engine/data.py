@@ -0,0 +1,336 @@
+"""Season data loading: CSV discovery, cleaning and the columnar store"""
+import fnmatch
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+from pandas.api.types import union_categoricals
+
+from f1_engine.profiling import profiled
+from f1_engine.status import classify_status
+from f1_engine.timing import TIME_COLUMNS, parse_race_times
+
+# Cleaned seasons are cached next to the CSVs as uncompressed Arrow IPC files
+# so later loads are a memory-map instead of a CSV parse.
+STORE_DIR = '.f1_store'
+STORE_VERSION = 5
+
+# Season files are discovered by name, matched case-insensitively
+SEASON_FILE_PATTERN = 'formula1_*season*_raceresults.csv'
+SEASON_YEAR = re.compile(r'(\d{4})')
+
+# Compact load schema. Categorical columns get one sorted dictionary shared
+# by every season in combine_seasons, so their codes line up across seasons.
+CATEGORY_COLUMNS = ['Driver', 'Team', 'Track', 'Set Fastest Lap']
+INTEGER_COLUMNS = {'Position': 'Int8', 'Starting Grid': 'Int8', 'Laps': 'Int16', 'No': 'Int16'}
+FLOAT32_COLUMNS = ['Points']
+
+
+def apply_schema(df):
+    """Narrow a cleaned season to the compact load schema, in place"""
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    for column, dtype in INTEGER_COLUMNS.items():
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype(dtype)
+    for column in FLOAT32_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype(np.float32)
+    return df
+
+
+def clean_race_data(df, compact=True):
+    """Clean Formula 1 race data for analysis
+
+    With compact=False the wide pandas defaults are kept, which is only
+    useful for comparing against the compact schema.
+    """
+    df_clean = df.copy()
+
+    # Convert Position to numeric, keeping original for reference
+    df_clean['Position_Original'] = df_clean['Position']
+    df_clean['Position'] = pd.to_numeric(df_clean['Position'], errors='coerce')
+
+    # Convert Points to numeric
+    df_clean['Points'] = pd.to_numeric(df_clean['Points'], errors='coerce').fillna(0)
+
+    # Convert Starting Grid to numeric if it exists
+    if 'Starting Grid' in df_clean.columns:
+        df_clean['Starting Grid'] = pd.to_numeric(df_clean['Starting Grid'], errors='coerce')
+
+    # Results files list races in calendar order, so each new block of Track
+    # values starts the next round
+    track = df_clean['Track']
+    df_clean['Round'] = track.ne(track.shift()).cumsum().astype(np.int16)
+
+    # Numeric race, gap and lap times alongside the original text
+    if {'Time/Retired', 'Fastest Lap Time'} <= set(df_clean.columns):
+        df_clean[TIME_COLUMNS] = parse_race_times(df_clean)
+        df_clean[['Status', 'StatusFlags']] = classify_status(df_clean)
+
+    if compact:
+        # Status now carries what the raw position text said
+        df_clean = apply_schema(df_clean.drop(columns='Position_Original'))
+
+    return df_clean
+
+
+def read_season_csv(csv_path, season):
+    """Parse and clean one season straight from its CSV file"""
+    df = pd.read_csv(csv_path)
+    df['Season'] = season
+    return clean_race_data(df)
+
+
+def file_fingerprint(csv_path):
+    """Return size, mtime and content hash used to validate the season store"""
+    stat = os.stat(csv_path)
+    digest = hashlib.sha256()
+    with open(csv_path, 'rb') as csv_file:
+        for chunk in iter(lambda: csv_file.read(1 << 20), b''):
+            digest.update(chunk)
+    return {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': digest.hexdigest(),
+    }
+
+
+def _store_paths(csv_path):
+    folder = os.path.join(os.path.dirname(os.path.abspath(csv_path)), STORE_DIR)
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    return folder, os.path.join(folder, stem + '.arrow'), os.path.join(folder, stem + '.json')
+
+
+def _write_manifest(manifest_path, manifest):
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w') as manifest_file:
+        json.dump(manifest, manifest_file)
+    os.replace(tmp_path, manifest_path)
+
+
+def _store_is_fresh(csv_path, season, manifest_path):
+    """Check the manifest against the CSV, hashing only when the mtime moved"""
+    try:
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return False
+
+    if manifest.get('version') != STORE_VERSION or manifest.get('season') != season:
+        return False
+
+    stat = os.stat(csv_path)
+    if stat.st_size != manifest.get('size'):
+        return False
+    if stat.st_mtime_ns == manifest.get('mtime_ns'):
+        return True
+
+    # File was touched - only rebuild if the content actually changed
+    fingerprint = file_fingerprint(csv_path)
+    if fingerprint['sha256'] != manifest.get('sha256'):
+        return False
+    manifest.update(fingerprint)
+    try:
+        _write_manifest(manifest_path, manifest)
+    except OSError:
+        pass
+    return True
+
+
+def build_season_store(csv_path, season):
+    """Clean a season CSV and write it to the columnar store"""
+    df = read_season_csv(csv_path, season)
+    folder, arrow_path, manifest_path = _store_paths(csv_path)
+
+    try:
+        os.makedirs(folder, exist_ok=True)
+        tmp_path = arrow_path + '.tmp'
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        feather.write_feather(table, tmp_path, compression='uncompressed')
+        os.replace(tmp_path, arrow_path)
+
+        manifest = {'version': STORE_VERSION, 'season': season, 'source': os.path.basename(csv_path)}
+        manifest.update(file_fingerprint(csv_path))
+        _write_manifest(manifest_path, manifest)
+    except OSError:
+        # Read-only checkouts still work, they just parse the CSV every time
+        pass
+
+    return df
+
+
+def read_season_store(csv_path, season):
+    """The season memory-mapped from the columnar store, or None when the store is missing or stale"""
+    _, arrow_path, manifest_path = _store_paths(csv_path)
+    if _store_is_fresh(csv_path, season, manifest_path):
+        try:
+            return feather.read_table(arrow_path, memory_map=True).to_pandas()
+        except (OSError, pa.ArrowInvalid):
+            pass
+    return None
+
+
+def load_season(csv_path, season, use_store=True):
+    """Load one cleaned season, memory-mapping the columnar store when it is fresh"""
+    if not use_store:
+        return read_season_csv(csv_path, season)
+
+    df = read_season_store(csv_path, season)
+    return df if df is not None else build_season_store(csv_path, season)
+
+
+def discover_season_files(data_dir='.'):
+    """Return {season: csv path} for every season results file in data_dir"""
+    season_files = {}
+    for name in sorted(os.listdir(data_dir)):
+        if not fnmatch.fnmatch(name.lower(), SEASON_FILE_PATTERN):
+            continue
+        year = SEASON_YEAR.search(name)
+        if year is None:
+            continue
+        season_files[int(year.group(1))] = os.path.join(data_dir, name)
+    return dict(sorted(season_files.items()))
+
+
+def _mismatched_categoricals(frames):
+    """Categorical columns whose dictionary differs between frames
+
+    Columns whose dtype already matches everywhere (such as Status) are left
+    to pd.concat, which would turn the mismatched ones back into strings.
+    """
+    columns = []
+    for column in CATEGORY_COLUMNS:
+        dtypes = [frame[column].dtype for frame in frames if column in frame.columns]
+        if len(dtypes) != len(frames) or not all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes):
+            continue
+        if not all(dtype == dtypes[0] for dtype in dtypes):
+            columns.append(column)
+    return columns
+
+
+def combine_seasons(frames):
+    """Concatenate cleaned seasons into one frame keyed by an ordered Season categorical
+
+    Categorical columns get one sorted dictionary across seasons, built once
+    with union_categoricals, which remaps each frame's codes rather than
+    re-encoding its values.
+    """
+    shared = _mismatched_categoricals(frames)
+    data = pd.concat([frame.drop(columns=shared) for frame in frames], ignore_index=True)
+    for column in shared:
+        data[column] = union_categoricals([frame[column] for frame in frames], sort_categories=True)
+    data = data[list(frames[0].columns)]
+
+    seasons = sorted(data['Season'].unique())
+    data['Season'] = pd.Categorical(data['Season'], categories=seasons, ordered=True)
+    return data
+
+
+@profiled
+def load_seasons(data_dir='.', use_store=True, max_workers=None):
+    """Discover and load every season in data_dir, parsing changed CSVs in parallel when there are several
+
+    Fresh stores are memory-mapped in this process; only seasons that need
+    a CSV parse go to worker processes, since a frame sent back from a
+    worker is a full copy through a pipe.
+    """
+    season_files = discover_season_files(data_dir)
+    if not season_files:
+        raise FileNotFoundError(f"No season results files found in {os.path.abspath(data_dir)}")
+
+    frames = {}
+    if use_store:
+        for season, path in season_files.items():
+            df = read_season_store(path, season)
+            if df is not None:
+                frames[season] = df
+
+    stale = [season for season in season_files if season not in frames]
+    paths = [season_files[season] for season in stale]
+    parse = build_season_store if use_store else read_season_csv
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(stale))
+
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            frames.update(zip(stale, pool.map(parse, paths, stale)))
+    else:
+        frames.update((season, parse(path, season)) for season, path in zip(stale, paths))
+
+    return combine_seasons([frames[season] for season in season_files])
+
+
+def season_list(data):
+    """Seasons present in a combined frame, oldest first"""
+    return data['Season'].cat.remove_unused_categories().cat.categories.tolist()
+
+
+def select_season(data, season):
+    """Rows of a combined frame belonging to one season"""
+    return data[data['Season'] == season]
+
+
+def round_offsets(data):
+    """(Season, Round) -> [Start, Stop) positional row range, plus the round's Track
+
+    Rows of a round are contiguous both within a season file and in the
+    combined frame, so per-round series are slices or np.add.reduceat over
+    the Start column rather than a groupby.
+    """
+    seasons = np.asarray(data['Season'], dtype=np.int64)
+    rounds = data['Round'].to_numpy()
+    boundaries = np.flatnonzero((np.diff(seasons) != 0) | (np.diff(rounds) != 0)) + 1
+    starts = np.concatenate(([0], boundaries)) if len(data) else np.empty(0, dtype=np.int64)
+    stops = np.append(starts[1:], len(data))
+    index = pd.MultiIndex.from_arrays([seasons[starts], rounds[starts]], names=['Season', 'Round'])
+    return pd.DataFrame({'Track': data['Track'].to_numpy()[starts], 'Start': starts, 'Stop': stops},
+                        index=index)
+
+
+def season_offsets(offsets, season):
+    """One season's rows of a round_offsets table, with Start/Stop counted from the season's first row
+
+    Seasons are contiguous in the combined frame, so the rebased ranges index
+    select_season(data, season) - the offsets for a page are a lookup in the
+    table built once at load time rather than another pass over the rows.
+    """
+    rounds = offsets.xs(season, level='Season', drop_level=False)
+    first = rounds['Start'].iloc[0] if len(rounds) else 0
+    return rounds.assign(Start=rounds['Start'] - first, Stop=rounds['Stop'] - first)
+
+
+def build_driver_index(data):
+    """Map driver -> {season: positional row numbers within that season's rows}, in one groupby pass
+
+    Seasons are contiguous in the combined frame, so the numbers index
+    select_season(data, season) directly - the same rows every per-season
+    page and the title simulator work on.
+    """
+    seasons = np.asarray(data['Season'], dtype=np.int64)
+    firsts = np.flatnonzero(np.diff(seasons, prepend=seasons[:1] - 1))
+    season_start = dict(zip(seasons[firsts].tolist(), firsts.tolist()))
+
+    driver_index = {}
+    for (season, driver), rows in data.groupby(['Season', 'Driver'], observed=True).indices.items():
+        driver_index.setdefault(driver, {})[season] = rows - season_start[season]
+    return driver_index
+
+
+def driver_positions(driver_index, driver, season):
+    """Positional rows of a driver within one season's rows, empty when they did not race"""
+    return driver_index.get(driver, {}).get(season, np.empty(0, dtype=np.intp))
+
+
+def dataset_fingerprint(data):
+    """Content hash of a loaded frame, used to key caches of derived results"""
+    row_hashes = pd.util.hash_pandas_object(data, index=False).to_numpy()
+    return hashlib.sha256(row_hashes.tobytes()).hexdigest()
@@ -0,0 +1,169 @@
+"""Optional SQLite copy of the cleaned seasons, queried with filters and grouping pushed into SQL
+
+The in-memory frame from load_seasons holds every season's rows. A
+SeasonDatabase instead keeps them in one file next to the columnar store,
+indexed by (Season, Driver), (Season, Team) and (Season, Track), and
+answers the engine's per-season aggregations with GROUP BY queries. Only
+the requested seasons' rows are read and only the aggregated result comes
+back to Python, so memory stays bounded however much history is loaded.
+"""
+import os
+import sqlite3
+from contextlib import closing
+
+import numpy as np
+import pandas as pd
+
+from f1_engine.data import STORE_DIR, STORE_VERSION, discover_season_files, file_fingerprint, load_season
+from f1_engine.profiling import profiled
+from f1_engine.status import RETIRED
+
+DATABASE_NAME = 'seasons.sqlite'
+
+# Cleaned columns as stored; categoricals become TEXT, nullable integers allow NULL
+COLUMNS = {
+    'Season': 'INTEGER NOT NULL',
+    'Round': 'INTEGER NOT NULL',
+    'Track': 'TEXT',
+    'Position': 'INTEGER',
+    'No': 'INTEGER',
+    'Driver': 'TEXT',
+    'Team': 'TEXT',
+    'Starting Grid': 'INTEGER',
+    'Laps': 'INTEGER',
+    'Time/Retired': 'TEXT',
+    'Points': 'REAL',
+    'Set Fastest Lap': 'TEXT',
+    'Fastest Lap Time': 'TEXT',
+    'RaceTimeSec': 'REAL',
+    'GapToWinnerSec': 'REAL',
+    'LapsDown': 'REAL',
+    'FastestLapSec': 'REAL',
+    'Status': 'TEXT',
+    'StatusFlags': 'INTEGER',
+}
+
+# Group keys the per-season indexes cover
+KEYS = ('Driver', 'Team', 'Track')
+
+
+def _quote(column):
+    return '"' + column.replace('"', '""') + '"'
+
+
+def _season_filter(seasons):
+    """WHERE clause and parameters restricting a query to some seasons (None for all)"""
+    if seasons is None:
+        return '', []
+    seasons = [int(season) for season in seasons]
+    return f"WHERE Season IN ({', '.join('?' * len(seasons))})", seasons
+
+
+class SeasonDatabase:
+    """Cleaned season rows in SQLite, with the engine's aggregations as SQL"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.path))
+
+    @classmethod
+    def build(cls, data_dir='.', path=None):
+        """Ingest every season in data_dir, re-reading only seasons whose CSV changed"""
+        season_files = discover_season_files(data_dir)
+        if not season_files:
+            raise FileNotFoundError(f"No season results files found in {os.path.abspath(data_dir)}")
+        if path is None:
+            folder = os.path.join(data_dir, STORE_DIR)
+            os.makedirs(folder, exist_ok=True)
+            path = os.path.join(folder, DATABASE_NAME)
+
+        database = cls(path)
+        with database._connect() as connection, connection:
+            columns = ', '.join(f'{_quote(name)} {sql_type}' for name, sql_type in COLUMNS.items())
+            connection.execute(f'CREATE TABLE IF NOT EXISTS results ({columns})')
+            for key in KEYS:
+                connection.execute(f'CREATE INDEX IF NOT EXISTS results_season_{key.lower()} '
+                                   f'ON results (Season, {_quote(key)})')
+            connection.execute('CREATE TABLE IF NOT EXISTS seasons '
+                               '(Season INTEGER PRIMARY KEY, Version INTEGER, Sha256 TEXT)')
+
+            ingested = dict(connection.execute('SELECT Season, Version || Sha256 FROM seasons'))
+            for season in set(ingested) - set(season_files):
+                connection.execute('DELETE FROM results WHERE Season = ?', (season,))
+                connection.execute('DELETE FROM seasons WHERE Season = ?', (season,))
+            for season, csv_path in season_files.items():
+                sha256 = file_fingerprint(csv_path)['sha256']
+                if ingested.get(season) == f'{STORE_VERSION}{sha256}':
+                    continue
+                connection.execute('DELETE FROM results WHERE Season = ?', (season,))
+                database._insert(connection, load_season(csv_path, season))
+                connection.execute('INSERT OR REPLACE INTO seasons VALUES (?, ?, ?)', (season, STORE_VERSION, sha256))
+        return database
+
+    @staticmethod
+    def _insert(connection, season_data):
+        rows = season_data[list(COLUMNS)].astype(object)
+        rows = rows.where(rows.notna(), None)
+        # NumPy scalars are not SQLite types
+        values = [tuple(value.item() if isinstance(value, np.generic) else value for value in row)
+                  for row in rows.itertuples(index=False, name=None)]
+        placeholders = ', '.join('?' * len(COLUMNS))
+        connection.executemany(f'INSERT INTO results VALUES ({placeholders})', values)
+
+    def query(self, sql, params=()):
+        """Result of any SELECT as a DataFrame"""
+        with self._connect() as connection:
+            return pd.read_sql_query(sql, connection, params=params)
+
+    def seasons(self):
+        """Seasons in the database, oldest first"""
+        return self.query('SELECT Season FROM seasons ORDER BY Season')['Season'].tolist()
+
+    @profiled
+    def season_stats(self, key='Driver', seasons=None):
+        """driver_season_stats / team_season_stats computed in SQL, optionally for some seasons only"""
+        if key not in KEYS:
+            raise ValueError(f"key must be one of {KEYS}")
+        where, params = _season_filter(seasons)
+        stats = self.query(f"""
+            SELECT Season, {_quote(key)} AS {_quote(key)},
+                   TOTAL(Points) AS Points,
+                   TOTAL(Position = 1) AS Wins,
+                   TOTAL(Position <= 3) AS Podiums,
+                   TOTAL((StatusFlags & {RETIRED}) != 0) AS DNFs,
+                   AVG(Position) AS "Average Position",
+                   COUNT(Position) AS _n,
+                   TOTAL(Position * Position) AS _sum_squares,
+                   TOTAL(Position) AS _sum,
+                   COUNT(*) AS Races,
+                   AVG("Starting Grid" - Position) AS "Positions Gained"
+            FROM results {where}
+            GROUP BY Season, {_quote(key)}
+            ORDER BY Season, {_quote(key)}
+        """, params)
+
+        # Sample standard deviation from the sums, NaN below two classified finishes
+        n = stats.pop('_n').to_numpy(dtype=float)
+        total = stats.pop('_sum').to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            variance = (stats.pop('_sum_squares').to_numpy() - total * total / n) / (n - 1)
+        position_std = np.where(n > 1, np.sqrt(np.clip(variance, 0, None)), np.nan)
+
+        for column in ('Wins', 'Podiums', 'DNFs'):
+            stats[column] = stats[column].astype(np.int64)
+        stats.insert(stats.columns.get_loc('Races'), 'Position Std', position_std)
+        return stats.set_index(['Season', key])
+
+    def track_points(self, season):
+        """Total points awarded at each track of a season, in race order"""
+        totals = self.query('SELECT Track, TOTAL(Points) AS Points FROM results WHERE Season = ? '
+                            'GROUP BY Round ORDER BY Round', (int(season),))
+        return totals.set_index('Track')['Points']
+
+
+@profiled
+def build_season_database(data_dir='.', path=None):
+    """SeasonDatabase for data_dir, ingesting new or changed seasons first"""
+    return SeasonDatabase.build(data_dir, path)
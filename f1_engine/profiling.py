@@ -0,0 +1,137 @@
+"""Wall time, CPU time and peak memory of named spans, for finding what makes a page slow
+
+Nothing is recorded until start_run() is called on a thread; until then a
+span or a profiled function costs one thread-local lookup. While a run is
+active every span entered on that thread is recorded with its nesting
+depth, and finish_run() returns the records and optionally appends them to
+a JSONL log.
+
+With trace_memory, each span also records its tracemalloc peak above what
+was allocated when it was entered. Tracing slows every allocation in the
+process several times over - wall times of a traced run are inflated - so
+it is only on while a tracing run is active. tracemalloc keeps one peak for
+the whole process and every span resets it, so only one run traces at a
+time: a trace_memory run started while another is tracing records times
+only, with peak_mib None.
+"""
+import functools
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+_local = threading.local()
+_lock = threading.Lock()
+# Whether a run currently owns tracemalloc, and whether it had to start it
+_tracing = False
+_started_tracing = False
+
+
+class _Run:
+    """Records and open spans of one profiled run"""
+
+    def __init__(self, label, trace_memory):
+        self.label = label
+        self.trace_memory = trace_memory
+        self.started = time.time()
+        self.records = []
+        # Absolute traced-memory peak seen by each open span so far
+        self.peaks = []
+
+
+def start_run(label, trace_memory=False):
+    """Start recording spans on this thread under label (e.g. the page name)
+
+    Returns whether the run traces memory, which is False when asked to
+    while another run is already tracing.
+    """
+    global _tracing, _started_tracing
+    if trace_memory:
+        with _lock:
+            if _tracing:
+                trace_memory = False
+            else:
+                _tracing = True
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    _started_tracing = True
+    _local.run = _Run(label, trace_memory)
+    return trace_memory
+
+
+def finish_run(log_path=None):
+    """Stop recording on this thread and return its records, appending them to log_path if given"""
+    global _tracing, _started_tracing
+    run = getattr(_local, 'run', None)
+    if run is None:
+        return []
+    _local.run = None
+    if run.trace_memory:
+        with _lock:
+            _tracing = False
+            if _started_tracing:
+                tracemalloc.stop()
+                _started_tracing = False
+
+    if log_path is not None and run.records:
+        with open(log_path, 'a', encoding='utf-8') as log:
+            for record in run.records:
+                log.write(json.dumps({'run': run.label, 'run_started': run.started, **record}) + '\n')
+    return run.records
+
+
+@contextmanager
+def _recording_span(run, name):
+    start_memory = 0
+    if run.trace_memory:
+        if run.peaks:
+            # The enclosing span keeps the peak reached before this one started
+            run.peaks[-1] = max(run.peaks[-1], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+    run.peaks.append(start_memory)
+    record = {'name': name, 'depth': len(run.peaks) - 1}
+    # Appended now so records come out in the order spans were entered
+    run.records.append(record)
+    start_wall = time.perf_counter()
+    start_cpu = time.thread_time()
+    try:
+        yield
+    finally:
+        record['wall_s'] = time.perf_counter() - start_wall
+        record['cpu_s'] = time.thread_time() - start_cpu
+        peak = run.peaks.pop()
+        record['peak_mib'] = None
+        if run.trace_memory:
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            record['peak_mib'] = (peak - start_memory) / 2**20
+            if run.peaks:
+                run.peaks[-1] = max(run.peaks[-1], peak)
+
+
+# Reusable no-op context for spans entered while nothing is being recorded
+_IDLE_SPAN = nullcontext()
+
+
+def span(name):
+    """Context manager recording the enclosed block as name when a run is active"""
+    run = getattr(_local, 'run', None)
+    if run is None:
+        return _IDLE_SPAN
+    return _recording_span(run, name)
+
+
+def profiled(func):
+    """Decorator recording every call of func as a span named after it"""
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        run = getattr(_local, 'run', None)
+        if run is None:
+            return func(*args, **kwargs)
+        with _recording_span(run, name):
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,129 @@
+"""Monte Carlo title odds from each driver's finishing-position distribution
+
+Every remaining race is drawn for a whole batch of seasons at once: each
+driver's result is resampled from the finishes they have had so far, the
+draws are ranked into a race order and mapped to points through
+POINTS_TABLE. Batches are grouped into fixed-size shards, each with its own
+seeded RNG stream, so the outcome for a given seed does not depend on how
+many worker processes run the shards.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from f1_engine.championship import Championship
+from f1_engine.data import build_driver_index, driver_positions, round_offsets
+from f1_engine.profiling import profiled
+
+# Points for finishing positions 1..10, zero for everyone else
+POINTS_TABLE = np.array([25, 18, 15, 12, 10, 8, 6, 4, 2, 1], dtype=np.float64)
+
+# Finishes without a classified position sort behind every finisher
+RETIRED = 1000.0
+
+SHARD_SIZE = 50_000
+BATCH_SIZE = 10_000
+
+
+def finishing_distributions(season_data, drivers, driver_index=None):
+    """(drivers x races) padded matrix of past finishes and the count per driver
+
+    Each driver's rows come from driver_index (see build_driver_index),
+    which must have been built from the same season rows; without one it is
+    built here in a single pass.
+    """
+    if driver_index is None:
+        driver_index = build_driver_index(season_data)
+    season = season_data['Season'].iloc[0]
+    positions = season_data['Position'].to_numpy(dtype=float, na_value=RETIRED)
+    finishes = [positions[driver_positions(driver_index, driver, season)] for driver in drivers]
+    counts = np.array([len(driver_finishes) for driver_finishes in finishes], dtype=np.int64)
+    samples = np.full((len(drivers), max(counts.max(initial=0), 1)), RETIRED)
+    for row, driver_finishes in enumerate(finishes):
+        samples[row, :len(driver_finishes)] = driver_finishes
+    return samples, counts
+
+
+def _points_lookup(grid_size):
+    """Points for race ranks 0..grid_size-1"""
+    lookup = np.zeros(grid_size)
+    lookup[:min(grid_size, len(POINTS_TABLE))] = POINTS_TABLE[:grid_size]
+    return lookup
+
+
+def simulate_batch(rng, samples, counts, current_points, remaining_rounds, n_seasons):
+    """Simulate n_seasons endings, returning final points as an (n_seasons x drivers) array"""
+    n_drivers = len(counts)
+    lookup = _points_lookup(n_drivers)
+
+    # Resample a past finish per driver, race and season, with a random tie-break
+    picks = (rng.random((n_seasons, remaining_rounds, n_drivers)) * counts).astype(np.int64)
+    draws = samples[np.arange(n_drivers), picks]
+    draws += rng.random(draws.shape)
+
+    # Rank drivers within each simulated race and score the ranks
+    order = np.argsort(draws, axis=2)
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(n_drivers), axis=2)
+    points = lookup[ranks]
+    points[draws >= RETIRED] = 0
+    return current_points + points.sum(axis=1)
+
+
+def _simulate_shard(seed_sequence, samples, counts, current_points, remaining_rounds, n_seasons):
+    """Title wins and summed final points for one shard"""
+    rng = np.random.default_rng(seed_sequence)
+    wins = np.zeros(len(counts), dtype=np.int64)
+    total_points = np.zeros(len(counts))
+    for start in range(0, n_seasons, BATCH_SIZE):
+        final = simulate_batch(rng, samples, counts, current_points, remaining_rounds,
+                               min(BATCH_SIZE, n_seasons - start))
+        # Ties for the title go to a random one of the tied drivers
+        champions = np.argmax(final + rng.random(final.shape) * 1e-3, axis=1)
+        wins += np.bincount(champions, minlength=len(counts))
+        total_points += final.sum(axis=0)
+    return wins, total_points
+
+
+@profiled
+def simulate_championship(season_data, remaining_rounds, n_seasons=100_000, seed=0, max_workers=None,
+                          driver_index=None, offsets=None):
+    """Title probability and expected final points for the drivers on the latest grid
+
+    season_data is one season's rows up to the latest round; driver_index
+    and offsets are optional prebuilt lookups over those rows. Returns a
+    frame indexed by driver, most likely champion first.
+    """
+    if offsets is None:
+        offsets = round_offsets(season_data)
+    last_round = offsets.iloc[-1]
+    drivers = pd.unique(season_data['Driver'].iloc[last_round['Start']:last_round['Stop']])
+
+    standings = Championship.from_season(season_data, offsets=offsets).standings()
+    current_points = standings.reindex(drivers).fillna(0).to_numpy()
+    samples, counts = finishing_distributions(season_data, drivers, driver_index)
+
+    shard_sizes = [min(SHARD_SIZE, n_seasons - start) for start in range(0, n_seasons, SHARD_SIZE)]
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(shard_sizes))
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(shard_sizes))
+
+    shard_args = [(seed_sequence, samples, counts, current_points, remaining_rounds, size)
+                  for seed_sequence, size in zip(seed_sequences, shard_sizes)]
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_simulate_shard, *zip(*shard_args)))
+    else:
+        results = [_simulate_shard(*args) for args in shard_args]
+
+    wins = sum(result[0] for result in results)
+    total_points = sum(result[1] for result in results)
+    odds = pd.DataFrame({
+        'Current Points': current_points,
+        'Expected Points': total_points / n_seasons,
+        'Title Probability': wins / n_seasons,
+    }, index=pd.Index(drivers, name='Driver'))
+    return odds.sort_values(['Title Probability', 'Expected Points'], ascending=False, kind='stable')
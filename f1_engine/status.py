@@ -0,0 +1,58 @@
+"""Result status of every entry, classified once at load
+
+`Status` is a categorical with one exclusive class per entry (see STATUSES).
+`StatusFlags` is a uint8 bitmask of the facts behind it, which can overlap:
+a driver who retired late in the race is both RETIRED and CLASSIFIED.
+Reliability views compare integer codes and bits instead of scanning the
+text columns again.
+"""
+import numpy as np
+import pandas as pd
+
+STATUSES = ['Finished', 'Lapped', 'DNF', 'DNS', 'DSQ', 'NC']
+STATUS_DTYPE = pd.CategoricalDtype(STATUSES, ordered=True)
+
+# StatusFlags bits
+CLASSIFIED = 1
+LAPPED = 2
+RETIRED = 4
+NOT_STARTED = 8
+DISQUALIFIED = 16
+NOT_CLASSIFIED = 32
+
+# Entries that did not finish the race, whatever the reason
+NON_FINISHES = ['DNF', 'DNS', 'DSQ', 'NC']
+
+
+def _normalized(values):
+    return values.astype('string').str.strip().str.upper().fillna('').to_numpy(dtype=object)
+
+
+def classify_status(df):
+    """Status categorical and StatusFlags bitmask for cleaned season rows"""
+    result = _normalized(df['Time/Retired'])
+    position = _normalized(df['Position_Original'])
+
+    flags = np.zeros(len(df), dtype=np.uint8)
+    flags[df['Position'].notna().to_numpy()] |= CLASSIFIED
+    flags[df['LapsDown'].to_numpy() > 0] |= LAPPED
+    flags[result == 'DNF'] |= RETIRED
+    flags[result == 'DNS'] |= NOT_STARTED
+    flags[np.isin(result, ['DSQ', 'DQ']) | np.isin(position, ['DSQ', 'DQ'])] |= DISQUALIFIED
+    flags[position == 'NC'] |= NOT_CLASSIFIED
+
+    # The first matching class wins, most serious first
+    codes = np.select(
+        [(flags & DISQUALIFIED) != 0, (flags & NOT_STARTED) != 0, (flags & RETIRED) != 0,
+         (flags & NOT_CLASSIFIED) != 0, (flags & LAPPED) != 0],
+        [STATUSES.index('DSQ'), STATUSES.index('DNS'), STATUSES.index('DNF'),
+         STATUSES.index('NC'), STATUSES.index('Lapped')],
+        default=STATUSES.index('Finished'),
+    )
+    status = pd.Categorical.from_codes(codes, dtype=STATUS_DTYPE)
+    return pd.DataFrame({'Status': status, 'StatusFlags': flags}, index=df.index)
+
+
+def has_flag(data, flag):
+    """Boolean array of rows whose StatusFlags include flag"""
+    return (data['StatusFlags'].to_numpy() & flag) != 0
@@ -0,0 +1,88 @@
+"""Numeric race and lap times parsed from the results text columns
+
+`Time/Retired` holds the winner's race time (`1:31:44.742`), gaps to the
+winner (`+22.457`, `+1:02.345`), lap deficits (`+1 lap`, `+2 laps`) or a
+status such as DNF. `Fastest Lap Time` holds lap times like `1:32.608`.
+Columns are factorized first and only the distinct strings go through
+Arrow's vectorized regex extraction, so there is no per-row Python.
+"""
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# [[hours:]minutes:]seconds[.fraction]
+CLOCK_PATTERN = r'(?:(?:(?P<hours>\d+):)?(?P<minutes>\d+):)?(?P<seconds>\d+(?:\.\d+)?)'
+RESULT_PATTERN = (r'^\s*(?:(?P<gap>\+)?' + CLOCK_PATTERN + r's?|\+(?P<laps>\d+)\s*laps?)\s*$')
+
+TIME_COLUMNS = ['RaceTimeSec', 'GapToWinnerSec', 'LapsDown', 'FastestLapSec']
+
+
+def _extract(values, pattern):
+    """Regex match of every distinct value, plus the codes mapping rows back to them"""
+    codes, uniques = pd.factorize(values)
+    matches = pc.extract_regex(pa.array(np.asarray(uniques, dtype=object), type=pa.string()), pattern)
+    return codes, matches
+
+
+def _group_text(matches, group):
+    """One group's text per distinct value, null where it did not take part in a match"""
+    text = matches.field(group)
+    return pc.if_else(pc.equal(text, ''), pa.scalar(None, pa.string()), text)
+
+
+def _to_rows(codes, values, missing):
+    # factorize marks missing values with -1, which picks the trailing `missing`
+    return np.append(values, missing)[codes]
+
+
+def _group_numbers(codes, matches, group):
+    """One group as float64 per row, NaN where absent"""
+    numbers = pc.cast(_group_text(matches, group), pa.float64()).to_numpy(zero_copy_only=False)
+    return _to_rows(codes, numbers, np.nan)
+
+
+def _group_present(codes, matches, group):
+    """Whether a group took part in each row's match"""
+    present = pc.is_valid(_group_text(matches, group)).to_numpy(zero_copy_only=False)
+    return _to_rows(codes, present, False)
+
+
+def _clock_seconds(codes, matches):
+    """Seconds from the hours/minutes/seconds groups, NaN where there was no time"""
+    hours = np.nan_to_num(_group_numbers(codes, matches, 'hours'))
+    minutes = np.nan_to_num(_group_numbers(codes, matches, 'minutes'))
+    return hours * 3600 + minutes * 60 + _group_numbers(codes, matches, 'seconds')
+
+
+def parse_lap_times(values):
+    """Lap time strings such as 1:32.608 as float64 seconds"""
+    return _clock_seconds(*_extract(values, r'^\s*' + CLOCK_PATTERN + r'\s*$'))
+
+
+def parse_race_times(df):
+    """RaceTimeSec, GapToWinnerSec, LapsDown and FastestLapSec for cleaned season rows
+
+    Rows must be in race order with a Round column (see clean_race_data);
+    the winner's time is spread over each round to turn gaps into race times.
+    """
+    codes, matches = _extract(df['Time/Retired'], RESULT_PATTERN)
+    clock = _clock_seconds(codes, matches)
+    is_gap = _group_present(codes, matches, 'gap')
+    laps_down = _group_numbers(codes, matches, 'laps')
+
+    # Winner time per round, taken from the one un-prefixed clock time
+    absolute = np.where(is_gap, np.nan, clock)
+    rounds = df['Round'].to_numpy()
+    winner_time = np.empty(0)
+    if len(df):
+        starts = np.flatnonzero(np.r_[True, rounds[1:] != rounds[:-1]])
+        winner_time = np.repeat(np.fmax.reduceat(absolute, starts), np.diff(np.r_[starts, len(df)]))
+
+    gap = np.where(is_gap, clock, np.where(np.isnan(absolute), np.nan, 0.0))
+    return pd.DataFrame({
+        'RaceTimeSec': winner_time + gap,
+        'GapToWinnerSec': gap,
+        'LapsDown': np.where(np.isnan(clock), laps_down, 0.0),
+        'FastestLapSec': parse_lap_times(df['Fastest Lap Time']),
+    }, index=df.index)
@@ -0,0 +1,94 @@
+"""Size-bounded LRU cache of rendered matplotlib figures"""
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+from f1_engine.profiling import span
+
+# Same savefig settings st.pyplot uses, so cached charts look identical
+SAVEFIG_OPTIONS = {'format': 'png', 'dpi': 200, 'bbox_inches': 'tight'}
+
+
+class FigureCache:
+    """Render figures once per key and keep the PNG bytes, evicting least recently used
+
+    With a `store` (a ResultCache), a key missing from memory is looked up
+    there before drawing and every new render is written to it, so charts
+    drawn by one dashboard process are served to the others.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, store=None):
+        self.max_bytes = max_bytes
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get_or_render(self, key, draw):
+        """Return cached PNG bytes for key, calling draw() for a new figure on a miss"""
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return image
+            self.misses += 1
+
+        if self.store is not None:
+            image = self.store.get(('figure', key))
+            if image is not None:
+                self._store(key, image)
+                return image
+
+        import matplotlib.pyplot as plt
+
+        # Draw outside the lock so one slow chart does not block every session
+        with span('draw'):
+            fig = draw()
+        try:
+            with span('savefig'):
+                buffer = BytesIO()
+                fig.savefig(buffer, **SAVEFIG_OPTIONS)
+                image = buffer.getvalue()
+        finally:
+            plt.close(fig)
+
+        self._store(key, image)
+        if self.store is not None:
+            self.store.put(('figure', key), image)
+        return image
+
+    def _store(self, key, image):
+        if len(image) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._size -= len(self._entries.pop(key))
+            self._entries[key] = image
+            self._size += len(image)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self):
+        """Hit/miss counters and current size, for sizing max_bytes"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+            }
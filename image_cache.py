@@ -0,0 +1,164 @@
+"""Local cache of driver photos, fetched concurrently and stored downscaled"""
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from io import BytesIO
+
+import requests
+from PIL import Image
+
+IMAGE_DIR = '.f1_images'
+DISPLAY_WIDTH = 120
+# Seconds a URL that failed to download is served as the placeholder before it is tried again
+RETRY_AFTER = 300
+PLACEHOLDER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'driver_placeholder.png')
+
+
+def requests_fetcher(url, timeout=10):
+    """Default fetcher - download raw image bytes over HTTP"""
+    response = requests.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.content
+
+
+def downscale(raw, width=DISPLAY_WIDTH):
+    """Resize an image to the card width, keeping its aspect ratio, as PNG bytes"""
+    with Image.open(BytesIO(raw)) as image:
+        image = image.convert('RGB')
+        if image.width > width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.LANCZOS)
+        output = BytesIO()
+        image.save(output, format='PNG', optimize=True)
+    return output.getvalue()
+
+
+class ImageCache:
+    """Content-addressed store of downscaled images keyed by their source URL
+
+    Files live in `folder` named by the SHA-256 of their bytes, with index.json
+    mapping each URL to its file. `fetcher(url) -> bytes` is swappable, so a
+    local HTTP server or an in-memory stub can stand in for the real CDN.
+    A URL that fails gets the placeholder for retry_after seconds and is
+    then downloaded again, so cards recover once the network is back.
+    """
+
+    def __init__(self, folder=IMAGE_DIR, fetcher=requests_fetcher, width=DISPLAY_WIDTH, max_workers=8,
+                 retry_after=RETRY_AFTER):
+        self.folder = folder
+        self.fetcher = fetcher
+        self.width = width
+        self.retry_after = retry_after
+        self._index_path = os.path.join(folder, 'index.json')
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='image-fetch')
+        self._lock = threading.Lock()
+        self._pending = {}
+        # URL -> time.monotonic() of its last failed download
+        self._failed = {}
+        self._memory = {}
+        self._index = self._read_index()
+
+        with open(PLACEHOLDER_PATH, 'rb') as placeholder_file:
+            self.placeholder = placeholder_file.read()
+
+    def _read_index(self):
+        try:
+            with open(self._index_path) as index_file:
+                return json.load(index_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self):
+        tmp_path = self._index_path + '.tmp'
+        with open(tmp_path, 'w') as index_file:
+            json.dump(self._index, index_file, indent=1)
+        os.replace(tmp_path, self._index_path)
+
+    def _load_local(self, url):
+        """Cached bytes for url, or None - forgetting an index entry whose file is gone so it is fetched again"""
+        image = self._memory.get(url)
+        if image is not None:
+            return image
+        digest = self._index.get(url)
+        if digest is None:
+            return None
+        try:
+            with open(os.path.join(self.folder, digest + '.png'), 'rb') as image_file:
+                image = image_file.read()
+        except OSError:
+            del self._index[url]
+            return None
+        self._memory[url] = image
+        return image
+
+    def _fetch(self, url):
+        try:
+            image = downscale(self.fetcher(url), self.width)
+        except Exception:
+            with self._lock:
+                self._failed[url] = time.monotonic()
+                self._pending.pop(url, None)
+            return None
+
+        digest = hashlib.sha256(image).hexdigest()
+        with self._lock:
+            try:
+                os.makedirs(self.folder, exist_ok=True)
+                path = os.path.join(self.folder, digest + '.png')
+                if not os.path.exists(path):
+                    with open(path + '.tmp', 'wb') as image_file:
+                        image_file.write(image)
+                    os.replace(path + '.tmp', path)
+                self._index[url] = digest
+                self._write_index()
+            except OSError:
+                pass
+            self._memory[url] = image
+            self._pending.pop(url, None)
+            self._failed.pop(url, None)
+        return image
+
+    def _backing_off(self, url):
+        """Whether url failed recently enough to skip, forgetting failures older than retry_after"""
+        failed_at = self._failed.get(url)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at < self.retry_after:
+            return True
+        del self._failed[url]
+        return False
+
+    def prefetch(self, urls):
+        """Start background downloads for any URLs not cached yet"""
+        with self._lock:
+            for url in urls:
+                if not url or url in self._pending or self._backing_off(url):
+                    continue
+                if self._load_local(url) is not None:
+                    continue
+                self._pending[url] = self._pool.submit(self._fetch, url)
+
+    def get(self, url, timeout=5):
+        """Image bytes for url, waiting up to timeout for a download, else the placeholder"""
+        if not url:
+            return self.placeholder
+
+        with self._lock:
+            image = self._load_local(url)
+            if image is not None:
+                return image
+            if self._backing_off(url):
+                return self.placeholder
+
+        self.prefetch([url])
+        with self._lock:
+            future = self._pending.get(url)
+        if future is None:
+            return self._load_local(url) or self.placeholder
+        try:
+            return future.result(timeout=timeout) or self.placeholder
+        except TimeoutError:
+            return self.placeholder
@@ -0,0 +1,188 @@
+"""Size-bounded LRU store of computed results on disk, shared by every dashboard process"""
+import glob
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+CACHE_DIR = os.environ.get('F1_CACHE_DIR', '.f1_cache')
+
+# Seconds a writer waits for another process's transaction before giving up
+BUSY_TIMEOUT = 30
+
+# A hit refreshes an entry's last-used time only when it is older than this many seconds
+TOUCH_INTERVAL = 60
+
+
+def source_fingerprint(paths):
+    """Content hash of source files, and of every .py file in any folder among paths
+
+    Part of the keys of anything cached on disk, so results and charts made
+    by other code - an older checkout, a deployment before an upgrade - are
+    never served.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        files = sorted(glob.glob(os.path.join(path, '*.py'))) if os.path.isdir(path) else [path]
+        for name in files:
+            with open(name, 'rb') as source_file:
+                digest.update(source_file.read())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Pickled results in one SQLite file, keyed by a hash of any picklable key
+
+    Several Streamlit processes can open the same folder: the database runs
+    in WAL mode so readers never block, and writes are short IMMEDIATE
+    transactions that wait for each other. A hit refreshes an entry's
+    last-used time at most once every TOUCH_INTERVAL seconds, so reads of
+    hot entries take no write lock, and a write that pushes the total past
+    max_bytes evicts the least recently used entries. A cache that cannot be
+    read or written, or an entry that no longer unpickles, behaves as a miss
+    rather than failing the page.
+    """
+
+    def __init__(self, folder=CACHE_DIR, max_bytes=256 * 1024 * 1024):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._path = os.path.join(folder, 'results.sqlite')
+        self._local = threading.local()
+        os.makedirs(folder, exist_ok=True)
+        # Closed straight away, so a cache created before forking workers leaves no open connection behind
+        try:
+            with closing(self._connect()) as connection:
+                connection.execute('PRAGMA journal_mode=WAL')
+                connection.execute(
+                    'CREATE TABLE IF NOT EXISTS results '
+                    '(key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)')
+                connection.execute('CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)')
+        except sqlite3.Error:
+            pass
+
+    def _connect(self):
+        return sqlite3.connect(self._path, timeout=BUSY_TIMEOUT, isolation_level=None)
+
+    def _connection(self):
+        # sqlite3 connections stay on the thread that opened them
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._connect()
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def digest(key):
+        return hashlib.sha256(pickle.dumps(key, protocol=4)).hexdigest()
+
+    def get(self, key):
+        """The stored result for key, or None"""
+        digest = self.digest(key)
+        try:
+            connection = self._connection()
+            row = connection.execute('SELECT value, last_used FROM results WHERE key = ?', (digest,)).fetchone()
+        except sqlite3.Error:
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+
+        try:
+            value = pickle.loads(row[0])
+        except Exception:
+            # Pickled by code that has changed since, e.g. a class that lost an attribute
+            self._delete(digest)
+            self.misses += 1
+            return None
+
+        if time.time() - row[1] > TOUCH_INTERVAL:
+            self._touch(connection, digest)
+        self.hits += 1
+        return value
+
+    @staticmethod
+    def _touch(connection, digest):
+        """Refresh an entry's last-used time, skipping it rather than waiting while another process writes"""
+        try:
+            connection.execute('PRAGMA busy_timeout = 0')
+            try:
+                connection.execute('UPDATE results SET last_used = ? WHERE key = ?', (time.time(), digest))
+            finally:
+                connection.execute(f'PRAGMA busy_timeout = {BUSY_TIMEOUT * 1000}')
+        except sqlite3.Error:
+            pass
+
+    def _delete(self, digest):
+        try:
+            self._connection().execute('DELETE FROM results WHERE key = ?', (digest,))
+        except sqlite3.Error:
+            pass
+
+    def put(self, key, value):
+        """Store value under key, evicting least recently used entries past max_bytes"""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_bytes:
+            return
+        try:
+            connection = self._connection()
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                connection.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)',
+                                   (self.digest(key), blob, len(blob), time.time()))
+                total = connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+                if total > self.max_bytes:
+                    self._evict(connection, total - self.max_bytes)
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+        except sqlite3.Error:
+            pass
+
+    @staticmethod
+    def _evict(connection, excess):
+        freed = 0
+        evicted = []
+        for digest, size in connection.execute('SELECT key, size FROM results ORDER BY last_used'):
+            if freed >= excess:
+                break
+            evicted.append((digest,))
+            freed += size
+        connection.executemany('DELETE FROM results WHERE key = ?', evicted)
+
+    def get_or_compute(self, key, compute):
+        """Stored result for key, calling compute() and storing its result on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        try:
+            self._connection().execute('DELETE FROM results')
+        except sqlite3.Error:
+            pass
+
+    def stats(self):
+        """Hit/miss counters of this process and the shared store's current size"""
+        try:
+            entries, size = self._connection().execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results').fetchone()
+        except sqlite3.Error:
+            entries, size = 0, 0
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': entries,
+            'bytes': size,
+            'max_bytes': self.max_bytes,
+        }
@@ -0,0 +1,11 @@
+"""Comparing result tables built from differently typed data, shared by the tests and benchmark scripts"""
+import pandas as pd
+
+
+def comparable(table):
+    """Table with a plain string index and float64 values, for comparing across schemas"""
+    table = table.copy()
+    table.index = pd.MultiIndex.from_arrays(
+        [table.index.get_level_values(level).astype(str) for level in range(table.index.nlevels)],
+        names=table.index.names)
+    return table.astype('float64').sort_index()
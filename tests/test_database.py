@@ -0,0 +1,40 @@
+"""The SQLite season database must agree with the pandas engine"""
+import os
+
+import pandas as pd
+import pytest
+
+from f1_engine import (build_season_database, driver_season_stats, load_seasons, season_list, select_season,
+                       team_season_stats, track_points)
+from tests.comparison import comparable
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope='module')
+def data():
+    return load_seasons(REPO_ROOT, max_workers=1)
+
+
+@pytest.fixture(scope='module')
+def database(tmp_path_factory):
+    return build_season_database(REPO_ROOT, str(tmp_path_factory.mktemp('database') / 'seasons.sqlite'))
+
+
+@pytest.mark.parametrize('key, season_stats', [('Driver', driver_season_stats), ('Team', team_season_stats)])
+def test_season_stats_match(data, database, key, season_stats):
+    pd.testing.assert_frame_equal(comparable(season_stats(data)), comparable(database.season_stats(key)), rtol=1e-6)
+
+
+def test_season_stats_for_some_seasons(data, database):
+    latest = season_list(data)[-1:]
+    expected = driver_season_stats(data[data['Season'].isin(latest)])
+    pd.testing.assert_frame_equal(comparable(expected), comparable(database.season_stats('Driver', latest)),
+                                  rtol=1e-6)
+
+
+def test_track_points_match(data, database):
+    for season in season_list(data):
+        pd.testing.assert_series_equal(track_points(select_season(data, season)).astype('float64'),
+                                       database.track_points(season), check_index_type=False, check_names=False,
+                                       rtol=1e-6)
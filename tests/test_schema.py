@@ -0,0 +1,40 @@
+"""The compact load schema must not change any aggregate built from the data"""
+import os
+
+import pandas as pd
+import pytest
+
+from f1_engine import (clean_race_data, combine_seasons, discover_season_files, driver_season_stats, load_seasons,
+                       season_list, select_season, team_season_stats, track_points)
+from tests.comparison import comparable
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope='module')
+def wide():
+    """The bundled seasons cleaned with pandas' default dtypes"""
+    frames = [clean_race_data(pd.read_csv(path).assign(Season=season), compact=False)
+              for season, path in discover_season_files(REPO_ROOT).items()]
+    return combine_seasons(frames)
+
+
+@pytest.fixture(scope='module')
+def compact():
+    return load_seasons(REPO_ROOT, use_store=False, max_workers=1)
+
+
+@pytest.mark.parametrize('season_stats', [driver_season_stats, team_season_stats])
+def test_season_stats_unchanged(wide, compact, season_stats):
+    pd.testing.assert_frame_equal(comparable(season_stats(wide)), comparable(season_stats(compact)), rtol=1e-6)
+
+
+def test_track_points_unchanged(wide, compact):
+    for season in season_list(compact):
+        pd.testing.assert_frame_equal(comparable(track_points(select_season(wide, season)).to_frame()),
+                                      comparable(track_points(select_season(compact, season)).to_frame()),
+                                      rtol=1e-6)
+
+
+def test_compact_schema_is_smaller(wide, compact):
+    assert compact.memory_usage(deep=True).sum() < wide.memory_usage(deep=True).sum()
@@ -0,0 +1,60 @@
+"""Serving local videos without loading a fresh copy on every render"""
+import mimetypes
+import os
+import threading
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Streamlit serves this folder at ./app/static/ when server.enableStaticServing
+# is on, with HTTP range support, so the browser streams the file itself.
+STATIC_DIR = os.path.join(APP_DIR, 'static')
+STATIC_URL = './app/static'
+
+_lock = threading.Lock()
+_sources = {}
+
+
+def static_url(path):
+    """URL the static file handler serves path at, or None if it is outside static/"""
+    full_path = os.path.abspath(path)
+    if os.path.commonpath([full_path, STATIC_DIR]) != STATIC_DIR:
+        return None
+    return STATIC_URL + '/' + os.path.relpath(full_path, STATIC_DIR).replace(os.sep, '/')
+
+
+def resolve_video(path):
+    """Find a video, preferring a copy under static/ so it can be streamed"""
+    for candidate in (os.path.join(STATIC_DIR, path), path):
+        if os.path.isfile(candidate):
+            return candidate
+    raise FileNotFoundError(path)
+
+
+def video_source(path, static_serving=False):
+    """Return (url, data, mimetype) for a local video, cached per file size and mtime
+
+    With static serving enabled and the file under static/, only a URL is
+    returned and no bytes are read. Otherwise the file is read once and the
+    same bytes object is handed to every session until the file changes.
+    """
+    resolved = resolve_video(path)
+    stat = os.stat(resolved)
+    key = (resolved, static_serving)
+    version = (stat.st_size, stat.st_mtime_ns)
+
+    # Held while reading so concurrent first renders share one read
+    with _lock:
+        cached = _sources.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        mimetype = mimetypes.guess_type(resolved)[0] or 'video/mp4'
+        url = static_url(resolved) if static_serving else None
+        data = None
+        if url is None:
+            with open(resolved, 'rb') as video_file:
+                data = video_file.read()
+
+        source = (url, data, mimetype)
+        _sources[key] = (version, source)
+    return source